@@ -1,127 +1,311 @@
 # Copyright (c) 2025 GenOrca (by zenoengine). All Rights Reserved.
 
 import unreal
-import json
-import traceback
+import math
+import os
+import time
+
+from . import frustum_utils
+
+# Tracebacks are only included in error responses when UE_MCP_DEBUG=1.
+_DEBUG = os.environ.get("UE_MCP_DEBUG") == "1"
+
+def _format_exc() -> str:
+    """Formats the active exception; traceback is imported only when an error is reported."""
+    import traceback
+    return traceback.format_exc()
+
+def _tb():
+    """Traceback for an error response, or None unless UE_MCP_DEBUG=1."""
+    return _format_exc() if _DEBUG else None
+
+def _mk_missing(name: str) -> dict:
+    """Builds the constant error response returned when a required parameter is missing."""
+    return {"success": False, "message": f"Required parameter '{name}' is missing."}
+
+# Missing-parameter responses are static, so they are built once at import and
+# serialized by the dispatcher like every other response dict. Actions return a
+# copy (dict(_ERR_...)), so a caller mutating a response can't alter later ones.
+_ERR_MISSING_ACTOR_LABEL = _mk_missing("actor_label")
+_ERR_MISSING_ACTOR_LABELS = _mk_missing("actor_labels")
+_ERR_MISSING_ASSET_OR_CLASS_PATH = _mk_missing("asset_or_class_path")
+_ERR_MISSING_ASSET_PATH = _mk_missing("asset_path")
+_ERR_MISSING_CLASS_PATH = _mk_missing("class_path")
+_ERR_MISSING_ITEMS = _mk_missing("items")
+_ERR_MISSING_LOCATION = _mk_missing("location")
+_ERR_MISSING_PROPERTY_NAME = _mk_missing("property_name")
+_ERR_MISSING_RAY_END = _mk_missing("ray_end")
+_ERR_MISSING_RAY_START = _mk_missing("ray_start")
+_ERR_MISSING_ROTATION = _mk_missing("rotation")
+_ERR_MISSING_SCALE = _mk_missing("scale")
 
 ACTOR_ACTIONS_MODULE = "actor_actions"
 
-# Helper function (consider if it should be private or utility)
+def _xyz(values, name: str) -> tuple:
+    """Validates a 3-element list parameter and returns it as a tuple of floats."""
+    try:
+        x, y, z = values
+        return (float(x), float(y), float(z))
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid {name} format. Expected list of 3 floats.") from None
+
+def _to_vector(values, name: str):
+    """Builds an unreal.Vector from a validated [x, y, z] list."""
+    return unreal.Vector(*_xyz(values, name))
+
+def _to_rotator(values, name: str = "rotation"):
+    """Builds an unreal.Rotator from a validated [pitch, yaw, roll] list."""
+    pitch, yaw, roll = _xyz(values, name)
+    return unreal.Rotator(roll, pitch, yaw)
+
+# Editor subsystem handles live as long as the editor, so each is fetched once and kept
+# in globals() across the dispatcher's per-call module reload.
+_actor_subsystem = globals().get("_actor_subsystem")
+_editor_subsystem = globals().get("_editor_subsystem")
+
+def _get_actor_subsystem():
+    """Returns the cached EditorActorSubsystem, fetching it on first use."""
+    global _actor_subsystem
+    if _actor_subsystem is None or not unreal.SystemLibrary.is_valid(_actor_subsystem):
+        _actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+    return _actor_subsystem
+
+def _get_editor_subsystem():
+    """Returns the cached UnrealEditorSubsystem, fetching it on first use."""
+    global _editor_subsystem
+    if _editor_subsystem is None or not unreal.SystemLibrary.is_valid(_editor_subsystem):
+        _editor_subsystem = unreal.get_editor_subsystem(unreal.UnrealEditorSubsystem)
+    return _editor_subsystem
+
+# Last get_all_level_actors() result, reused by back-to-back listing actions as
+# (actors, level generation, monotonic time). MCP spawns/deletes bump the generation;
+# the TTL bounds how long edits made by hand in the editor can go unseen, and a hit
+# holding an actor destroyed in the meantime rescans instead of returning it.
+_ACTORS_CACHE_TTL = 2.0
+_level_generation = globals().get("_level_generation", 0)
+_actors_cache = globals().get("_actors_cache", (None, -1, 0.0))
+
+def _get_all_actors(refresh: bool = False) -> list:
+    """Returns the level's actors, rescanning only when the cached list may be stale."""
+    global _actors_cache
+    actors, generation, stamp = _actors_cache
+    now = time.monotonic()
+    if (refresh or actors is None or generation != _level_generation or now - stamp > _ACTORS_CACHE_TTL
+            or not all(map(unreal.SystemLibrary.is_valid, actors))):
+        actors = list(_get_actor_subsystem().get_all_level_actors())
+        _actors_cache = (actors, _level_generation, now)
+    return actors
+
+def _bump_level_generation():
+    """Marks the cached actor list stale after an MCP action spawned or destroyed actors."""
+    global _level_generation
+    _level_generation += 1
+
+# {label: actor} from one get_all_level_actors() pass, or None until first needed.
+# Kept in globals() so it survives the dispatcher's per-call module reload; hits are
+# re-validated, misses trigger one rebuild, spawning actions add to it and deleting
+# actions drop it.
+_actor_label_index = globals().get("_actor_label_index")
+# Monotonic time of the last full rebuild. Within _ACTORS_CACHE_TTL of it, a label the
+# index has never seen is reported missing without another scan, so repeated lookups
+# of absent labels don't each walk the level.
+_actor_label_index_time = globals().get("_actor_label_index_time", 0.0)
+
+def _build_actor_label_index() -> dict:
+    """Scans the level once and caches the first actor found for each label."""
+    global _actor_label_index, _actor_label_index_time
+    index = {}
+    # Rebuilds happen on a lookup miss, so always rescan rather than trust the cached list.
+    for actor in _get_all_actors(refresh=True):
+        index.setdefault(actor.get_actor_label(), actor)
+    _actor_label_index = index
+    _actor_label_index_time = time.monotonic()
+    return index
+
+def _invalidate_actor_label_index():
+    """Drops the label index after actors were destroyed."""
+    global _actor_label_index
+    _actor_label_index = None
+    _bump_level_generation()
+
+def _remember_actors(actors):
+    """Adds freshly spawned actors to the label index instead of forcing a rescan."""
+    _bump_level_generation()
+    if _actor_label_index is not None:
+        for actor in actors:
+            if actor:
+                _actor_label_index.setdefault(actor.get_actor_label(), actor)
+
+def _actor_from_path(actor_path: str):
+    """
+    Resolves an actor object path (the "actor_path" handle returned by spawn actions)
+    with a direct object lookup. Returns None if it is not a live actor.
+    """
+    if not actor_path.startswith("/"):
+        return None
+    actor = unreal.find_object(None, actor_path)
+    if isinstance(actor, unreal.Actor) and unreal.SystemLibrary.is_valid(actor):
+        return actor
+    return None
+
+def _cached_actor(index, actor_label: str):
+    """Returns the indexed actor if it still exists and still has that label."""
+    actor = index.get(actor_label) if index is not None else None
+    if actor is not None and unreal.SystemLibrary.is_valid(actor) and actor.get_actor_label() == actor_label:
+        return actor
+    return None
+
+def _get_actors_by_labels(actor_labels) -> dict:
+    """
+    Resolves several labels with at most one level scan. Each entry may also be an
+    actor path handle, which is looked up directly. Returns {label: actor} for the
+    labels that were found.
+    """
+    found = {}
+    missing = []
+    for label in actor_labels:
+        actor = _cached_actor(_actor_label_index, label) or _actor_from_path(label)
+        if actor is not None:
+            found[label] = actor
+        else:
+            missing.append(label)
+    if missing:
+        index = _actor_label_index
+        # A stale entry (renamed or deleted actor) still forces a rescan.
+        if (index is not None and time.monotonic() - _actor_label_index_time <= _ACTORS_CACHE_TTL
+                and not any(label in index for label in missing)):
+            return found
+        index = _build_actor_label_index()
+        for label in missing:
+            actor = index.get(label)
+            if actor is not None:
+                found[label] = actor
+    return found
+
 def _get_actor_by_label(actor_label: str):
     """
-    Helper function to find an actor by its label.
+    Helper function to find an actor by its label (or actor path handle).
     Returns the actor or None if not found.
     """
-    subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
-    all_actors = subsystem.get_all_level_actors()
-    for actor in all_actors:
-        if actor.get_actor_label() == actor_label:
-            return actor
-    return None
+    return _get_actors_by_labels((actor_label,)).get(actor_label)
+
+def _actors_to_ignore(actor_labels) -> list:
+    """Resolves a trace's actors_to_ignore labels together, deduplicated, with at most one level scan."""
+    if not actor_labels:
+        return []
+    return list(_get_actors_by_labels(dict.fromkeys(actor_labels)).values())
 
-def ue_spawn_from_object(asset_path: str = None, location: list = None) -> str:
+def ue_spawn_from_object(asset_path: str = None, location: list = None) -> dict:
     """
     Spawns an actor from the specified asset path at the given location.
     Wrapped in a ScopedEditorTransaction.
 
     :param asset_path: Path to the asset in the Content Browser
     :param location: [x, y, z] coordinates for the actor spawn position
-    :return: JSON string indicating success or failure and actor label if spawned
+    :return: Response dict indicating success or failure and actor label if spawned
     """
     if asset_path is None:
-        return json.dumps({"success": False, "message": "Required parameter 'asset_path' is missing."})
+        return dict(_ERR_MISSING_ASSET_PATH)
     if location is None:
-        return json.dumps({"success": False, "message": "Required parameter 'location' is missing."})
+        return dict(_ERR_MISSING_LOCATION)
 
     transaction_description = "MCP: Spawn Actor from Object"
-    asset_data = unreal.EditorAssetLibrary.find_asset_data(asset_path)
-    if not asset_data:
-        return json.dumps({"success": False, "message": f"Asset not found: {asset_path}"})
+    # Reject malformed input before paying for an asset-registry query.
+    try:
+        vec = _to_vector(location, "location")
+    except ValueError as ve:
+        return {"success": False, "message": str(ve)}
 
-    if len(location) != 3:
-        return json.dumps({"success": False, "message": "Invalid location format. Expected list of 3 floats."})
+    # find_asset_data returns an AssetData struct even for missing assets, so check is_valid().
+    asset_data = unreal.EditorAssetLibrary.find_asset_data(asset_path)
+    if not asset_data or not asset_data.is_valid():
+        return {"success": False, "message": f"Asset not found: {asset_path}"}
 
     try:
         with unreal.ScopedEditorTransaction(transaction_description) as trans:
-            vec = unreal.Vector(float(location[0]), float(location[1]), float(location[2]))
-            asset = unreal.EditorAssetLibrary.load_asset(asset_path)
+            # Load through the registry entry already in hand instead of resolving the path again.
+            asset = asset_data.get_asset()
             if not asset:
-                 return json.dumps({"success": False, "message": f"Failed to load asset: {asset_path}"})
+                 return {"success": False, "message": f"Failed to load asset: {asset_path}"}
 
-            actor = unreal.get_editor_subsystem(unreal.EditorActorSubsystem).spawn_actor_from_object(
+            actor = _get_actor_subsystem().spawn_actor_from_object(
                 asset, vec
             )
             if actor:
-                return json.dumps({"success": True, "actor_label": actor.get_actor_label(), "actor_path": actor.get_path_name()})
+                _remember_actors((actor,))
+                return {"success": True, "actor_label": actor.get_actor_label(), "actor_path": actor.get_path_name()}
             else:
-                return json.dumps({"success": False, "message": "Failed to spawn actor. spawn_actor_from_object returned None."})
+                return {"success": False, "message": "Failed to spawn actor. spawn_actor_from_object returned None."}
     except Exception as e:
-        return json.dumps({"success": False, "message": f"Error during spawn: {str(e)}", "type": e.__name__, "traceback": traceback.format_exc()})
+        return {"success": False, "message": f"Error during spawn: {str(e)}", "type": type(e).__name__, "traceback": _tb()}
 
-def ue_duplicate_selected(offset: list) -> str:
+def ue_duplicate_selected(offset: list) -> dict:
     """
     Duplicates all selected actors in the editor and applies a position offset to each duplicate.
 
     :param offset: [x, y, z] offset to apply to each duplicated actor.
-    :return: JSON string indicating success or failure and details of duplicated actors.
+    :return: Response dict indicating success or failure and details of duplicated actors.
     """
-    if len(offset) != 3:
-        return json.dumps({"success": False, "message": "Invalid offset format. Expected list of 3 floats."})
+    try:
+        offset_vector = _to_vector(offset, "offset")
+    except ValueError as ve:
+        return {"success": False, "message": str(ve)}
 
     try:
-        subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+        subsystem = _get_actor_subsystem()
         selected_actors = subsystem.get_selected_level_actors()
         if not selected_actors:
-            return json.dumps({"success": False, "message": "No actors selected."})
+            return {"success": False, "message": "No actors selected."}
 
-        duplicated_actors = []
-        for actor in selected_actors:
-            offset_vector = unreal.Vector(float(offset[0]), float(offset[1]), float(offset[2]))
-            duplicated_actor = subsystem.duplicate_actor(actor, offset=offset_vector)
-            if duplicated_actor:
-                duplicated_actors.append(duplicated_actor.get_actor_label())
+        # One call duplicates the whole selection and applies the offset on the C++ side.
+        new_actors = subsystem.duplicate_actors(selected_actors, offset=offset_vector)
+        _remember_actors(new_actors)
+        new_actors = [actor for actor in new_actors if actor]
+        duplicated_actors = [actor.get_actor_label() for actor in new_actors]
 
-        return json.dumps({
+        return {
             "success": True,
             "message": f"Duplicated {len(duplicated_actors)} actors with offset {offset}.",
-            "duplicated_actors": duplicated_actors
-        })
+            "duplicated_actors": duplicated_actors,
+            "duplicated_actor_paths": [actor.get_path_name() for actor in new_actors]
+        }
     except Exception as e:
-        return json.dumps({"success": False, "message": f"Error during duplication: {e}"})
+        return {"success": False, "message": f"Error during duplication: {e}"}
 
-def ue_select_all() -> str:
+def ue_select_all() -> dict:
     """
     Selects all actors in the current level.
     """
     try:
-        subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+        subsystem = _get_actor_subsystem()
         subsystem.select_all(unreal.EditorLevelLibrary.get_editor_world())
-        return json.dumps({"success": True, "message": "All actors selected."})
+        return {"success": True, "message": "All actors selected."}
     except Exception as e:
-        return json.dumps({"success": False, "message": f"Error during selection: {e}"})
+        return {"success": False, "message": f"Error during selection: {e}"}
 
-def ue_invert_selection() -> str:
+def ue_invert_selection() -> dict:
     """
     Inverts the selection of actors in the current level.
     """
     try:
-        subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+        subsystem = _get_actor_subsystem()
         subsystem.invert_selection(unreal.EditorLevelLibrary.get_editor_world())
-        return json.dumps({"success": True, "message": "Actor selection inverted."})
+        return {"success": True, "message": "Actor selection inverted."}
     except Exception as e:
-        return json.dumps({"success": False, "message": f"Error during selection inversion: {e}"})
+        return {"success": False, "message": f"Error during selection inversion: {e}"}
 
-def ue_delete_by_label(actor_label: str) -> str:
+def ue_delete_by_label(actor_label: str) -> dict:
     """
     Deletes an actor with the specified name from the current level.
 
     :param actor_label: Name of the actor to delete.
-    :return: JSON string indicating success or failure.
+    :return: Response dict indicating success or failure.
     """
     try:
-        subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
-        all_actors = subsystem.get_all_level_actors()
+        subsystem = _get_actor_subsystem()
+        all_actors = _get_all_actors(refresh=True)
         deleted_actors = []
+        _invalidate_actor_label_index()
 
         for actor in all_actors:
             if actor.get_actor_label() == actor_label:
@@ -129,39 +313,71 @@ def ue_delete_by_label(actor_label: str) -> str:
                     deleted_actors.append(actor_label)
 
         if deleted_actors:
-            return json.dumps({
+            return {
                 "success": True,
                 "message": f"Deleted actors: {deleted_actors}",
                 "deleted_actors": deleted_actors
-            })
+            }
         else:
-            return json.dumps({"success": False, "message": f"No actor found with name: {actor_label}"})
+            return {"success": False, "message": f"No actor found with name: {actor_label}"}
     except Exception as e:
-        return json.dumps({"success": False, "message": f"Error during actor deletion: {e}"})
+        return {"success": False, "message": f"Error during actor deletion: {e}"}
 
-def ue_list_all_with_locations() -> str:
+def ue_delete_by_labels(actor_labels: list = None) -> dict:
     """
-    Lists all actors in the current level along with their world locations.
+    Deletes every actor whose label is in actor_labels, using one level scan and one
+    ScopedEditorTransaction.
 
-    :return: JSON string containing actor names and locations.
+    :param actor_labels: Labels of the actors to delete.
+    :return: Response dict listing deleted and not-found labels.
     """
+    if actor_labels is None:
+        return dict(_ERR_MISSING_ACTOR_LABELS)
+
     try:
-        subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
-        all_actors = subsystem.get_all_level_actors()
-        actor_data = []
+        wanted = set(actor_labels)
+        subsystem = _get_actor_subsystem()
+        to_delete = []
+        deleted_labels = []
+        for actor in _get_all_actors(refresh=True):
+            label = actor.get_actor_label()
+            if label in wanted:
+                to_delete.append(actor)
+                deleted_labels.append(label)
+
+        _invalidate_actor_label_index()
+        if to_delete:
+            with unreal.ScopedEditorTransaction(f"MCP: Batch Delete Actors ({len(to_delete)})") as trans:
+                subsystem.destroy_actors(to_delete)
+
+        deleted = set(deleted_labels)
+        not_found = [label for label in actor_labels if label not in deleted]
+        return {
+            "success": not not_found,
+            "message": f"Deleted {len(deleted_labels)} actors." + (f" Not found: {not_found}" if not_found else ""),
+            "deleted_actors": deleted_labels,
+            "not_found": not_found
+        }
+    except Exception as e:
+        return {"success": False, "message": f"Error during batch actor deletion: {str(e)}", "traceback": _tb()}
 
-        for actor in all_actors:
-            location = actor.get_actor_location()
-            actor_data.append({
-                "name": actor.get_actor_label(),
-                "location": [location.x, location.y, location.z]
-            })
+def ue_list_all_with_locations() -> dict:
+    """
+    Lists all actors in the current level along with their world locations.
+
+    :return: Response dict containing actor names and locations.
+    """
+    try:
+        actor_data = [
+            {"name": actor.get_actor_label(), "location": actor.get_actor_location().to_tuple()}
+            for actor in _get_all_actors()
+        ]
 
-        return json.dumps({"success": True, "actors": actor_data})
+        return {"success": True, "actors": actor_data}
     except Exception as e:
-        return json.dumps({"success": False, "message": f"Error during actor listing: {str(e)}", "type": e.__name__, "traceback": traceback.format_exc()})
+        return {"success": False, "message": f"Error during actor listing: {str(e)}", "type": type(e).__name__, "traceback": _tb()}
 
-def ue_spawn_from_class(class_path: str = None, location: list = None, rotation: list = None) -> str:
+def ue_spawn_from_class(class_path: str = None, location: list = None, rotation: list = None) -> dict:
     """
     Spawns an actor from the specified class path at the given location and rotation
     using unreal.EditorLevelLibrary.spawn_actor_from_class.
@@ -170,31 +386,29 @@ def ue_spawn_from_class(class_path: str = None, location: list = None, rotation:
     :param class_path: Path to the actor class (e.g., "/Game/Blueprints/MyActorBP.MyActorBP_C" or "/Script/Engine.StaticMeshActor").
     :param location: [x, y, z] coordinates for the actor spawn position.
     :param rotation: Optional [pitch, yaw, roll] for the actor spawn rotation. Defaults to [0.0, 0.0, 0.0].
-    :return: JSON string indicating success or failure and actor label/path if spawned.
+    :return: Response dict indicating success or failure and actor label/path if spawned.
     """
     if class_path is None:
-        return json.dumps({"success": False, "message": "Required parameter 'class_path' is missing."})
+        return dict(_ERR_MISSING_CLASS_PATH)
     if location is None:
-        return json.dumps({"success": False, "message": "Required parameter 'location' is missing."})
+        return dict(_ERR_MISSING_LOCATION)
 
     transaction_description = "MCP: Spawn Actor from Class (EditorLevelLibrary)"
     if rotation is None:
         rotation = [0.0, 0.0, 0.0]
 
-    if len(location) != 3:
-        return json.dumps({"success": False, "message": "Invalid location format. Expected list of 3 floats."})
-    if len(rotation) != 3:
-        return json.dumps({"success": False, "message": "Invalid rotation format. Expected list of 3 floats."})
+    try:
+        vec_location = _to_vector(location, "location")
+        rot_rotation = _to_rotator(rotation)
+    except ValueError as ve:
+        return {"success": False, "message": str(ve)}
 
     try:
         with unreal.ScopedEditorTransaction(transaction_description) as trans:
             actor_class = unreal.load_class(None, class_path)
             
             if not actor_class:
-                return json.dumps({"success": False, "message": f"Failed to load actor class from path: {class_path}. Ensure it's a valid class path (e.g., with _C for Blueprints or /Script/ for native classes)."})
-
-            vec_location = unreal.Vector(float(location[0]), float(location[1]), float(location[2]))
-            rot_rotation = unreal.Rotator(float(rotation[2]), float(rotation[0]), float(rotation[1]))
+                return {"success": False, "message": f"Failed to load actor class from path: {class_path}. Ensure it's a valid class path (e.g., with _C for Blueprints or /Script/ for native classes)."}
 
             actor = unreal.EditorLevelLibrary.spawn_actor_from_class(
                 actor_class,
@@ -203,127 +417,259 @@ def ue_spawn_from_class(class_path: str = None, location: list = None, rotation:
             )
 
             if actor:
-                return json.dumps({
+                _remember_actors((actor,))
+                return {
                     "success": True, 
                     "actor_label": actor.get_actor_label(), 
                     "actor_path": actor.get_path_name()
-                })
+                }
             else:
-                return json.dumps({"success": False, "message": "Failed to spawn actor using EditorLevelLibrary.spawn_actor_from_class. The function returned None."})
+                return {"success": False, "message": "Failed to spawn actor using EditorLevelLibrary.spawn_actor_from_class. The function returned None."}
+    except Exception as e:
+        return {"success": False, "message": f"Error during spawn_actor_from_class (EditorLevelLibrary): {str(e)}", "type": type(e).__name__, "traceback": _tb()}
+
+def ue_spawn_many_from_class(items: list = None) -> dict:
+    """
+    Spawns many actors in a single ScopedEditorTransaction. Each distinct class path is
+    loaded once.
+
+    :param items: List of {"class_path", "location": [x, y, z], "rotation"?: [pitch, yaw, roll]}.
+    :return: Response dict with a result entry (actor label/path or error) per item.
+    """
+    if items is None:
+        return dict(_ERR_MISSING_ITEMS)
+
+    results = []
+    classes = {}
+    try:
+        with unreal.ScopedEditorTransaction(f"MCP: Batch Spawn Actors ({len(items)})") as trans:
+            for item in items:
+                class_path = item.get("class_path")
+                try:
+                    spawn_location = _to_vector(item.get("location"), "location")
+                    spawn_rotation = _to_rotator(item.get("rotation") or [0.0, 0.0, 0.0])
+                    if class_path not in classes:
+                        classes[class_path] = unreal.load_class(None, class_path)
+                    actor_class = classes[class_path]
+                    if not actor_class:
+                        raise ValueError(f"Failed to load actor class from path: {class_path}")
+
+                    actor = unreal.EditorLevelLibrary.spawn_actor_from_class(
+                        actor_class,
+                        spawn_location,
+                        spawn_rotation
+                    )
+                    if not actor:
+                        raise RuntimeError("spawn_actor_from_class returned None.")
+                    _remember_actors((actor,))
+                    results.append({"class_path": class_path, "success": True, "actor_label": actor.get_actor_label(), "actor_path": actor.get_path_name()})
+                except Exception as e:
+                    results.append({"class_path": class_path, "success": False, "message": str(e)})
+
+        failed = sum(1 for r in results if not r["success"])
+        return {
+            "success": failed == 0,
+            "message": f"Spawned {len(results) - failed} of {len(results)} actors.",
+            "results": results
+        }
     except Exception as e:
-        return json.dumps({"success": False, "message": f"Error during spawn_actor_from_class (EditorLevelLibrary): {str(e)}", "type": e.__name__, "traceback": traceback.format_exc()})
+        return {"success": False, "message": f"Error during batch spawn: {str(e)}", "results": results, "traceback": _tb()}
+
+# Accessor for a StaticMeshActor's component, resolved once instead of probed per actor.
+_SM_COMPONENT_GETTER = getattr(unreal.StaticMeshActor, 'get_static_mesh_component', None)
+
+def _static_mesh_path(actor):
+    """Returns the static mesh asset path of a StaticMeshActor, or None if it has none."""
+    sm_component = _SM_COMPONENT_GETTER(actor) if _SM_COMPONENT_GETTER else actor.static_mesh_component
+    if sm_component:
+        static_mesh = sm_component.static_mesh
+        if static_mesh:
+            return static_mesh.get_path_name()
+    return None
 
-def ue_get_all_details() -> str:
+def _actor_detail(actor) -> dict:
+    """Builds the ue_get_all_details entry for one actor; vectors stay tuples, which encode as JSON arrays."""
+    rot = actor.get_actor_rotation()
+    bounds_origin, bounds_extent = actor.get_actor_bounds(False)
+    extent = bounds_extent.to_tuple()
+
+    detail = {
+        "label": actor.get_actor_label(),
+        "class": actor.get_class().get_path_name(),
+        "location": actor.get_actor_location().to_tuple(),
+        "rotation": (rot.pitch, rot.yaw, rot.roll),
+        "world_bounds_origin": bounds_origin.to_tuple(),
+        "world_bounds_extent": extent,
+        "world_dimensions": (extent[0] * 2, extent[1] * 2, extent[2] * 2)
+    }
+
+    if isinstance(actor, unreal.StaticMeshActor):
+        mesh_path = _static_mesh_path(actor)
+        if mesh_path:
+            detail["static_mesh_asset_path"] = mesh_path
+
+    return detail
+
+def ue_get_all_details() -> dict:
     """
     Lists all actors in the current level with detailed information including
     label, class, location, rotation, and world-space bounding box.
 
-    :return: JSON string containing a list of actor details.
+    :return: Response dict containing a list of actor details.
     """
     try:
-        subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
-        all_actors = subsystem.get_all_level_actors()
-        actors_details = []
+        actors_details = [_actor_detail(actor) for actor in _get_all_actors()]
 
-        for actor in all_actors:
-            loc = actor.get_actor_location()
-            rot = actor.get_actor_rotation()
-            
-            bounds_origin, bounds_extent = actor.get_actor_bounds(False)
+        return {"success": True, "actors": actors_details}
+    except Exception as e:
+        return {"success": False, "message": f"Error listing all actors details: {str(e)}", "type": type(e).__name__, "traceback": _tb()}
 
-            detail = {
-                "label": actor.get_actor_label(),
-                "class": actor.get_class().get_path_name(),
-                "location": [loc.x, loc.y, loc.z],
-                "rotation": [rot.pitch, rot.yaw, rot.roll],
-                "world_bounds_origin": [bounds_origin.x, bounds_origin.y, bounds_origin.z],
-                "world_bounds_extent": [bounds_extent.x, bounds_extent.y, bounds_extent.z],
-                "world_dimensions": [bounds_extent.x * 2, bounds_extent.y * 2, bounds_extent.z * 2]
-            }
-            
-            if isinstance(actor, unreal.StaticMeshActor):
-                sm_component = actor.static_mesh_component
-                if hasattr(actor, 'get_static_mesh_component'):
-                    sm_component = actor.get_static_mesh_component()
+def _build_transform(location=None, rotation=None, scale=None) -> tuple:
+    """
+    Validates whichever of location/rotation ([pitch, yaw, roll])/scale are given and
+    returns them as (Vector|None, Rotator|None, Vector|None). Raises ValueError.
+    """
+    return (
+        _to_vector(location, "location") if location is not None else None,
+        _to_rotator(rotation) if rotation is not None else None,
+        _to_vector(scale, "scale") if scale is not None else None,
+    )
+
+def _write_transform(actor, new_location=None, new_rotation=None, new_scale=None) -> list:
+    """Applies already-built transform parts to the actor. Returns the modified property names."""
+    modified_properties = []
+    if new_location is not None:
+        actor.set_actor_location(new_location, False, False) # bSweep, bTeleport
+        modified_properties.append("location")
+    if new_rotation is not None:
+        actor.set_actor_rotation(new_rotation, False) # bTeleport
+        modified_properties.append("rotation")
+    if new_scale is not None:
+        actor.set_actor_scale3d(new_scale)
+        modified_properties.append("scale")
+    return modified_properties
+
+def _set_actor_transform(actor_label: str, new_location=None, new_rotation=None, new_scale=None) -> dict:
+    """
+    Resolves the actor once and applies validated transform parts in a
+    ScopedEditorTransaction. Shared by ue_set_transform and its single-property shims.
+    """
+    transaction_description = f"MCP: Set Transform for actor {actor_label}"
+    try:
+        actor_to_modify = _get_actor_by_label(actor_label)
+        if not actor_to_modify:
+            return {"success": False, "message": f"Actor with label \'{actor_label}\' not found."}
 
-                if sm_component and sm_component.static_mesh:
-                    detail["static_mesh_asset_path"] = sm_component.static_mesh.get_path_name()
+        with unreal.ScopedEditorTransaction(transaction_description) as trans:
+            modified_properties = _write_transform(actor_to_modify, new_location, new_rotation, new_scale)
+            
+            if not modified_properties:
+                return {"success": True, "message": f"No transform properties provided for actor \'{actor_label}\'. Actor was not modified."}
 
-            actors_details.append(detail)
+            return {"success": True, "message": f"Actor \'{actor_label}\' transform updated for: {', '.join(modified_properties)}."}
 
-        return json.dumps({"success": True, "actors": actors_details})
     except Exception as e:
-        return json.dumps({"success": False, "message": f"Error listing all actors details: {str(e)}", "type": e.__name__, "traceback": traceback.format_exc()})
+        return {"success": False, "message": f"Error setting transform for actor \'{actor_label}\': {str(e)}", "type": type(e).__name__, "traceback": _tb()}
 
-def ue_set_transform(actor_label: str = None, location: list = None, rotation: list = None, scale: list = None) -> str:
+def ue_set_transform(actor_label: str = None, location: list = None, rotation: list = None, scale: list = None) -> dict:
     """
     Sets the transform (location, rotation, scale) of a specified actor.
     Any component of the transform not provided will remain unchanged.
     This operation is wrapped in a ScopedEditorTransaction.
     """
     if actor_label is None:
-        return json.dumps({"success": False, "message": "Required parameter 'actor_label' is missing."})
-
-    transaction_description = f"MCP: Set Transform for actor {actor_label}"
+        return dict(_ERR_MISSING_ACTOR_LABEL)
     try:
-        actor_to_modify = _get_actor_by_label(actor_label)
-        if not actor_to_modify:
-            return json.dumps({"success": False, "message": f"Actor with label \'{actor_label}\' not found."})
+        parts = _build_transform(location, rotation, scale)
+    except ValueError as ve:
+        return {"success": False, "message": str(ve)}
+    return _set_actor_transform(actor_label, *parts)
 
-        with unreal.ScopedEditorTransaction(transaction_description) as trans:
-            modified_properties = []
-            if location is not None:
-                if len(location) == 3:
-                    new_loc = unreal.Vector(float(location[0]), float(location[1]), float(location[2]))
-                    actor_to_modify.set_actor_location(new_loc, False, False) # bSweep, bTeleport
-                    modified_properties.append("location")
-                else:
-                    return json.dumps({"success": False, "message": "Invalid location format. Expected list of 3 floats."})
-
-            if rotation is not None:
-                if len(rotation) == 3:
-                    new_rot = unreal.Rotator(float(rotation[2]), float(rotation[0]), float(rotation[1]))
-                    actor_to_modify.set_actor_rotation(new_rot, False) # bTeleport
-                    modified_properties.append("rotation")
-                else:
-                    return json.dumps({"success": False, "message": "Invalid rotation format. Expected list of 3 floats."})
-
-            if scale is not None:
-                if len(scale) == 3:
-                    new_scale = unreal.Vector(float(scale[0]), float(scale[1]), float(scale[2]))
-                    actor_to_modify.set_actor_scale3d(new_scale)
-                    modified_properties.append("scale")
-                else:
-                    return json.dumps({"success": False, "message": "Invalid scale format. Expected list of 3 floats."})
-            
-            if not modified_properties:
-                return json.dumps({"success": True, "message": f"No transform properties provided for actor \'{actor_label}\'. Actor was not modified."})
+def ue_set_transforms(items: list = None) -> dict:
+    """
+    Sets the transforms of many actors in a single ScopedEditorTransaction, resolving
+    all labels with at most one level scan.
 
-            return json.dumps({"success": True, "message": f"Actor \'{actor_label}\' transform updated for: {', '.join(modified_properties)}."})
+    :param items: List of {"actor_label", "location"?, "rotation"?, "scale"?}; rotation is [pitch, yaw, roll].
+    :return: Response dict with a result entry per item.
+    """
+    if items is None:
+        return dict(_ERR_MISSING_ITEMS)
 
+    results = []
+    try:
+        actors = _get_actors_by_labels([item.get("actor_label") for item in items if item.get("actor_label") is not None])
+
+        with unreal.ScopedEditorTransaction(f"MCP: Batch Set Transforms ({len(items)})") as trans:
+            for item in items:
+                label = item.get("actor_label")
+                actor = actors.get(label)
+                if actor is None:
+                    results.append({"actor_label": label, "success": False, "message": f"Actor with label '{label}' not found."})
+                    continue
+                try:
+                    modified = _write_transform(actor, *_build_transform(item.get("location"), item.get("rotation"), item.get("scale")))
+                    results.append({"actor_label": label, "success": True, "modified": modified})
+                except Exception as e:
+                    results.append({"actor_label": label, "success": False, "message": str(e)})
+
+        failed = sum(1 for r in results if not r["success"])
+        return {
+            "success": failed == 0,
+            "message": f"Updated {len(results) - failed} of {len(results)} actors.",
+            "results": results
+        }
     except Exception as e:
-        return json.dumps({"success": False, "message": f"Error setting transform for actor \'{actor_label}\': {str(e)}", "type": e.__name__, "traceback": traceback.format_exc()})
+        return {"success": False, "message": f"Error during batch transform: {str(e)}", "results": results, "traceback": _tb()}
 
-def ue_set_location(actor_label: str = None, location: list = None) -> str:
+def ue_set_location(actor_label: str = None, location: list = None) -> dict:
     if actor_label is None:
-        return json.dumps({"success": False, "message": "Required parameter 'actor_label' is missing."})
+        return dict(_ERR_MISSING_ACTOR_LABEL)
     if location is None:
-        return json.dumps({"success": False, "message": "Required parameter 'location' is missing."})
-    return ue_set_transform(actor_label=actor_label, location=location)
+        return dict(_ERR_MISSING_LOCATION)
+    try:
+        value = _to_vector(location, "location")
+    except ValueError as ve:
+        return {"success": False, "message": str(ve)}
+    return _set_actor_transform(actor_label, new_location=value)
 
-def ue_set_rotation(actor_label: str = None, rotation: list = None) -> str:
+def ue_set_rotation(actor_label: str = None, rotation: list = None) -> dict:
     if actor_label is None:
-        return json.dumps({"success": False, "message": "Required parameter 'actor_label' is missing."})
+        return dict(_ERR_MISSING_ACTOR_LABEL)
     if rotation is None:
-        return json.dumps({"success": False, "message": "Required parameter 'rotation' is missing."})
-    return ue_set_transform(actor_label=actor_label, rotation=rotation)
+        return dict(_ERR_MISSING_ROTATION)
+    try:
+        value = _to_rotator(rotation)
+    except ValueError as ve:
+        return {"success": False, "message": str(ve)}
+    return _set_actor_transform(actor_label, new_rotation=value)
 
-def ue_set_scale(actor_label: str = None, scale: list = None) -> str:
+def ue_set_scale(actor_label: str = None, scale: list = None) -> dict:
     if actor_label is None:
-        return json.dumps({"success": False, "message": "Required parameter 'actor_label' is missing."})
+        return dict(_ERR_MISSING_ACTOR_LABEL)
     if scale is None:
-        return json.dumps({"success": False, "message": "Required parameter 'scale' is missing."})
-    return ue_set_transform(actor_label=actor_label, scale=scale)
+        return dict(_ERR_MISSING_SCALE)
+    try:
+        value = _to_vector(scale, "scale")
+    except ValueError as ve:
+        return {"success": False, "message": str(ve)}
+    return _set_actor_transform(actor_label, new_scale=value)
+
+# Trace enums resolved once per module load rather than on every trace.
+_TRACE_VISIBILITY = unreal.TraceTypeQuery.TRACE_TYPE_QUERY1
+_TRACE_CAMERA = unreal.TraceTypeQuery.TRACE_TYPE_QUERY2
+_DRAW_FOR_DURATION = unreal.DrawDebugTrace.FOR_DURATION
+_DRAW_NONE = unreal.DrawDebugTrace.NONE
+
+# Positions of the fields read from HitResult.to_tuple().
+_HIT_BLOCKING_HIT = 0
+_HIT_DISTANCE = 3
+_HIT_LOCATION = 4
+_HIT_IMPACT_POINT = 5
+_HIT_NORMAL = 6
+_HIT_IMPACT_NORMAL = 7
+_HIT_ACTOR = 9
+_HIT_BONE_NAME = 11
 
 def ue_line_trace(
     ray_start: list = None,
@@ -331,7 +677,7 @@ def ue_line_trace(
     trace_channel: str = 'Visibility',
     actors_to_ignore_labels: list = None,
     trace_complex: bool = True
-) -> str:
+) -> dict:
     """
     Performs a line trace (raycast) and returns hit information without spawning anything.
 
@@ -340,30 +686,24 @@ def ue_line_trace(
     :param trace_channel: 'Visibility' or 'Camera'. Defaults to 'Visibility'.
     :param actors_to_ignore_labels: Optional list of actor labels to ignore.
     :param trace_complex: Whether to use complex collision. Defaults to True.
-    :return: JSON string with hit details.
+    :return: Response dict with hit details.
     """
     if ray_start is None:
-        return json.dumps({"success": False, "message": "Required parameter 'ray_start' is missing."})
+        return dict(_ERR_MISSING_RAY_START)
     if ray_end is None:
-        return json.dumps({"success": False, "message": "Required parameter 'ray_end' is missing."})
+        return dict(_ERR_MISSING_RAY_END)
 
-    if len(ray_start) != 3 or len(ray_end) != 3:
-        return json.dumps({"success": False, "message": "Invalid vector format. Expected lists of 3 floats."})
+    try:
+        start_loc = _to_vector(ray_start, "ray_start")
+        end_loc = _to_vector(ray_end, "ray_end")
+    except ValueError as ve:
+        return {"success": False, "message": str(ve)}
 
     try:
-        start_loc = unreal.Vector(float(ray_start[0]), float(ray_start[1]), float(ray_start[2]))
-        end_loc = unreal.Vector(float(ray_end[0]), float(ray_end[1]), float(ray_end[2]))
 
-        actors_to_ignore_objects = []
-        if actors_to_ignore_labels:
-            for label in actors_to_ignore_labels:
-                actor = _get_actor_by_label(label)
-                if actor:
-                    actors_to_ignore_objects.append(actor)
+        actors_to_ignore_objects = _actors_to_ignore(actors_to_ignore_labels)
 
-        trace_type_query = unreal.TraceTypeQuery.TRACE_TYPE_QUERY1
-        if trace_channel.lower() == 'camera':
-            trace_type_query = unreal.TraceTypeQuery.TRACE_TYPE_QUERY2
+        trace_type_query = _TRACE_CAMERA if trace_channel.lower() == 'camera' else _TRACE_VISIBILITY
 
         hit_result = unreal.SystemLibrary.line_trace_single(
             world_context_object=unreal.EditorLevelLibrary.get_editor_world(),
@@ -372,36 +712,25 @@ def ue_line_trace(
             trace_channel=trace_type_query,
             trace_complex=trace_complex,
             actors_to_ignore=actors_to_ignore_objects,
-            draw_debug_type=unreal.DrawDebugTrace.FOR_DURATION,
+            draw_debug_type=_DRAW_FOR_DURATION,
             ignore_self=True
         )
 
         if not hit_result:
-            return json.dumps({"success": True, "hit": False, "message": "Raycast did not hit any surface."})
-
-        (
-            blocking_hit,
-            initial_overlap,
-            time,
-            distance,
-            location,
-            impact_point,
-            normal,
-            impact_normal,
-            phys_mat,
-            hit_actor,
-            hit_component,
-            hit_bone_name,
-            bone_name,
-            hit_item,
-            element_index,
-            face_index,
-            trace_start,
-            trace_end
-        ) = hit_result.to_tuple()
+            return {"success": True, "hit": False, "message": "Raycast did not hit any surface."}
 
-        if not blocking_hit:
-            return json.dumps({"success": True, "hit": False, "message": "Raycast did not hit any blocking surface."})
+        # HitResult fields are protected in Python, so to_tuple() is the only read path;
+        # only the fields reported below are picked out of it.
+        hit_fields = hit_result.to_tuple()
+        if not hit_fields[_HIT_BLOCKING_HIT]:
+            return {"success": True, "hit": False, "message": "Raycast did not hit any blocking surface."}
+
+        location = hit_fields[_HIT_LOCATION]
+        impact_point = hit_fields[_HIT_IMPACT_POINT]
+        normal = hit_fields[_HIT_NORMAL]
+        impact_normal = hit_fields[_HIT_IMPACT_NORMAL]
+        hit_actor = hit_fields[_HIT_ACTOR]
+        hit_bone_name = hit_fields[_HIT_BONE_NAME]
 
         result = {
             "success": True,
@@ -410,14 +739,14 @@ def ue_line_trace(
             "impact_point": [impact_point.x, impact_point.y, impact_point.z],
             "normal": [normal.x, normal.y, normal.z],
             "impact_normal": [impact_normal.x, impact_normal.y, impact_normal.z],
-            "distance": distance,
+            "distance": hit_fields[_HIT_DISTANCE],
             "hit_actor_label": hit_actor.get_actor_label() if hit_actor else None,
             "hit_bone_name": str(hit_bone_name) if hit_bone_name and str(hit_bone_name) != "None" else None,
         }
-        return json.dumps(result)
+        return result
 
     except Exception as e:
-        return json.dumps({"success": False, "message": f"Error during line_trace: {str(e)}", "traceback": traceback.format_exc()})
+        return {"success": False, "message": f"Error during line_trace: {str(e)}", "traceback": _tb()}
 
 def ue_spawn_on_surface_raycast(
     asset_or_class_path: str = None,
@@ -427,14 +756,15 @@ def ue_spawn_on_surface_raycast(
     desired_rotation: list = None,
     location_offset: list = None, # New parameter
     trace_channel: str = 'Visibility',
-    actors_to_ignore_labels: list = None
-) -> str:
+    actors_to_ignore_labels: list = None,
+    draw_debug: bool = False
+) -> dict:
     if asset_or_class_path is None:
-        return json.dumps({"success": False, "message": "Required parameter 'asset_or_class_path' is missing."})
+        return dict(_ERR_MISSING_ASSET_OR_CLASS_PATH)
     if ray_start is None:
-        return json.dumps({"success": False, "message": "Required parameter 'ray_start' is missing."})
+        return dict(_ERR_MISSING_RAY_START)
     if ray_end is None:
-        return json.dumps({"success": False, "message": "Required parameter 'ray_end' is missing."})
+        return dict(_ERR_MISSING_RAY_END)
 
     transaction_description = f"MCP: Spawn Actor on Surface via Raycast ({asset_or_class_path})"
 
@@ -443,23 +773,18 @@ def ue_spawn_on_surface_raycast(
     if location_offset is None: # Default offset
         location_offset = [0.0, 0.0, 0.0]
 
-    if len(ray_start) != 3 or len(ray_end) != 3 or len(desired_rotation) != 3 or len(location_offset) != 3:
-        return json.dumps({"success": False, "message": "Invalid vector/rotator/offset format. Expected lists of 3 floats."})
+    try:
+        start_loc = _to_vector(ray_start, "ray_start")
+        end_loc = _to_vector(ray_end, "ray_end")
+        offset_vec = _to_vector(location_offset, "location_offset")
+        spawn_rotation_final = _to_rotator(desired_rotation, "desired_rotation")
+    except ValueError as ve:
+        return {"success": False, "message": str(ve)}
 
     try:
-        start_loc = unreal.Vector(float(ray_start[0]), float(ray_start[1]), float(ray_start[2]))
-        end_loc = unreal.Vector(float(ray_end[0]), float(ray_end[1]), float(ray_end[2]))
-        
-        actors_to_ignore_objects = []
-        if actors_to_ignore_labels:
-            for label in actors_to_ignore_labels:
-                actor = _get_actor_by_label(label)
-                if actor:
-                    actors_to_ignore_objects.append(actor)
-        
-        trace_type_query = unreal.TraceTypeQuery.TRACE_TYPE_QUERY1
-        if trace_channel.lower() == 'camera':
-            trace_type_query = unreal.TraceTypeQuery.TRACE_TYPE_QUERY2
+        actors_to_ignore_objects = _actors_to_ignore(actors_to_ignore_labels)
+
+        trace_type_query = _TRACE_CAMERA if trace_channel.lower() == 'camera' else _TRACE_VISIBILITY
 
         hit_result = unreal.SystemLibrary.line_trace_single(
             world_context_object=unreal.EditorLevelLibrary.get_editor_world(),
@@ -468,72 +793,52 @@ def ue_spawn_on_surface_raycast(
             trace_channel=trace_type_query, 
             trace_complex=True,
             actors_to_ignore=actors_to_ignore_objects,
-            draw_debug_type=unreal.DrawDebugTrace.FOR_DURATION,
+            # Debug lines allocate a primitive per trace, so they are opt-in here.
+            draw_debug_type=_DRAW_FOR_DURATION if draw_debug else _DRAW_NONE,
             ignore_self=True
         )
 
         if not hit_result:
-            return json.dumps({"success": False, "message": "Raycast did not hit any surface."})
-
-        (
-            blocking_hit,
-            initial_overlap,
-            time,
-            distance,
-            location,
-            impact_point,
-            normal,
-            impact_normal,
-            phys_mat,
-            hit_actor,
-            hit_component,
-            hit_bone_name,
-            bone_name,
-            hit_item,
-            element_index,
-            face_index,
-            trace_start,
-            trace_end
-        ) = hit_result.to_tuple()
+            return {"success": False, "message": "Raycast did not hit any surface."}
+
+        # HitResult fields are protected in Python, so to_tuple() is the only read path;
+        # only blocking_hit and location are needed here.
+        hit_fields = hit_result.to_tuple()
+        blocking_hit = hit_fields[_HIT_BLOCKING_HIT]
+        location = hit_fields[_HIT_LOCATION]
         
         if not blocking_hit:
-            return json.dumps({"success": False, "message": "Raycast did not hit any blocking surface."})
+            return {"success": False, "message": "Raycast did not hit any blocking surface."}
 
-        spawn_location = location
-        # Apply location offset
-        spawn_location.x += float(location_offset[0])
-        spawn_location.y += float(location_offset[1])
-        spawn_location.z += float(location_offset[2])
-
-        # Apply rotation final
-        spawn_rotation_final = unreal.Rotator(float(desired_rotation[2]), float(desired_rotation[0]), float(desired_rotation[1]))
+        spawn_location = location + offset_vec
 
         with unreal.ScopedEditorTransaction(transaction_description) as trans:
             actor_spawned = None
             if is_class_path:
                 actor_class = unreal.load_class(None, asset_or_class_path)
                 if not actor_class:
-                    return json.dumps({"success": False, "message": f"Failed to load actor class: {asset_or_class_path}"})
+                    return {"success": False, "message": f"Failed to load actor class: {asset_or_class_path}"}
                 actor_spawned = unreal.EditorLevelLibrary.spawn_actor_from_class(actor_class, spawn_location, spawn_rotation_final)
             else:
                 asset = unreal.EditorAssetLibrary.load_asset(asset_or_class_path)
                 if not asset:
-                    return json.dumps({"success": False, "message": f"Failed to load asset: {asset_or_class_path}"})
-                actor_spawned = unreal.get_editor_subsystem(unreal.EditorActorSubsystem).spawn_actor_from_object(asset, spawn_location)
+                    return {"success": False, "message": f"Failed to load asset: {asset_or_class_path}"}
+                actor_spawned = _get_actor_subsystem().spawn_actor_from_object(asset, spawn_location)
 
             if actor_spawned:
-                return json.dumps({
+                _remember_actors((actor_spawned,))
+                return {
                     "success": True, 
                     "actor_label": actor_spawned.get_actor_label(), 
                     "actor_path": actor_spawned.get_path_name(),
-                    "location": [spawn_location.x, spawn_location.y, spawn_location.z],
+                    "location": list(spawn_location.to_tuple()),
                     "rotation": [spawn_rotation_final.pitch, spawn_rotation_final.yaw, spawn_rotation_final.roll],
-                })
+                }
             else:
-                return json.dumps({"success": False, "message": "Failed to spawn actor after raycast hit."})
+                return {"success": False, "message": "Failed to spawn actor after raycast hit."}
 
     except Exception as e:
-        return json.dumps({"success": False, "message": f"Error during spawn_actor_on_surface_with_raycast: {str(e)}", "traceback": traceback.format_exc()})
+        return {"success": False, "message": f"Error during spawn_actor_on_surface_with_raycast: {str(e)}", "traceback": _tb()}
 
 def _serialize_ue_value(value):
     """Convert an Unreal Engine value to a JSON-safe Python type."""
@@ -555,11 +860,10 @@ def _serialize_ue_value(value):
 def _convert_value_for_property(current_value, new_value):
     """Convert a JSON value to the appropriate Unreal type based on the current property value's type."""
     if isinstance(current_value, unreal.Vector):
-        if isinstance(new_value, (list, tuple)) and len(new_value) == 3:
-            return unreal.Vector(float(new_value[0]), float(new_value[1]), float(new_value[2]))
+        return _to_vector(new_value, "value")
     elif isinstance(current_value, unreal.Rotator):
-        if isinstance(new_value, (list, tuple)) and len(new_value) == 3:
-            return unreal.Rotator(float(new_value[0]), float(new_value[1]), float(new_value[2]))
+        # [pitch, yaw, roll], the order _serialize_ue_value reports rotators in.
+        return _to_rotator(new_value, "value")
     elif isinstance(current_value, unreal.LinearColor):
         if isinstance(new_value, (list, tuple)) and len(new_value) == 4:
             return unreal.LinearColor(float(new_value[0]), float(new_value[1]), float(new_value[2]), float(new_value[3]))
@@ -576,23 +880,23 @@ def _convert_value_for_property(current_value, new_value):
     # Fallback: return as-is and let UE attempt conversion
     return new_value
 
-def ue_get_property(actor_label: str = None, property_name: str = None) -> str:
+def ue_get_property(actor_label: str = None, property_name: str = None) -> dict:
     """
     Gets a property value from an actor using get_editor_property().
 
     :param actor_label: Label of the actor to query.
     :param property_name: UE property name to get.
-    :return: JSON string with the property value.
+    :return: Response dict with the property value.
     """
     if actor_label is None:
-        return json.dumps({"success": False, "message": "Required parameter 'actor_label' is missing."})
+        return dict(_ERR_MISSING_ACTOR_LABEL)
     if property_name is None:
-        return json.dumps({"success": False, "message": "Required parameter 'property_name' is missing."})
+        return dict(_ERR_MISSING_PROPERTY_NAME)
 
     try:
         actor = _get_actor_by_label(actor_label)
         if not actor:
-            return json.dumps({"success": False, "message": f"Actor with label '{actor_label}' not found."})
+            return {"success": False, "message": f"Actor with label '{actor_label}' not found."}
 
         value = actor.get_editor_property(property_name)
         serialized = _serialize_ue_value(value)
@@ -602,11 +906,11 @@ def ue_get_property(actor_label: str = None, property_name: str = None) -> str:
         if not isinstance(value, (type(None), bool, int, float, str)) and isinstance(serialized, str):
             if not isinstance(value, (unreal.Vector, unreal.Rotator, unreal.LinearColor, unreal.Name, unreal.Text)):
                 result["value_type"] = type(value).__name__
-        return json.dumps(result)
+        return result
     except Exception as e:
-        return json.dumps({"success": False, "message": f"Error getting property '{property_name}' on actor '{actor_label}': {str(e)}", "type": type(e).__name__, "traceback": traceback.format_exc()})
+        return {"success": False, "message": f"Error getting property '{property_name}' on actor '{actor_label}': {str(e)}", "type": type(e).__name__, "traceback": _tb()}
 
-def ue_set_property(actor_label: str = None, property_name: str = None, value=None) -> str:
+def ue_set_property(actor_label: str = None, property_name: str = None, value=None) -> dict:
     """
     Sets a property value on an actor using set_editor_property().
     Wrapped in a ScopedEditorTransaction for Undo support.
@@ -614,18 +918,18 @@ def ue_set_property(actor_label: str = None, property_name: str = None, value=No
     :param actor_label: Label of the actor to modify.
     :param property_name: UE property name to set.
     :param value: The value to set (str, int, float, bool, list, or None).
-    :return: JSON string indicating success or failure.
+    :return: Response dict indicating success or failure.
     """
     if actor_label is None:
-        return json.dumps({"success": False, "message": "Required parameter 'actor_label' is missing."})
+        return dict(_ERR_MISSING_ACTOR_LABEL)
     if property_name is None:
-        return json.dumps({"success": False, "message": "Required parameter 'property_name' is missing."})
+        return dict(_ERR_MISSING_PROPERTY_NAME)
 
     transaction_description = f"MCP: Set Property '{property_name}' on actor '{actor_label}'"
     try:
         actor = _get_actor_by_label(actor_label)
         if not actor:
-            return json.dumps({"success": False, "message": f"Actor with label '{actor_label}' not found."})
+            return {"success": False, "message": f"Actor with label '{actor_label}' not found."}
 
         # Try to read current value to determine the target type
         try:
@@ -638,11 +942,11 @@ def ue_set_property(actor_label: str = None, property_name: str = None, value=No
         with unreal.ScopedEditorTransaction(transaction_description) as trans:
             actor.set_editor_property(property_name, converted_value)
 
-        return json.dumps({"success": True, "message": f"Property '{property_name}' set on actor '{actor_label}'."})
+        return {"success": True, "message": f"Property '{property_name}' set on actor '{actor_label}'."}
     except Exception as e:
-        return json.dumps({"success": False, "message": f"Error setting property '{property_name}' on actor '{actor_label}': {str(e)}", "type": type(e).__name__, "traceback": traceback.format_exc()})
+        return {"success": False, "message": f"Error setting property '{property_name}' on actor '{actor_label}': {str(e)}", "type": type(e).__name__, "traceback": _tb()}
 
-def ue_get_in_view_frustum() -> str:
+def ue_get_in_view_frustum() -> dict:
     """
     Retrieves a list of actors that are potentially visible within the active editor viewport's frustum.
 
@@ -654,7 +958,7 @@ def ue_get_in_view_frustum() -> str:
       through the subsystem directly. This means actors visible in the horizontal periphery of a wide viewport
       or very close/far might be misclassified.
 
-    :return: JSON string containing a list of potentially visible actor details or an error message.
+    :return: Response dict containing a list of potentially visible actor details or an error message.
     """
     try:
         cam_loc = None
@@ -667,81 +971,62 @@ def ue_get_in_view_frustum() -> str:
 
         # Get core camera info using UnrealEditorSubsystem
         try:
-            editor_subsystem = unreal.get_editor_subsystem(unreal.UnrealEditorSubsystem)
+            editor_subsystem = _get_editor_subsystem()
             if not editor_subsystem:
-                return json.dumps({"success": False, "message": "Failed to get UnrealEditorSubsystem."})
+                return {"success": False, "message": "Failed to get UnrealEditorSubsystem."}
             
             camera_info = editor_subsystem.get_level_viewport_camera_info()
             if camera_info:
                 cam_loc, cam_rot = camera_info
             else:
-                return json.dumps({"success": False, "message": "Failed to obtain camera info from UnrealEditorSubsystem."})
+                return {"success": False, "message": "Failed to obtain camera info from UnrealEditorSubsystem."}
 
         except Exception as e:
-            return json.dumps({"success": False, "message": f"Failed to obtain essential camera info from UnrealEditorSubsystem: {e}"})
+            return {"success": False, "message": f"Failed to obtain essential camera info from UnrealEditorSubsystem: {e}"}
 
         if cam_loc is None or cam_rot is None:
-            return json.dumps({"success": False, "message": "Failed to obtain essential camera location and rotation from UnrealEditorSubsystem."})
+            return {"success": False, "message": "Failed to obtain essential camera location and rotation from UnrealEditorSubsystem."}
 
-        actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
-        all_actors = actor_subsystem.get_all_level_actors()
+        all_actors = [actor for actor in _get_all_actors() if actor]
         visible_actors_details = []
 
-        cam_forward_vec = cam_rot.get_forward_vector()
-        v_fov_rad = unreal.MathLibrary.degrees_to_radians(v_fov_degrees)
-
+        # One get_actor_bounds() call per actor; the culling math itself runs in frustum_utils.
+        origins = []
+        extents = []
         for actor in all_actors:
-            if not actor: continue
-
+            # Convert straight to tuples so the two Vector proxies are released per actor.
             bounds_origin, bounds_extent = actor.get_actor_bounds(False)
-            actor_bounding_radius = bounds_extent.length()
-            
-            vec_to_actor_center = bounds_origin - cam_loc
-            dist_to_actor_center = vec_to_actor_center.length()
-
-            sphere_closest_to_cam = dist_to_actor_center - actor_bounding_radius
-            sphere_farthest_from_cam = dist_to_actor_center + actor_bounding_radius
+            origins.append(bounds_origin.to_tuple())
+            extents.append(bounds_extent.to_tuple())
+
+        # Bounding-sphere radii are derived from the extents inside the (vectorized) cull.
+        mask = frustum_utils.cull_spheres(
+            origins, extents,
+            cam_loc.to_tuple(), cam_rot.get_forward_vector().to_tuple(),
+            math.radians(v_fov_degrees) / 2.0, near_plane, far_plane
+        )
 
-            if sphere_farthest_from_cam < near_plane or sphere_closest_to_cam > far_plane:
+        for actor, origin, extent, visible in zip(all_actors, origins, extents, mask):
+            if not visible:
                 continue
 
-            if dist_to_actor_center <= actor_bounding_radius:
-                pass
-            elif dist_to_actor_center > 0:
-                vec_to_actor_center_normalized = vec_to_actor_center.normal()
-                dot_product = cam_forward_vec.dot(vec_to_actor_center_normalized)
-                dot_product_clamped = unreal.MathLibrary.clamp(dot_product, -1.0, 1.0)
-                angle_to_actor_center_rad = unreal.MathLibrary.acos(dot_product_clamped)
-
-                if dist_to_actor_center > actor_bounding_radius:
-                    asin_arg = unreal.MathLibrary.clamp(actor_bounding_radius / dist_to_actor_center, -1.0, 1.0)
-                    angular_radius_of_sphere_rad = unreal.MathLibrary.asin(asin_arg)
-                else:
-                    angular_radius_of_sphere_rad = unreal.MathLibrary.PI
-
-                if angle_to_actor_center_rad > (v_fov_rad / 2.0) + angular_radius_of_sphere_rad:
-                    continue
-            else:
-                pass
-
-            loc = actor.get_actor_location()
             rot = actor.get_actor_rotation()
             actor_details_dict = {
                 "label": actor.get_actor_label(),
                 "class": actor.get_class().get_path_name(),
-                "location": [loc.x, loc.y, loc.z],
+                "location": list(actor.get_actor_location().to_tuple()),
                 "rotation": [rot.pitch, rot.yaw, rot.roll],
-                "world_bounds_origin": [bounds_origin.x, bounds_origin.y, bounds_origin.z],
-                "world_bounds_extent": [bounds_extent.x, bounds_extent.y, bounds_extent.z]
+                "world_bounds_origin": list(origin),
+                "world_bounds_extent": list(extent)
             }
             if isinstance(actor, unreal.StaticMeshActor):
-                sm_component = actor.static_mesh_component
-                if sm_component and sm_component.static_mesh:
-                    actor_details_dict["static_mesh_asset_path"] = sm_component.static_mesh.get_path_name()
+                mesh_path = _static_mesh_path(actor)
+                if mesh_path:
+                    actor_details_dict["static_mesh_asset_path"] = mesh_path
             
             visible_actors_details.append(actor_details_dict)
 
-        return json.dumps({"success": True, "visible_actors": visible_actors_details})
+        return {"success": True, "visible_actors": visible_actors_details}
 
     except Exception as e:
-        return json.dumps({"success": False, "message": f"Error in ue_get_in_view_frustum: {str(e)}", "type": type(e).__name__})
+        return {"success": False, "message": f"Error in ue_get_in_view_frustum: {str(e)}", "type": type(e).__name__}
@@ -1,65 +1,94 @@
 # Copyright (c) 2025 GenOrca. All Rights Reserved.
 
 import unreal
-import json
+import os
+import time
 import traceback
 
+# Tracebacks are only included in error responses when UE_MCP_DEBUG=1.
+_DEBUG = os.environ.get("UE_MCP_DEBUG") == "1"
+
 ASSET_ACTIONS_MODULE = "asset_actions"
 
-def ue_find_by_query(name : str = None, asset_type : str = None) -> str:
+# The asset registry lives as long as the editor, so it is fetched once and kept
+# in globals() across the dispatcher's module reloads.
+_asset_registry = globals().get("_asset_registry")
+
+def _get_asset_registry():
+    """Returns the cached AssetRegistry, fetching it on first use."""
+    global _asset_registry
+    if _asset_registry is None or not unreal.SystemLibrary.is_valid(_asset_registry):
+        _asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
+    return _asset_registry
+
+def _asset_data_class_name(asset_data) -> str:
+    """Class name recorded in the asset registry (asset_class_path on UE 5.1+, asset_class before)."""
+    class_path = getattr(asset_data, 'asset_class_path', None)
+    if class_path is not None:
+        return str(class_path.asset_name)
+    return str(getattr(asset_data, 'asset_class', None) or "")
+
+# Every /Game asset as (path, lowercase path, lowercase class name), with the monotonic
+# time it was read, so back-to-back queries filter in memory instead of re-reading the
+# registry. The TTL bounds how long an asset created since can go unseen; a query that
+# matches nothing against a cached index rescans once before reporting no results.
+_ASSET_INDEX_TTL = 2.0
+_asset_index = globals().get("_asset_index", (None, 0.0))
+
+def _get_game_asset_index(refresh: bool = False) -> list:
+    """Returns the cached /Game asset rows, querying the asset registry only when stale."""
+    global _asset_index
+    rows, stamp = _asset_index
+    now = time.monotonic()
+    if refresh or rows is None or now - stamp > _ASSET_INDEX_TTL:
+        # One registry query returns every asset's data (class included), instead of a
+        # find_asset_data call per path listed by EditorAssetLibrary.list_assets.
+        asset_filter = unreal.ARFilter(package_paths=['/Game'], recursive_paths=True)
+        rows = []
+        for asset_data in _get_asset_registry().get_assets(asset_filter):
+            asset_path = f"{asset_data.package_name}.{asset_data.asset_name}"
+            rows.append((asset_path, asset_path.lower(), _asset_data_class_name(asset_data).lower()))
+        _asset_index = (rows, now)
+    return rows
+
+def _match_assets(rows, needle, wanted_type) -> list:
+    # If the type can't be determined (empty class name), it can't match a specified type
+    return [path for path, lower_path, lower_class in rows
+            if (wanted_type is None or lower_class == wanted_type)
+            and (needle is None or needle in lower_path)]
+
+def ue_find_by_query(name : str = None, asset_type : str = None) -> dict:
     """
-    Returns a JSON list of asset paths under '/Game' matching the given query dict.
+    Returns a response dict listing the asset paths under '/Game' matching the query.
     Supported keys: 'name' (substring match), 'asset_type' (Unreal class name, e.g. 'StaticMesh')
     At least one of name or asset_type must be provided.
     """
     if name is None and asset_type is None: # This check is specific to this function's logic
-        return json.dumps({"success": False, "message": "At least one of 'name' or 'asset_type' must be provided for ue_find_by_query.", "assets": []})
+        return {"success": False, "message": "At least one of 'name' or 'asset_type' must be provided for ue_find_by_query.", "assets": []}
 
-    assets = unreal.EditorAssetLibrary.list_assets('/Game', recursive=True)
-    matches = []
-    for asset_path in assets:
-        asset_data = unreal.EditorAssetLibrary.find_asset_data(asset_path)
-        
-        current_asset_type_str = ""
-        if hasattr(asset_data, 'asset_class_str') and asset_data.asset_class_str:
-            current_asset_type_str = str(asset_data.asset_class_str)
-        elif hasattr(asset_data, 'asset_class') and asset_data.asset_class:
-            current_asset_type_str = str(asset_data.asset_class)
-        else:
-            # Fallback if asset class information is not directly available or named differently
-            # This might happen with certain asset types or engine versions
-            # unreal.log_warning(f"Could not determine asset class for {asset_path}")
-            pass # Continue checking name if type is indeterminable but name is specified
-
-        name_match = True
-        if name is not None:
-            name_match = name.lower() in asset_path.lower()
-
-        type_match = True
-        if asset_type is not None:
-            if not current_asset_type_str: # If type couldn't be determined, it can't match a specified type
-                type_match = False
-            else:
-                type_match = asset_type.lower() == current_asset_type_str.lower()
-
-        if name_match and type_match:
-            matches.append(asset_path)
-            
-    return json.dumps({"success": True, "assets": matches, "message": f"{len(matches)} assets found matching query."})
-
-def ue_get_static_mesh_details(asset_path: str = None) -> str:
+    needle = name.lower() if name is not None else None
+    wanted_type = asset_type.lower() if asset_type is not None else None
+
+    stamp = _asset_index[1]
+    matches = _match_assets(_get_game_asset_index(), needle, wanted_type)
+    if not matches and _asset_index[1] == stamp:
+        matches = _match_assets(_get_game_asset_index(refresh=True), needle, wanted_type)
+
+    return {"success": True, "assets": matches, "message": f"{len(matches)} assets found matching query."}
+
+def ue_get_static_mesh_details(asset_path: str = None) -> dict:
     """
     Retrieves the bounding box and dimensions of a static mesh asset.
 
     :param asset_path: Path to the static mesh asset (e.g., "/Game/Meshes/MyCube.MyCube").
-    :return: JSON string with asset details including bounding box and dimensions.
+    :return: Response dict with asset details including bounding box and dimensions.
     """
     if asset_path is None:
-        return json.dumps({"success": False, "message": "Required parameter 'asset_path' is missing."})
+        return {"success": False, "message": "Required parameter 'asset_path' is missing."}
     try:
         static_mesh = unreal.EditorAssetLibrary.load_asset(asset_path)
         if not static_mesh or not isinstance(static_mesh, unreal.StaticMesh):
-            return json.dumps({"success": False, "message": f"Asset is not a StaticMesh or could not be loaded: {asset_path}"})
+            return {"success": False, "message": f"Asset is not a StaticMesh or could not be loaded: {asset_path}"}
 
         bounds = static_mesh.get_bounding_box()  # This returns a Box type object
         
@@ -78,8 +107,8 @@ def ue_get_static_mesh_details(asset_path: str = None) -> str:
             "bounding_box_max": {"x": max_point.x, "y": max_point.y, "z": max_point.z},
             "dimensions": dimensions
         }
-        return json.dumps({"success": True, "details": details})
+        return {"success": True, "details": details}
     except Exception as e:
         tb_str = traceback.format_exc()
         unreal.log_error(f"Error in ue_get_static_mesh_details for {asset_path}: {str(e)}\n{tb_str}")
-        return json.dumps({"success": False, "message": str(e), "traceback": tb_str})
+        return {"success": False, "message": str(e), "traceback": tb_str if _DEBUG else None}
@@ -2,7 +2,13 @@
 
 import unreal
 import json
+import os
 import traceback
+from typing import Union
+
+# Tracebacks are only included in error responses when UE_MCP_DEBUG=1.
+_DEBUG = os.environ.get("UE_MCP_DEBUG") == "1"
+
 
 BT_ACTIONS_MODULE = "behavior_tree_actions"
 
@@ -44,19 +50,29 @@ def _bt_node_info_to_dict(info):
     return d
 
 
+def _behavior_tree_filter():
+    """ARFilter for Behavior Tree assets under /Game (class_paths on UE 5.1+, class_names before)."""
+    if hasattr(unreal, "TopLevelAssetPath"):
+        return unreal.ARFilter(
+            package_paths=['/Game'], recursive_paths=True,
+            class_paths=[unreal.TopLevelAssetPath("/Script/AIModule", "BehaviorTree")]
+        )
+    return unreal.ARFilter(package_paths=['/Game'], recursive_paths=True, class_names=["BehaviorTree"])
+
+
 def _load_asset(asset_path, expected_class=None):
-    """Load an asset and optionally verify its class. Returns (asset, error_json_str)."""
+    """Load an asset and optionally verify its class. Returns (asset, error_response_dict)."""
     asset = unreal.EditorAssetLibrary.load_asset(asset_path)
     if asset is None:
-        return None, json.dumps({
+        return None, {
             "success": False,
             "message": f"Asset not found or failed to load: {asset_path}"
-        })
+        }
     if expected_class is not None and not isinstance(asset, expected_class):
-        return None, json.dumps({
+        return None, {
             "success": False,
             "message": f"Asset at '{asset_path}' is {type(asset).__name__}, expected {expected_class.__name__}."
-        })
+        }
     return asset, None
 
 
@@ -168,13 +184,19 @@ def _create_bb_key_type_instance(key_type):
 
 # ─── Read Actions ─────────────────────────────────────────────────────────────
 
-def ue_list_behavior_trees() -> str:
+def ue_list_behavior_trees() -> dict:
     """Lists all Behavior Tree assets under /Game."""
     try:
-        all_assets = unreal.EditorAssetLibrary.list_assets('/Game', recursive=True)
+        # The registry filters by class natively, so only Behavior Tree entries cross
+        # into Python and nothing is loaded to find them; the matches are loaded
+        # afterwards to read their blackboard.
+        registry = unreal.AssetRegistryHelpers.get_asset_registry()
+        asset_filter = _behavior_tree_filter()
 
         results = []
-        for asset_path in all_assets:
+        for asset_data in registry.get_assets(asset_filter):
+            asset_name = str(asset_data.asset_name)
+            asset_path = f"{asset_data.package_name}.{asset_name}"
             try:
                 asset = unreal.EditorAssetLibrary.load_asset(asset_path)
             except Exception:
@@ -183,9 +205,8 @@ def ue_list_behavior_trees() -> str:
             if asset is None or not isinstance(asset, unreal.BehaviorTree):
                 continue
 
-            asset_name = str(asset_path).rsplit('/', 1)[-1].split('.')[0]
             entry = {
-                "asset_path": str(asset_path),
+                "asset_path": asset_path,
                 "asset_name": asset_name,
             }
 
@@ -197,22 +218,22 @@ def ue_list_behavior_trees() -> str:
                 pass
             results.append(entry)
 
-        return json.dumps({
+        return {
             "success": True,
             "behavior_trees": results,
             "count": len(results),
             "message": f"Found {len(results)} Behavior Tree asset(s)."
-        })
+        }
     except Exception as e:
         tb_str = traceback.format_exc()
         unreal.log_error(f"Error in ue_list_behavior_trees: {str(e)}\n{tb_str}")
-        return json.dumps({"success": False, "message": str(e), "traceback": tb_str})
+        return {"success": False, "message": str(e), "traceback": tb_str if _DEBUG else None}
 
 
-def ue_get_behavior_tree_structure(asset_path: str = None) -> str:
+def ue_get_behavior_tree_structure(asset_path: str = None) -> dict:
     """Returns the full tree structure of a Behavior Tree asset as JSON."""
     if asset_path is None:
-        return json.dumps({"success": False, "message": "Required parameter 'asset_path' is missing."})
+        return {"success": False, "message": "Required parameter 'asset_path' is missing."}
 
     try:
         bt, err = _load_asset(asset_path, unreal.BehaviorTree)
@@ -233,7 +254,7 @@ def ue_get_behavior_tree_structure(asset_path: str = None) -> str:
         result = json.loads(result_json)
 
         if not result.get("success", False):
-            return result_json
+            return result
 
         # Merge blackboard info into the result
         result["asset_path"] = asset_path
@@ -241,17 +262,17 @@ def ue_get_behavior_tree_structure(asset_path: str = None) -> str:
         result["tree"] = [result.pop("root")] if "root" in result else []
         result["message"] = f"Behavior Tree structure retrieved ({len(result['tree'])} root node(s))."
 
-        return json.dumps(result)
+        return result
     except Exception as e:
         tb_str = traceback.format_exc()
         unreal.log_error(f"Error in ue_get_behavior_tree_structure: {str(e)}\n{tb_str}")
-        return json.dumps({"success": False, "message": str(e), "traceback": tb_str})
+        return {"success": False, "message": str(e), "traceback": tb_str if _DEBUG else None}
 
 
-def ue_get_blackboard_data(asset_path: str = None) -> str:
+def ue_get_blackboard_data(asset_path: str = None) -> dict:
     """Reads all keys from a Blackboard asset."""
     if asset_path is None:
-        return json.dumps({"success": False, "message": "Required parameter 'asset_path' is missing."})
+        return {"success": False, "message": "Required parameter 'asset_path' is missing."}
 
     try:
         bb, err = _load_asset(asset_path, unreal.BlackboardData)
@@ -307,62 +328,64 @@ def ue_get_blackboard_data(asset_path: str = None) -> str:
             except Exception as keys_err:
                 unreal.log_warning(f"Could not read keys with prop '{kp}': {keys_err}")
 
-        return json.dumps({
+        return {
             "success": True,
             "asset_path": asset_path,
             "parent_path": parent_path,
             "keys": keys_data,
             "key_count": len(keys_data),
             "message": f"Blackboard has {len(keys_data)} key(s)."
-        })
+        }
     except Exception as e:
         tb_str = traceback.format_exc()
         unreal.log_error(f"Error in ue_get_blackboard_data: {str(e)}\n{tb_str}")
-        return json.dumps({"success": False, "message": str(e), "traceback": tb_str})
+        return {"success": False, "message": str(e), "traceback": tb_str if _DEBUG else None}
 
 
-def ue_get_bt_node_details(asset_path: str = None, node_name: str = None) -> str:
+def ue_get_bt_node_details(asset_path: str = None, node_name: str = None) -> Union[dict, str]:
     """Retrieves detailed properties of a specific node in a Behavior Tree."""
     if asset_path is None:
-        return json.dumps({"success": False, "message": "Required parameter 'asset_path' is missing."})
+        return {"success": False, "message": "Required parameter 'asset_path' is missing."}
     if node_name is None:
-        return json.dumps({"success": False, "message": "Required parameter 'node_name' is missing."})
+        return {"success": False, "message": "Required parameter 'node_name' is missing."}
 
     try:
         bt, err = _load_asset(asset_path, unreal.BehaviorTree)
         if err:
             return err
 
-        # Call C++ helper — returns JSON string with node details
+        # Call C++ helper — returns JSON string with node details, passed through as-is
+        # (the dispatcher forwards encoded JSON unparsed) rather than decoded and re-encoded.
         details_json = unreal.MCPythonHelper.get_behavior_tree_node_details(bt, node_name)
         return details_json
     except Exception as e:
         tb_str = traceback.format_exc()
         unreal.log_error(f"Error in ue_get_bt_node_details: {str(e)}\n{tb_str}")
-        return json.dumps({"success": False, "message": str(e), "traceback": tb_str})
+        return {"success": False, "message": str(e), "traceback": tb_str if _DEBUG else None}
 
 
-def ue_get_selected_bt_nodes() -> str:
+def ue_get_selected_bt_nodes() -> Union[dict, str]:
     """Returns details of selected nodes in the currently open BT editor."""
     try:
+        # Already-encoded JSON from the C++ helper; passed through like ue_get_bt_node_details.
         result_json = unreal.MCPythonHelper.get_selected_bt_nodes()
         return result_json
     except Exception as e:
         tb_str = traceback.format_exc()
         unreal.log_error(f"Error in ue_get_selected_bt_nodes: {str(e)}\n{tb_str}")
-        return json.dumps({"success": False, "message": str(e), "traceback": tb_str})
+        return {"success": False, "message": str(e), "traceback": tb_str if _DEBUG else None}
 
 
 # ─── Write Actions ────────────────────────────────────────────────────────────
 
-def ue_create_behavior_tree(asset_path: str = None, blackboard_path: str = None) -> str:
+def ue_create_behavior_tree(asset_path: str = None, blackboard_path: str = None) -> dict:
     """Creates a new empty Behavior Tree asset."""
     if asset_path is None:
-        return json.dumps({"success": False, "message": "Required parameter 'asset_path' is missing."})
+        return {"success": False, "message": "Required parameter 'asset_path' is missing."}
 
     try:
         if unreal.EditorAssetLibrary.does_asset_exist(asset_path):
-            return json.dumps({"success": False, "message": f"Asset already exists at '{asset_path}'."})
+            return {"success": False, "message": f"Asset already exists at '{asset_path}'."}
 
         package_path, asset_name = _split_asset_path(asset_path)
 
@@ -378,7 +401,7 @@ def ue_create_behavior_tree(asset_path: str = None, blackboard_path: str = None)
                 pass
 
         if bt is None:
-            return json.dumps({"success": False, "message": f"Failed to create Behavior Tree at '{asset_path}'."})
+            return {"success": False, "message": f"Failed to create Behavior Tree at '{asset_path}'."}
 
         unreal.EditorAssetLibrary.save_asset(bt.get_path_name())
 
@@ -408,21 +431,21 @@ def ue_create_behavior_tree(asset_path: str = None, blackboard_path: str = None)
                 result["blackboard_linked"] = False
                 result["blackboard_link_note"] = f"Error linking Blackboard: {str(bb_err)}"
 
-        return json.dumps(result)
+        return result
     except Exception as e:
         tb_str = traceback.format_exc()
         unreal.log_error(f"Error in ue_create_behavior_tree: {str(e)}\n{tb_str}")
-        return json.dumps({"success": False, "message": str(e), "traceback": tb_str})
+        return {"success": False, "message": str(e), "traceback": tb_str if _DEBUG else None}
 
 
-def ue_create_blackboard(asset_path: str = None, parent_path: str = None) -> str:
+def ue_create_blackboard(asset_path: str = None, parent_path: str = None) -> dict:
     """Creates a new Blackboard Data asset."""
     if asset_path is None:
-        return json.dumps({"success": False, "message": "Required parameter 'asset_path' is missing."})
+        return {"success": False, "message": "Required parameter 'asset_path' is missing."}
 
     try:
         if unreal.EditorAssetLibrary.does_asset_exist(asset_path):
-            return json.dumps({"success": False, "message": f"Asset already exists at '{asset_path}'."})
+            return {"success": False, "message": f"Asset already exists at '{asset_path}'."}
 
         package_path, asset_name = _split_asset_path(asset_path)
 
@@ -438,7 +461,7 @@ def ue_create_blackboard(asset_path: str = None, parent_path: str = None) -> str
                 pass
 
         if bb is None:
-            return json.dumps({"success": False, "message": f"Failed to create Blackboard at '{asset_path}'."})
+            return {"success": False, "message": f"Failed to create Blackboard at '{asset_path}'."}
 
         if parent_path is not None:
             try:
@@ -457,32 +480,32 @@ def ue_create_blackboard(asset_path: str = None, parent_path: str = None) -> str
 
         unreal.EditorAssetLibrary.save_asset(bb.get_path_name())
 
-        return json.dumps({
+        return {
             "success": True,
             "asset_path": bb.get_path_name(),
             "message": f"Blackboard created at '{bb.get_path_name()}'."
-        })
+        }
     except Exception as e:
         tb_str = traceback.format_exc()
         unreal.log_error(f"Error in ue_create_blackboard: {str(e)}\n{tb_str}")
-        return json.dumps({"success": False, "message": str(e), "traceback": tb_str})
+        return {"success": False, "message": str(e), "traceback": tb_str if _DEBUG else None}
 
 
 def ue_add_blackboard_key(asset_path: str = None, key_name: str = None,
-                          key_type: str = None, instance_synced: bool = False) -> str:
+                          key_type: str = None, instance_synced: bool = False) -> dict:
     """Adds a new key to a Blackboard asset."""
     if asset_path is None:
-        return json.dumps({"success": False, "message": "Required parameter 'asset_path' is missing."})
+        return {"success": False, "message": "Required parameter 'asset_path' is missing."}
     if key_name is None:
-        return json.dumps({"success": False, "message": "Required parameter 'key_name' is missing."})
+        return {"success": False, "message": "Required parameter 'key_name' is missing."}
     if key_type is None:
-        return json.dumps({"success": False, "message": "Required parameter 'key_type' is missing."})
+        return {"success": False, "message": "Required parameter 'key_type' is missing."}
 
     if key_type not in _BB_KEY_TYPE_MAP:
-        return json.dumps({
+        return {
             "success": False,
             "message": f"Invalid key_type '{key_type}'. Supported types: {', '.join(_BB_KEY_TYPE_MAP.keys())}"
-        })
+        }
 
     try:
         bb, err = _load_asset(asset_path, unreal.BlackboardData)
@@ -503,10 +526,10 @@ def ue_add_blackboard_key(asset_path: str = None, key_name: str = None,
                 for enp in ['entry_name', 'EntryName']:
                     try:
                         if str(key.get_editor_property(enp)) == key_name:
-                            return json.dumps({
+                            return {
                                 "success": False,
                                 "message": f"Key '{key_name}' already exists in Blackboard."
-                            })
+                            }
                         break
                     except Exception:
                         pass
@@ -523,11 +546,11 @@ def ue_add_blackboard_key(asset_path: str = None, key_name: str = None,
             except Exception:
                 pass
         if not name_set:
-            return json.dumps({"success": False, "message": "Failed to set entry name on BlackboardEntry."})
+            return {"success": False, "message": "Failed to set entry name on BlackboardEntry."}
 
         key_type_obj, key_err = _create_bb_key_type_instance(key_type)
         if key_err:
-            return json.dumps({"success": False, "message": key_err})
+            return {"success": False, "message": key_err}
 
         type_set = False
         for ktp in ['key_type', 'KeyType']:
@@ -538,10 +561,10 @@ def ue_add_blackboard_key(asset_path: str = None, key_name: str = None,
             except Exception:
                 pass
         if not type_set:
-            return json.dumps({
+            return {
                 "success": False,
                 "message": f"Failed to set key type on BlackboardEntry. Key type object: {type(key_type_obj).__name__}"
-            })
+            }
 
         for isp in ['is_instance_synced', 'bIsInstanceSynced', 'instance_synced']:
             try:
@@ -563,30 +586,30 @@ def ue_add_blackboard_key(asset_path: str = None, key_name: str = None,
                 pass
 
         if not added:
-            return json.dumps({"success": False, "message": "Failed to add key to Blackboard keys array."})
+            return {"success": False, "message": "Failed to add key to Blackboard keys array."}
 
         unreal.EditorAssetLibrary.save_asset(bb.get_path_name())
 
-        return json.dumps({
+        return {
             "success": True,
             "asset_path": asset_path,
             "key_name": key_name,
             "key_type": key_type,
             "instance_synced": instance_synced,
             "message": f"Key '{key_name}' ({key_type}) added to Blackboard."
-        })
+        }
     except Exception as e:
         tb_str = traceback.format_exc()
         unreal.log_error(f"Error in ue_add_blackboard_key: {str(e)}\n{tb_str}")
-        return json.dumps({"success": False, "message": str(e), "traceback": tb_str})
+        return {"success": False, "message": str(e), "traceback": tb_str if _DEBUG else None}
 
 
-def ue_remove_blackboard_key(asset_path: str = None, key_name: str = None) -> str:
+def ue_remove_blackboard_key(asset_path: str = None, key_name: str = None) -> dict:
     """Removes a key from a Blackboard asset."""
     if asset_path is None:
-        return json.dumps({"success": False, "message": "Required parameter 'asset_path' is missing."})
+        return {"success": False, "message": "Required parameter 'asset_path' is missing."}
     if key_name is None:
-        return json.dumps({"success": False, "message": "Required parameter 'key_name' is missing."})
+        return {"success": False, "message": "Required parameter 'key_name' is missing."}
 
     try:
         bb, err = _load_asset(asset_path, unreal.BlackboardData)
@@ -598,7 +621,7 @@ def ue_remove_blackboard_key(asset_path: str = None, key_name: str = None) -> st
             try:
                 keys = bb.get_editor_property(kp)
                 if keys is None or len(keys) == 0:
-                    return json.dumps({"success": False, "message": "Blackboard has no keys to remove."})
+                    return {"success": False, "message": "Blackboard has no keys to remove."}
 
                 new_keys = []
                 found = False
@@ -616,7 +639,7 @@ def ue_remove_blackboard_key(asset_path: str = None, key_name: str = None) -> st
                         new_keys.append(key)
 
                 if not found:
-                    return json.dumps({"success": False, "message": f"Key '{key_name}' not found in Blackboard."})
+                    return {"success": False, "message": f"Key '{key_name}' not found in Blackboard."}
 
                 bb.set_editor_property(kp, new_keys)
                 removed = True
@@ -625,28 +648,28 @@ def ue_remove_blackboard_key(asset_path: str = None, key_name: str = None) -> st
                 pass
 
         if not removed:
-            return json.dumps({"success": False, "message": "Failed to modify Blackboard keys array."})
+            return {"success": False, "message": "Failed to modify Blackboard keys array."}
 
         unreal.EditorAssetLibrary.save_asset(bb.get_path_name())
 
-        return json.dumps({
+        return {
             "success": True,
             "asset_path": asset_path,
             "key_name": key_name,
             "message": f"Key '{key_name}' removed from Blackboard."
-        })
+        }
     except Exception as e:
         tb_str = traceback.format_exc()
         unreal.log_error(f"Error in ue_remove_blackboard_key: {str(e)}\n{tb_str}")
-        return json.dumps({"success": False, "message": str(e), "traceback": tb_str})
+        return {"success": False, "message": str(e), "traceback": tb_str if _DEBUG else None}
 
 
-def ue_set_blackboard_to_behavior_tree(bt_path: str = None, bb_path: str = None) -> str:
+def ue_set_blackboard_to_behavior_tree(bt_path: str = None, bb_path: str = None) -> dict:
     """Links a Blackboard asset to a Behavior Tree."""
     if bt_path is None:
-        return json.dumps({"success": False, "message": "Required parameter 'bt_path' is missing."})
+        return {"success": False, "message": "Required parameter 'bt_path' is missing."}
     if bb_path is None:
-        return json.dumps({"success": False, "message": "Required parameter 'bb_path' is missing."})
+        return {"success": False, "message": "Required parameter 'bb_path' is missing."}
 
     try:
         bt, err = _load_asset(bt_path, unreal.BehaviorTree)
@@ -662,29 +685,29 @@ def ue_set_blackboard_to_behavior_tree(bt_path: str = None, bb_path: str = None)
 
         if success:
             unreal.EditorAssetLibrary.save_asset(bt_path)
-            return json.dumps({
+            return {
                 "success": True,
                 "bt_path": bt_path,
                 "bb_path": bb_path,
                 "message": "Blackboard linked to Behavior Tree successfully."
-            })
+            }
         else:
-            return json.dumps({
+            return {
                 "success": False,
                 "message": "Failed to set Blackboard on Behavior Tree."
-            })
+            }
     except Exception as e:
         tb_str = traceback.format_exc()
         unreal.log_error(f"Error in ue_set_blackboard_to_behavior_tree: {str(e)}\n{tb_str}")
-        return json.dumps({"success": False, "message": str(e), "traceback": tb_str})
+        return {"success": False, "message": str(e), "traceback": tb_str if _DEBUG else None}
 
 
-def ue_build_behavior_tree(asset_path: str = None, tree_structure: dict = None) -> str:
+def ue_build_behavior_tree(asset_path: str = None, tree_structure: dict = None) -> Union[dict, str]:
     """Builds a complete Behavior Tree from a JSON structure."""
     if asset_path is None:
-        return json.dumps({"success": False, "message": "Required parameter 'asset_path' is missing."})
+        return {"success": False, "message": "Required parameter 'asset_path' is missing."}
     if tree_structure is None:
-        return json.dumps({"success": False, "message": "Required parameter 'tree_structure' is missing."})
+        return {"success": False, "message": "Required parameter 'tree_structure' is missing."}
 
     try:
         bt, err = _load_asset(asset_path, unreal.BehaviorTree)
@@ -692,23 +715,24 @@ def ue_build_behavior_tree(asset_path: str = None, tree_structure: dict = None)
             return err
 
         # Convert dict to JSON string for C++ helper
-        tree_json = json.dumps(tree_structure)
+        tree_json = json.dumps(tree_structure, separators=(',', ':'), ensure_ascii=False)
 
-        # Call C++ helper to build the tree
+        # Call C++ helper to build the tree; its JSON result is passed through as-is.
         result_json = unreal.MCPythonHelper.build_behavior_tree(bt, tree_json)
         return result_json
     except Exception as e:
         tb_str = traceback.format_exc()
         unreal.log_error(f"Error in ue_build_behavior_tree: {str(e)}\n{tb_str}")
-        return json.dumps({"success": False, "message": str(e), "traceback": tb_str})
+        return {"success": False, "message": str(e), "traceback": tb_str if _DEBUG else None}
 
 
-def ue_list_bt_node_classes() -> str:
+def ue_list_bt_node_classes() -> Union[dict, str]:
     """Lists all available BT node classes (composites, tasks, decorators, services)."""
     try:
+        # Already-encoded JSON from the C++ helper; passed through like ue_get_bt_node_details.
         result_json = unreal.MCPythonHelper.list_bt_node_classes()
         return result_json
     except Exception as e:
         tb_str = traceback.format_exc()
         unreal.log_error(f"Error in ue_list_bt_node_classes: {str(e)}\n{tb_str}")
-        return json.dumps({"success": False, "message": str(e), "traceback": tb_str})
+        return {"success": False, "message": str(e), "traceback": tb_str if _DEBUG else None}
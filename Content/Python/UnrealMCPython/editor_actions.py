@@ -1,26 +1,53 @@
 # Copyright (c) 2025 GenOrca. All Rights Reserved.
 
 import unreal
-import json
-import traceback
+import os
 from typing import List, Dict, Optional, Any # Modified import
 
-def ue_get_selected_assets() -> str:
+# Tracebacks are only included in error responses when UE_MCP_DEBUG=1.
+_DEBUG = os.environ.get("UE_MCP_DEBUG") == "1"
+
+def _format_exc() -> str:
+    """Formats the active exception; traceback is imported only when an error is reported."""
+    import traceback
+    return traceback.format_exc()
+
+def _tb():
+    """Traceback for an error response, or None unless UE_MCP_DEBUG=1."""
+    return _format_exc() if _DEBUG else None
+
+# The EditorActorSubsystem lives as long as the editor, so it is fetched once and kept
+# in globals() across the dispatcher's module reloads. EditorLevelLibrary's actor
+# queries look the subsystem up again on every call.
+_actor_subsystem = globals().get("_actor_subsystem")
+
+def _get_actor_subsystem():
+    """Returns the cached EditorActorSubsystem, fetching it on first use."""
+    global _actor_subsystem
+    if _actor_subsystem is None or not unreal.SystemLibrary.is_valid(_actor_subsystem):
+        _actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+    return _actor_subsystem
+
+# Static error responses shared by several actions, built once at import; actions
+# return a copy (dict(_ERR_...)) so a caller mutating a response can't alter later ones.
+_ERR_NO_ACTORS_SELECTED = {"success": False, "message": "No actors selected."}
+_ERR_NO_VALID_ACTORS = {"success": False, "message": "No valid actors found from the provided paths."}
+
+def ue_get_selected_assets() -> dict:
     """Gets the set of currently selected assets."""
     try:
-        selected_assets = unreal.EditorUtilityLibrary.get_selected_assets()
-        
-        serialized_assets = []
-        for asset in selected_assets:
-            serialized_assets.append({
+        serialized_assets = [
+            {
                 "asset_name": asset.get_name(),
                 "asset_path": asset.get_path_name(),
                 "asset_class": asset.get_class().get_name(),
-            })
+            }
+            for asset in unreal.EditorUtilityLibrary.get_selected_assets()
+        ]
         
-        return json.dumps({"success": True, "selected_assets": serialized_assets})
+        return {"success": True, "selected_assets": serialized_assets}
     except Exception as e:
-        return json.dumps({"success": False, "message": str(e)})
+        return {"success": False, "message": str(e)}
 
 # Helper function to load MaterialInterface assets (can be Material or MaterialInstance)
 def _load_material_interface(material_path: str):
@@ -57,9 +84,15 @@ def _get_component_material_paths(component: unreal.MeshComponent) -> List[str]:
 # Helper function to get actors by their paths
 def _get_actors_by_paths(actor_paths: List[str]) -> List[unreal.Actor]:
     actors = []
-    all_level_actors = unreal.EditorLevelLibrary.get_all_level_actors()
+    # One pass over the level instead of a scan per requested path.
+    wanted = set(actor_paths)
+    by_path = {}
+    for a in _get_actor_subsystem().get_all_level_actors():
+        path = a.get_path_name()
+        if path in wanted:
+            by_path.setdefault(path, a)
     for path in actor_paths:
-        actor = next((a for a in all_level_actors if a.get_path_name() == path), None)
+        actor = by_path.get(path)
         if actor:
             actors.append(actor)
         else:
@@ -202,14 +235,14 @@ def _replace_meshes_on_actors_components_base(
         "details": details
     }
 
-def ue_replace_mtl_on_selected(material_to_be_replaced_path: str, new_material_path: str) -> str:
+def ue_replace_mtl_on_selected(material_to_be_replaced_path: str, new_material_path: str) -> dict:
     try:
         material_to_replace = _load_material_interface(material_to_be_replaced_path)
         new_material = _load_material_interface(new_material_path)
         
-        selected_actors = unreal.EditorLevelLibrary.get_selected_level_actors()
+        selected_actors = _get_actor_subsystem().get_selected_level_actors()
         if not selected_actors:
-            return json.dumps({"success": False, "message": "No actors selected."})
+            return dict(_ERR_NO_ACTORS_SELECTED)
 
         mesh_components = []
         for actor in selected_actors:
@@ -217,7 +250,7 @@ def ue_replace_mtl_on_selected(material_to_be_replaced_path: str, new_material_p
             mesh_components.extend(c for c in components if c)
         
         if not mesh_components:
-            return json.dumps({"success": False, "message": "No mesh components found on selected actors."})
+            return {"success": False, "message": "No mesh components found on selected actors."}
 
         initial_materials_map = {}
         for comp in mesh_components:
@@ -246,29 +279,29 @@ def ue_replace_mtl_on_selected(material_to_be_replaced_path: str, new_material_p
                 affected_component_paths.append(comp.get_path_name())
         
         if num_components_affected > 0:
-            return json.dumps({
+            return {
                 "success": True, 
                 "message": f"Successfully replaced material '{material_to_be_replaced_path}' with '{new_material_path}' on {num_components_affected} mesh component(s) across {len(selected_actors)} selected actor(s).",
                 "affected_actors_count": len(selected_actors),
                 "affected_components_count": num_components_affected,
                 "affected_component_paths": affected_component_paths
-            })
+            }
         else:
-            return json.dumps({
+            return {
                 "success": False, 
                 "message": f"Failed to replace material. Target material '{material_to_be_replaced_path}' not found or not replaced on any mesh components of selected actors."
-            })
+            }
     except Exception as e:
-        return json.dumps({"success": False, "message": str(e), "traceback": traceback.format_exc()})
+        return {"success": False, "message": str(e), "traceback": _tb()}
 
-def ue_replace_mtl_on_specified(actor_paths: List[str], material_to_be_replaced_path: str, new_material_path: str) -> str:
+def ue_replace_mtl_on_specified(actor_paths: List[str], material_to_be_replaced_path: str, new_material_path: str) -> dict:
     try:
         material_to_replace = _load_material_interface(material_to_be_replaced_path)
         new_material = _load_material_interface(new_material_path)
         
         actors_to_process = _get_actors_by_paths(actor_paths)
         if not actors_to_process:
-            return json.dumps({"success": False, "message": "No valid actors found from the provided paths."})
+            return dict(_ERR_NO_VALID_ACTORS)
 
         all_mesh_components_in_actors = []
         for actor in actors_to_process:
@@ -276,7 +309,7 @@ def ue_replace_mtl_on_specified(actor_paths: List[str], material_to_be_replaced_
             all_mesh_components_in_actors.extend(c for c in components if c)
 
         if not all_mesh_components_in_actors:
-            return json.dumps({"success": False, "message": "No mesh components found on the specified actors."})
+            return {"success": False, "message": "No mesh components found on the specified actors."}
 
         initial_materials_map = {}
         for comp in all_mesh_components_in_actors:
@@ -305,22 +338,22 @@ def ue_replace_mtl_on_specified(actor_paths: List[str], material_to_be_replaced_
                 affected_component_paths.append(comp.get_path_name())
         
         if num_components_affected > 0:
-            return json.dumps({
+            return {
                 "success": True, 
                 "message": f"Successfully replaced material '{material_to_be_replaced_path}' with '{new_material_path}' on {num_components_affected} mesh component(s) across {len(actors_to_process)} specified actor(s).",
                 "affected_actors_count": len(actors_to_process),
                 "affected_components_count": num_components_affected,
                 "affected_component_paths": affected_component_paths
-            })
+            }
         else:
-            return json.dumps({
+            return {
                 "success": False, 
                 "message": f"Failed to replace material. Target material '{material_to_be_replaced_path}' not found or not replaced on any mesh components of specified actors."
-            })
+            }
     except Exception as e:
-        return json.dumps({"success": False, "message": str(e), "traceback": traceback.format_exc()})
+        return {"success": False, "message": str(e), "traceback": _tb()}
 
-def ue_replace_mesh_on_selected(mesh_to_be_replaced_path: str, new_mesh_path: str) -> str:
+def ue_replace_mesh_on_selected(mesh_to_be_replaced_path: str, new_mesh_path: str) -> dict:
     """Replaces static meshes on components of selected actors using Unreal's batch API if available."""
     try:
         # Check if mesh_to_be_replaced_path exists (if specified)
@@ -328,15 +361,15 @@ def ue_replace_mesh_on_selected(mesh_to_be_replaced_path: str, new_mesh_path: st
             try:
                 _ = _load_static_mesh(mesh_to_be_replaced_path)
             except FileNotFoundError:
-                return json.dumps({
+                return {
                     "success": False,
                     "message": f"The mesh_to_be_replaced_path '{mesh_to_be_replaced_path}' does not exist as a StaticMesh asset.",
                     "error_type": "MeshToReplaceNotFound"
-                })
+                }
         
-        selected_actors = unreal.EditorLevelLibrary.get_selected_level_actors()
+        selected_actors = _get_actor_subsystem().get_selected_level_actors()
         if not selected_actors:
-            return json.dumps({"success": True, "message": "No actors selected.", "changed_actors_count": 0, "changed_components_count": 0})
+            return {"success": True, "message": "No actors selected.", "changed_actors_count": 0, "changed_components_count": 0}
 
         mesh_to_replace = None
         if mesh_to_be_replaced_path and mesh_to_be_replaced_path.lower() not in ["", "none", "any"]:
@@ -350,7 +383,7 @@ def ue_replace_mesh_on_selected(mesh_to_be_replaced_path: str, new_mesh_path: st
             all_mesh_components.extend(c for c in comps if c)
 
         if not all_mesh_components:
-            return json.dumps({"success": False, "message": "No static mesh components found on selected actors."})
+            return {"success": False, "message": "No static mesh components found on selected actors."}
 
         # Save initial mesh paths for change detection
         initial_meshes_map = {comp.get_path_name(): comp.static_mesh.get_path_name() if comp.static_mesh else "" for comp in all_mesh_components}
@@ -394,29 +427,29 @@ def ue_replace_mesh_on_selected(mesh_to_be_replaced_path: str, new_mesh_path: st
                     affected_component_paths.append(comp.get_path_name())
 
         if changed_components_count > 0:
-            return json.dumps({
+            return {
                 "success": True,
                 "message": f"Successfully replaced mesh on {changed_components_count} static mesh component(s) across {len(selected_actors)} selected actor(s).",
                 "affected_actors_count": len(selected_actors),
                 "affected_components_count": changed_components_count,
                 "affected_component_paths": affected_component_paths
-            })
+            }
         else:
-            return json.dumps({
+            return {
                 "success": False,
                 "message": f"Failed to replace mesh. Target mesh '{mesh_to_be_replaced_path}' not found or not replaced on any static mesh components of selected actors."
-            })
+            }
     except FileNotFoundError as e:
         unreal.log_error(f"MCP: Asset loading error in ue_replace_mesh_on_selected: {e}")
-        return json.dumps({"success": False, "message": str(e), "traceback": traceback.format_exc()})
+        return {"success": False, "message": str(e), "traceback": _tb()}
     except TypeError as e:
         unreal.log_error(f"MCP: Asset type error in ue_replace_mesh_on_selected: {e}")
-        return json.dumps({"success": False, "message": str(e), "traceback": traceback.format_exc()})
+        return {"success": False, "message": str(e), "traceback": _tb()}
     except Exception as e:
-        unreal.log_error(f"MCP: Error in ue_replace_mesh_on_selected: {e}\n{traceback.format_exc()}")
-        return json.dumps({"success": False, "message": str(e), "traceback": traceback.format_exc()})
+        unreal.log_error(f"MCP: Error in ue_replace_mesh_on_selected: {e}\n{_format_exc()}")
+        return {"success": False, "message": str(e), "traceback": _tb()}
 
-def ue_replace_mesh_on_specified(actor_paths: List[str], mesh_to_be_replaced_path: str, new_mesh_path: str) -> str:
+def ue_replace_mesh_on_specified(actor_paths: List[str], mesh_to_be_replaced_path: str, new_mesh_path: str) -> dict:
     """Replaces static meshes on components of specified actors using Unreal's batch API if available."""
     try:
         # Check if mesh_to_be_replaced_path exists (if specified)
@@ -424,14 +457,14 @@ def ue_replace_mesh_on_specified(actor_paths: List[str], mesh_to_be_replaced_pat
             try:
                 _ = _load_static_mesh(mesh_to_be_replaced_path)
             except FileNotFoundError:
-                return json.dumps({
+                return {
                     "success": False,
                     "message": f"The mesh_to_be_replaced_path '{mesh_to_be_replaced_path}' does not exist as a StaticMesh asset.",
                     "error_type": "MeshToReplaceNotFound"
-                })
+                }
         actors_to_process = _get_actors_by_paths(actor_paths)
         if not actors_to_process:
-            return json.dumps({"success": False, "message": "No valid actors found from the provided paths."})
+            return dict(_ERR_NO_VALID_ACTORS)
         mesh_to_replace = None
         if mesh_to_be_replaced_path and mesh_to_be_replaced_path.lower() not in ["", "none", "any"]:
             mesh_to_replace = _load_static_mesh(mesh_to_be_replaced_path)
@@ -447,14 +480,14 @@ def ue_replace_mesh_on_specified(actor_paths: List[str], mesh_to_be_replaced_pat
             actors_materials_info = _get_materials_map_for_actors(actors_to_process)
             actors_meshes_info = _get_meshes_map_for_actors(actors_to_process)
             actors_skel_meshes_info = _get_skeletal_meshes_map_for_actors(actors_to_process)
-            return json.dumps({
+            return {
                 "success": False,
                 "message": "No static mesh components found on specified actors.",
                 "specified_actors_info": actor_info,
                 "current_materials": actors_materials_info,
                 "current_meshes": actors_meshes_info,
                 "current_skeletal_meshes": actors_skel_meshes_info
-            })
+            }
         # Save initial mesh paths for change detection
         initial_meshes_map = {comp.get_path_name(): comp.static_mesh.get_path_name() if comp.static_mesh else "" for comp in all_mesh_components}
         # Use Unreal's batch API if available
@@ -521,64 +554,60 @@ def ue_replace_mesh_on_specified(actor_paths: List[str], mesh_to_be_replaced_pat
                     })
         unchanged_components_info = unchanged_components_info if 'unchanged_components_info' in locals() else []
         if changed_components_count > 0:
-            return json.dumps({
+            return {
                 "success": True,
                 "message": f"Successfully replaced mesh on {changed_components_count} static mesh component(s) across {len(actors_to_process)} specified actor(s).",
                 "affected_actors_count": len(actors_to_process),
                 "affected_components_count": changed_components_count,
                 "affected_component_paths": affected_component_paths,
                 "unchanged_components": unchanged_components_info
-            })
+            }
         else:
             actors_materials_info = _get_materials_map_for_actors(actors_to_process)
             actors_meshes_info = _get_meshes_map_for_actors(actors_to_process)
             actors_skel_meshes_info = _get_skeletal_meshes_map_for_actors(actors_to_process)
             unchanged_components_info = unchanged_components_info if 'unchanged_components_info' in locals() else []
-            return json.dumps({
+            return {
                 "success": False,
                 "message": f"Failed to replace mesh. Target mesh '{mesh_to_be_replaced_path}' not found or not replaced on any static mesh components of specified actors.",
                 "current_materials": actors_materials_info,
                 "current_meshes": actors_meshes_info,
                 "current_skeletal_meshes": actors_skel_meshes_info,
                 "unchanged_components": unchanged_components_info
-            })
+            }
     except FileNotFoundError as e:
         unreal.log_error(f"MCP: Asset loading error in ue_replace_mesh_on_specified: {e}")
-        return json.dumps({"success": False, "message": str(e), "traceback": traceback.format_exc()})
+        return {"success": False, "message": str(e), "traceback": _tb()}
     except TypeError as e:
         unreal.log_error(f"MCP: Asset type error in ue_replace_mesh_on_specified: {e}")
-        return json.dumps({"success": False, "message": str(e), "traceback": traceback.format_exc()})
+        return {"success": False, "message": str(e), "traceback": _tb()}
     except Exception as e:
-        unreal.log_error(f"MCP: Error in ue_replace_mesh_on_specified: {e}\n{traceback.format_exc()}")
-        return json.dumps({"success": False, "message": str(e), "traceback": traceback.format_exc()})
+        unreal.log_error(f"MCP: Error in ue_replace_mesh_on_specified: {e}\n{_format_exc()}")
+        return {"success": False, "message": str(e), "traceback": _tb()}
 
-def ue_replace_selected_with_bp(blueprint_asset_path: str) -> str:
+def ue_replace_selected_with_bp(blueprint_asset_path: str) -> dict:
     """Replaces the currently selected actors with new actors spawned from a specified Blueprint asset path using Unreal's official API."""
-    import unreal
-    import json
-    import traceback
     try:
-        selected_actors = unreal.EditorLevelLibrary.get_selected_level_actors()
+        selected_actors = _get_actor_subsystem().get_selected_level_actors()
         if not selected_actors:
-            return json.dumps({"success": False, "message": "No actors selected."})
+            return dict(_ERR_NO_ACTORS_SELECTED)
         # Check if the blueprint asset exists
         blueprint = unreal.EditorAssetLibrary.load_asset(blueprint_asset_path)
         if not blueprint:
-            return json.dumps({"success": False, "message": f"Blueprint asset not found at path: {blueprint_asset_path}"})
+            return {"success": False, "message": f"Blueprint asset not found at path: {blueprint_asset_path}"}
         # Use the official API
         unreal.EditorLevelLibrary.replace_selected_actors(blueprint_asset_path)
-        return json.dumps({
+        return {
             "success": True,
             "message": f"Replaced {len(selected_actors)} actors with Blueprint '{blueprint_asset_path}' using official API.",
             "replaced_actors_count": len(selected_actors)
-        })
+        }
     except Exception as e:
-        return json.dumps({"success": False, "message": str(e), "traceback": traceback.format_exc()})
+        return {"success": False, "message": str(e), "traceback": _tb()}
 
-def ue_get_selected_bp_nodes() -> str:
+def ue_get_selected_bp_nodes() -> dict:
     """Returns information about currently selected blueprint nodes in the editor."""
     import unreal
-    import json
     try:
         nodes = unreal.MCPythonHelper.get_selected_blueprint_nodes()
         node_infos = []
@@ -589,19 +618,17 @@ def ue_get_selected_bp_nodes() -> str:
                 "object_path": node.get_path_name() if hasattr(node, 'get_path_name') else None
             }
             node_infos.append(node_info)
-        return json.dumps({
+        return {
             "success": True,
             "selected_nodes_count": len(node_infos),
             "selected_nodes": node_infos
-        })
+        }
     except Exception as e:
-        import traceback
-        return json.dumps({"success": False, "message": str(e), "traceback": traceback.format_exc()})
+        return {"success": False, "message": str(e), "traceback": _tb()}
 
-def ue_get_selected_bp_node_infos() -> str:
+def ue_get_selected_bp_node_infos() -> dict:
     """Returns compact blueprint node info optimized for LLM token efficiency."""
     import unreal
-    import json
     try:
         node_infos = unreal.MCPythonHelper.get_selected_blueprint_node_infos()
 
@@ -646,10 +673,9 @@ def ue_get_selected_bp_node_infos() -> str:
             return d
 
         nodes = [node_to_dict(n, i) for i, n in enumerate(node_infos)]
-        return json.dumps({
+        return {
             "success": True,
             "nodes": nodes
-        })
+        }
     except Exception as e:
-        import traceback
-        return json.dumps({"success": False, "message": str(e), "traceback": traceback.format_exc()})
\ No newline at end of file
+        return {"success": False, "message": str(e), "traceback": _tb()}
\ No newline at end of file
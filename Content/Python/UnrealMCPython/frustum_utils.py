@@ -0,0 +1,120 @@
+# Copyright (c) 2025 GenOrca. All Rights Reserved.
+
+"""
+Bounding-sphere vs. view-cone culling used by actor_actions.ue_get_in_view_frustum.
+The math runs on plain floats, or on NumPy arrays when NumPy is installed in the
+editor's Python environment (JIT-compiled when Numba is too), so no
+unreal.MathLibrary call is made per actor.
+"""
+import math
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+
+# The cone test avoids acos/asin. For a sphere centre at distance d from the camera, with
+# axial component c = v.fwd and perpendicular component p = sqrt(d^2 - c^2), the angular
+# test  angle <= half_fov + asin(r / d)  is equivalent (for half_fov < 90 degrees) to
+#     p * cos_hf - c * sin_hf <= r   and   c * cos_hf + p * sin_hf > 0,
+# where the first term is the distance from the centre to the cone's surface line and the
+# second rejects spheres more than 90 degrees past that line (behind the apex).
+
+
+def _cull_numpy(origins, extents, cam, fwd, cos_hf, sin_hf, near, far):
+    o = np.asarray(origins, dtype=np.float64).reshape(-1, 3)
+    e = np.asarray(extents, dtype=np.float64).reshape(-1, 3)
+    r = np.sqrt(np.einsum('ij,ij->i', e, e))
+    v = o - np.asarray(cam, dtype=np.float64)
+    d2 = np.einsum('ij,ij->i', v, v)
+    d = np.sqrt(d2)
+    c = v @ np.asarray(fwd, dtype=np.float64)
+    p = np.sqrt(np.maximum(d2 - c * c, 0.0))
+
+    in_range = (d + r >= near) & (d - r <= far)
+    # Spheres containing the camera are visible.
+    inside = d <= r
+    in_cone = (p * cos_hf - c * sin_hf <= r) & (c * cos_hf + p * sin_hf > 0.0)
+    return (in_range & (inside | in_cone)).tolist()
+
+
+def _cull_kernel(origins, extents, cam, fwd, cos_hf, sin_hf, near, far):
+    """Per-sphere loop compiled by Numba; same test as _cull_python."""
+    n = origins.shape[0]
+    mask = np.zeros(n, dtype=np.bool_)
+    # Iterations are independent (each writes only mask[i]), so prange splits them across threads.
+    for i in prange(n):
+        vx = origins[i, 0] - cam[0]
+        vy = origins[i, 1] - cam[1]
+        vz = origins[i, 2] - cam[2]
+        d2 = vx * vx + vy * vy + vz * vz
+        d = math.sqrt(d2)
+        r = math.sqrt(extents[i, 0] * extents[i, 0] + extents[i, 1] * extents[i, 1] + extents[i, 2] * extents[i, 2])
+        if d + r < near or d - r > far:
+            continue
+        if d <= r:
+            mask[i] = True
+            continue
+        c = vx * fwd[0] + vy * fwd[1] + vz * fwd[2]
+        p = math.sqrt(max(d2 - c * c, 0.0))
+        mask[i] = p * cos_hf - c * sin_hf <= r and c * cos_hf + p * sin_hf > 0.0
+    return mask
+
+
+# cache=True writes the compiled kernel next to this file, so the compile cost is
+# paid once rather than on every editor session.
+_cull_jit = njit(cache=True, parallel=True, fastmath=True)(_cull_kernel) if njit is not None and np is not None else None
+
+
+def _cull_numba(origins, extents, cam, fwd, cos_hf, sin_hf, near, far):
+    mask = _cull_jit(
+        np.asarray(origins, dtype=np.float64).reshape(-1, 3),
+        np.asarray(extents, dtype=np.float64).reshape(-1, 3),
+        np.asarray(cam, dtype=np.float64),
+        np.asarray(fwd, dtype=np.float64),
+        float(cos_hf), float(sin_hf), float(near), float(far)
+    )
+    return mask.tolist()
+
+
+def _cull_python(origins, extents, cam, fwd, cos_hf, sin_hf, near, far):
+    cx, cy, cz = cam
+    fx, fy, fz = fwd
+    mask = []
+    for (ox, oy, oz), (ex, ey, ez) in zip(origins, extents):
+        vx, vy, vz = ox - cx, oy - cy, oz - cz
+        d2 = vx * vx + vy * vy + vz * vz
+        d = math.sqrt(d2)
+        r = math.sqrt(ex * ex + ey * ey + ez * ez)
+        if d + r < near or d - r > far:
+            mask.append(False)
+        elif d <= r:
+            mask.append(True)
+        else:
+            c = vx * fx + vy * fy + vz * fz
+            p = math.sqrt(max(d2 - c * c, 0.0))
+            mask.append(p * cos_hf - c * sin_hf <= r and c * cos_hf + p * sin_hf > 0.0)
+    return mask
+
+
+def cull_spheres(origins, extents, cam, fwd, half_fov, near=0.0, far=float("inf")) -> list:
+    """
+    Returns one bool per bounding box (origin, half-extent): True if its bounding sphere
+    (radius = |extent|) can intersect the view cone of half-angle half_fov (radians, below
+    pi/2) looking along the unit vector fwd from cam, between the near and far planes.
+    """
+    if not origins:
+        return []
+    cos_hf, sin_hf = math.cos(half_fov), math.sin(half_fov)
+    if _cull_jit is not None:
+        return _cull_numba(origins, extents, cam, fwd, cos_hf, sin_hf, near, far)
+    if np is not None:
+        return _cull_numpy(origins, extents, cam, fwd, cos_hf, sin_hf, near, far)
+    return _cull_python(origins, extents, cam, fwd, cos_hf, sin_hf, near, far)
@@ -1,9 +1,30 @@
 # Copyright (c) 2025 GenOrca. All Rights Reserved.
 
 import unreal
-import json
+import os
 import traceback
 
+# Tracebacks are only included in error responses when UE_MCP_DEBUG=1.
+_DEBUG = os.environ.get("UE_MCP_DEBUG") == "1"
+
+# Asset paths whose save is deferred until ue_flush_saves(), so a batch of
+# input edits hits the disk once. Looked up from globals() so the queue
+# survives the dispatcher's importlib.reload() of this module.
+_pending_saves = globals().get("_pending_saves", set())
+
+
+def _ok(**kw):
+    """Build a success response dict. Serialized once by the dispatcher."""
+    return {"success": True, **kw}
+
+
+def _err(message, tb=None, **kw):
+    """Build a failure response dict, optionally carrying a traceback."""
+    result = {"success": False, "message": message, **kw}
+    if tb is not None:
+        result["traceback"] = tb
+    return result
+
 
 def _split_asset_path(asset_path):
     """Split '/Game/Input/IA_Jump' into ('/Game/Input', 'IA_Jump')."""
@@ -13,16 +34,66 @@ def _split_asset_path(asset_path):
     return '/Game', asset_path
 
 
-def ue_set_game_mode(game_mode_class_path: str = None) -> str:
+def _resolve_value_types():
+    """
+    Resolves InputActionValueType members and the InputAction property that holds
+    them once, so ue_add_input_action doesn't probe enum/property spellings per call.
+    Returns ({lowercase name: enum member}, (property names to try)).
+    """
+    value_types = {}
+    enum_cls = getattr(unreal, "InputActionValueType", None)
+    if enum_cls is not None:
+        for name in ("Bool", "Axis1D", "Axis2D", "Axis3D"):
+            for candidate in (name.upper(), name, name.lower()):
+                member = getattr(enum_cls, candidate, None)
+                if member is not None:
+                    value_types[name.lower()] = member
+                    break
+
+    props = ('value_type', 'ValueType')
+    ia_cls = getattr(unreal, "InputAction", None)
+    if ia_cls is not None:
+        try:
+            cdo = ia_cls.get_default_object()
+            for prop_name in props:
+                try:
+                    cdo.get_editor_property(prop_name)
+                    props = (prop_name,)
+                    break
+                except Exception:
+                    pass
+        except Exception:
+            pass
+    return value_types, props
+
+
+# Empty when the Enhanced Input plugin is disabled; ue_add_input_action then
+# falls back to Bool with a warning, as before.
+_VALUE_TYPE_MAP, _VALUE_TYPE_PROPS = _resolve_value_types()
+
+
+def flush_pending_saves():
+    """Saves every queued asset once and clears the queue. Returns (saved, failed) path lists."""
+    saved, failed = [], []
+    for path in sorted(_pending_saves):
+        if unreal.EditorAssetLibrary.save_asset(path):
+            saved.append(path)
+        else:
+            failed.append(path)
+    _pending_saves.clear()
+    return saved, failed
+
+
+def ue_set_game_mode(game_mode_class_path: str = None) -> dict:
     """Sets the GameMode Override on the current level's World Settings."""
     try:
         world = unreal.EditorLevelLibrary.get_editor_world()
         if world is None:
-            return json.dumps({"success": False, "message": "No editor world available."})
+            return _err("No editor world available.")
 
         world_settings = world.get_world_settings()
         if world_settings is None:
-            return json.dumps({"success": False, "message": "Could not get WorldSettings."})
+            return _err("Could not get WorldSettings.")
 
         GAME_MODE_PROPS = ['default_game_mode', 'game_mode_override', 'GameModeOverride']
 
@@ -38,25 +109,17 @@ def ue_set_game_mode(game_mode_class_path: str = None) -> str:
                     pass
 
             if not set_ok:
-                return json.dumps({
-                    "success": False,
-                    "message": "Failed to clear GameMode. Property name may differ in this UE version."
-                })
+                return _err("Failed to clear GameMode. Property name may differ in this UE version.")
 
-            return json.dumps({
-                "success": True,
-                "message": "GameMode cleared.",
-                "game_mode": None
-            })
+            return _ok(message="GameMode cleared.", game_mode=None)
 
         # Load the class
         loaded_class = unreal.load_class(None, game_mode_class_path)
         if loaded_class is None:
-            return json.dumps({
-                "success": False,
-                "message": f"Could not load class: {game_mode_class_path}. "
-                           "Ensure the path is correct (Blueprint paths need '_C' suffix)."
-            })
+            return _err(
+                f"Could not load class: {game_mode_class_path}. "
+                "Ensure the path is correct (Blueprint paths need '_C' suffix)."
+            )
 
         # Set the GameMode
         set_ok = False
@@ -71,10 +134,7 @@ def ue_set_game_mode(game_mode_class_path: str = None) -> str:
                 pass
 
         if not set_ok:
-            return json.dumps({
-                "success": False,
-                "message": "Failed to set GameMode. Property name may differ in this UE version."
-            })
+            return _err("Failed to set GameMode. Property name may differ in this UE version.")
 
         # Verify
         verified_name = None
@@ -85,26 +145,25 @@ def ue_set_game_mode(game_mode_class_path: str = None) -> str:
         except Exception:
             pass
 
-        return json.dumps({
-            "success": True,
-            "message": f"GameMode set to '{game_mode_class_path}'.",
-            "game_mode": game_mode_class_path,
-            "verified_class_name": verified_name
-        })
+        return _ok(
+            message=f"GameMode set to '{game_mode_class_path}'.",
+            game_mode=game_mode_class_path,
+            verified_class_name=verified_name
+        )
     except Exception as e:
         tb_str = traceback.format_exc()
         unreal.log_error(f"Error in ue_set_game_mode: {str(e)}\n{tb_str}")
-        return json.dumps({"success": False, "message": str(e), "traceback": tb_str})
+        return _err(str(e), tb_str if _DEBUG else None)
 
 
-def ue_add_input_action(asset_path: str = None, value_type: str = "Bool") -> str:
+def ue_add_input_action(asset_path: str = None, value_type: str = "Bool") -> dict:
     """Creates a new Enhanced Input Action asset."""
     if asset_path is None:
-        return json.dumps({"success": False, "message": "Required parameter 'asset_path' is missing."})
+        return _err("Required parameter 'asset_path' is missing.")
 
     try:
         if unreal.EditorAssetLibrary.does_asset_exist(asset_path):
-            return json.dumps({"success": False, "message": f"Asset already exists at '{asset_path}'."})
+            return _err(f"Asset already exists at '{asset_path}'.")
 
         package_path, asset_name = _split_asset_path(asset_path)
         asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
@@ -127,29 +186,24 @@ def ue_add_input_action(asset_path: str = None, value_type: str = "Bool") -> str
                 pass
 
         if ia is None:
-            return json.dumps({
-                "success": False,
-                "message": f"Failed to create InputAction at '{asset_path}'. "
-                           "Enhanced Input plugin may not be enabled or InputAction "
-                           "class may not be accessible via Python."
-            })
+            return _err(
+                f"Failed to create InputAction at '{asset_path}'. "
+                "Enhanced Input plugin may not be enabled or InputAction "
+                "class may not be accessible via Python."
+            )
 
         # Set value type if not default Bool
         if value_type and value_type != "Bool":
             type_set = False
-            # Try multiple approaches to set value type
-            for prop_name in ['value_type', 'ValueType']:
-                for enum_name in [value_type.upper(), value_type, value_type.lower()]:
+            enum_val = _VALUE_TYPE_MAP.get(value_type.lower())
+            if enum_val is not None:
+                for prop_name in _VALUE_TYPE_PROPS:
                     try:
-                        enum_val = getattr(unreal.InputActionValueType, enum_name, None)
-                        if enum_val is not None:
-                            ia.set_editor_property(prop_name, enum_val)
-                            type_set = True
-                            break
+                        ia.set_editor_property(prop_name, enum_val)
+                        type_set = True
+                        break
                     except Exception:
                         pass
-                if type_set:
-                    break
 
             if not type_set:
                 unreal.log_warning(
@@ -157,30 +211,30 @@ def ue_add_input_action(asset_path: str = None, value_type: str = "Bool") -> str
                     "Defaulting to Bool."
                 )
 
-        unreal.EditorAssetLibrary.save_asset(ia.get_path_name())
+        _pending_saves.add(ia.get_path_name())
 
-        return json.dumps({
-            "success": True,
-            "asset_path": ia.get_path_name(),
-            "value_type": value_type,
-            "message": f"InputAction created at '{ia.get_path_name()}'."
-        })
+        return _ok(
+            asset_path=ia.get_path_name(),
+            value_type=value_type,
+            pending_save=True,
+            message=f"InputAction created at '{ia.get_path_name()}'. Call flush_saves to write it to disk."
+        )
     except Exception as e:
         tb_str = traceback.format_exc()
         unreal.log_error(f"Error in ue_add_input_action: {str(e)}\n{tb_str}")
-        return json.dumps({"success": False, "message": str(e), "traceback": tb_str})
+        return _err(str(e), tb_str if _DEBUG else None)
 
 
 def ue_add_input_mapping(mapping_context_path: str = None,
                          action_path: str = None,
-                         key_name: str = None) -> str:
+                         key_name: str = None) -> dict:
     """Creates/updates an InputMappingContext with a key-to-action mapping."""
     if mapping_context_path is None:
-        return json.dumps({"success": False, "message": "Required parameter 'mapping_context_path' is missing."})
+        return _err("Required parameter 'mapping_context_path' is missing.")
     if action_path is None:
-        return json.dumps({"success": False, "message": "Required parameter 'action_path' is missing."})
+        return _err("Required parameter 'action_path' is missing.")
     if key_name is None:
-        return json.dumps({"success": False, "message": "Required parameter 'key_name' is missing."})
+        return _err("Required parameter 'key_name' is missing.")
 
     try:
         # Load or create the InputMappingContext
@@ -190,10 +244,7 @@ def ue_add_input_mapping(mapping_context_path: str = None,
         if unreal.EditorAssetLibrary.does_asset_exist(mapping_context_path):
             imc = unreal.EditorAssetLibrary.load_asset(mapping_context_path)
             if imc is None:
-                return json.dumps({
-                    "success": False,
-                    "message": f"Failed to load asset at '{mapping_context_path}'."
-                })
+                return _err(f"Failed to load asset at '{mapping_context_path}'.")
         else:
             # Create new IMC
             package_path, asset_name = _split_asset_path(mapping_context_path)
@@ -212,20 +263,16 @@ def ue_add_input_mapping(mapping_context_path: str = None,
                     pass
 
             if imc is None:
-                return json.dumps({
-                    "success": False,
-                    "message": f"Failed to create InputMappingContext at '{mapping_context_path}'. "
-                               "Enhanced Input plugin may not be enabled."
-                })
+                return _err(
+                    f"Failed to create InputMappingContext at '{mapping_context_path}'. "
+                    "Enhanced Input plugin may not be enabled."
+                )
             created_imc = True
 
         # Load the InputAction
         ia = unreal.EditorAssetLibrary.load_asset(action_path)
         if ia is None:
-            return json.dumps({
-                "success": False,
-                "message": f"InputAction not found at '{action_path}'."
-            })
+            return _err(f"InputAction not found at '{action_path}'.")
 
         # Create Key object (UE 5.7+: Key() takes no args, set key_name via property)
         key = unreal.Key()
@@ -233,65 +280,95 @@ def ue_add_input_mapping(mapping_context_path: str = None,
 
         mapping_added = False
 
-        # Construct EnhancedActionKeyMapping and append to mappings array
+        # Preferred: UInputMappingContext::MapKey appends on the C++ side,
+        # so the existing mappings array never round-trips through Python.
         try:
-            mapping = unreal.EnhancedActionKeyMapping()
-            for prop_name in ['action', 'Action']:
-                try:
-                    mapping.set_editor_property(prop_name, ia)
-                    break
-                except Exception:
-                    pass
-            for prop_name in ['key', 'Key']:
-                try:
-                    mapping.set_editor_property(prop_name, key)
-                    break
-                except Exception:
-                    pass
-
-            # Try DefaultKeyMappings first (UE 5.7+), then mappings as fallback
-            for mp in ['default_key_mappings', 'DefaultKeyMappings', 'mappings', 'Mappings']:
-                try:
-                    mappings = list(imc.get_editor_property(mp) or [])
-                    mappings.append(mapping)
-                    imc.set_editor_property(mp, mappings)
-                    mapping_added = True
-                    break
-                except Exception:
-                    pass
+            imc.modify()
+            imc.map_key(ia, key)
+            mapping_added = True
         except Exception:
             pass
 
+        # Fallback: construct EnhancedActionKeyMapping and append to mappings array
+        if not mapping_added:
+            try:
+                mapping = unreal.EnhancedActionKeyMapping()
+                for prop_name in ['action', 'Action']:
+                    try:
+                        mapping.set_editor_property(prop_name, ia)
+                        break
+                    except Exception:
+                        pass
+                for prop_name in ['key', 'Key']:
+                    try:
+                        mapping.set_editor_property(prop_name, key)
+                        break
+                    except Exception:
+                        pass
+
+                # Try DefaultKeyMappings first (UE 5.7+), then mappings as fallback
+                for mp in ['default_key_mappings', 'DefaultKeyMappings', 'mappings', 'Mappings']:
+                    try:
+                        mappings = imc.get_editor_property(mp)
+                        if mappings is None:
+                            mappings = unreal.Array(unreal.EnhancedActionKeyMapping)
+                        # Append to the returned unreal.Array directly instead of
+                        # copying it into a Python list first.
+                        mappings.append(mapping)
+                        imc.set_editor_property(mp, mappings)
+                        mapping_added = True
+                        break
+                    except Exception:
+                        pass
+            except Exception:
+                pass
+
         if not mapping_added:
             if created_imc:
-                unreal.EditorAssetLibrary.save_asset(imc.get_path_name())
-                return json.dumps({
-                    "success": False,
-                    "message": f"InputMappingContext created at '{imc.get_path_name()}' "
-                               f"but failed to add key mapping '{key_name}' -> '{action_path}'. "
-                               f"The Enhanced Input mapping API may not be fully exposed in Python. "
-                               f"Use execute_python tool to explore available methods on the IMC object.",
-                    "imc_created": True,
-                    "imc_path": imc.get_path_name()
-                })
-            return json.dumps({
-                "success": False,
-                "message": f"Failed to add key mapping '{key_name}' -> '{action_path}' "
-                           f"to '{mapping_context_path}'. "
-                           "The Enhanced Input mapping API may not be fully exposed in Python."
-            })
-
-        unreal.EditorAssetLibrary.save_asset(imc.get_path_name())
-
-        return json.dumps({
-            "success": True,
-            "mapping_context_path": imc.get_path_name(),
-            "action_path": action_path,
-            "key_name": key_name,
-            "imc_created": created_imc,
-            "message": f"Mapped '{key_name}' -> '{action_path}' in '{imc.get_path_name()}'."
-        })
+                _pending_saves.add(imc.get_path_name())
+                return _err(
+                    f"InputMappingContext created at '{imc.get_path_name()}' "
+                    f"but failed to add key mapping '{key_name}' -> '{action_path}'. "
+                    f"The Enhanced Input mapping API may not be fully exposed in Python. "
+                    f"Use execute_python tool to explore available methods on the IMC object.",
+                    imc_created=True,
+                    imc_path=imc.get_path_name()
+                )
+            return _err(
+                f"Failed to add key mapping '{key_name}' -> '{action_path}' "
+                f"to '{mapping_context_path}'. "
+                "The Enhanced Input mapping API may not be fully exposed in Python."
+            )
+
+        _pending_saves.add(imc.get_path_name())
+
+        return _ok(
+            mapping_context_path=imc.get_path_name(),
+            action_path=action_path,
+            key_name=key_name,
+            imc_created=created_imc,
+            pending_save=True,
+            message=f"Mapped '{key_name}' -> '{action_path}' in '{imc.get_path_name()}'. "
+                    "Call flush_saves to write it to disk."
+        )
     except Exception as e:
         tb_str = traceback.format_exc()
         unreal.log_error(f"Error in ue_add_input_mapping: {str(e)}\n{tb_str}")
-        return json.dumps({"success": False, "message": str(e), "traceback": tb_str})
+        return _err(str(e), tb_str if _DEBUG else None)
+
+
+def ue_flush_saves() -> dict:
+    """Saves all input assets queued by previous game actions in one pass."""
+    try:
+        saved, failed = flush_pending_saves()
+        if failed:
+            return _err(
+                f"Failed to save {len(failed)} of {len(saved) + len(failed)} queued assets.",
+                saved_assets=saved,
+                failed_assets=failed
+            )
+        return _ok(saved_assets=saved, message=f"Saved {len(saved)} queued assets.")
+    except Exception as e:
+        tb_str = traceback.format_exc()
+        unreal.log_error(f"Error in ue_flush_saves: {str(e)}\n{tb_str}")
+        return _err(str(e), tb_str if _DEBUG else None)
@@ -4,53 +4,315 @@
 Defines Python action functions for material editing to be executed within Unreal Engine.
 """
 import unreal
-import json
-import traceback
+import os
+from collections import OrderedDict
 from typing import Optional
 
+# Tracebacks are only included in error responses when UE_MCP_DEBUG=1.
+_DEBUG = os.environ.get("UE_MCP_DEBUG") == "1"
+
+def _tb():
+    """Traceback for an error response, or None unless UE_MCP_DEBUG=1; traceback is imported only then."""
+    if not _DEBUG:
+        return None
+    import traceback
+    return traceback.format_exc()
+
+# Base class for every material node; resolved once instead of per lookup.
+_MATERIAL_EXPRESSION_BASE = unreal.MaterialExpression
+
+# Editor libraries and helpers bound once, so calls skip the attribute walk on 'unreal'.
+_EAL = unreal.EditorAssetLibrary
+_MEL = unreal.MaterialEditingLibrary
+_Transaction = unreal.ScopedEditorTransaction
+_is_valid = unreal.SystemLibrary.is_valid
+
+
+def _mk_missing(name: str) -> dict:
+    """Builds the constant error response returned when a required parameter is missing."""
+    return {"success": False, "message": f"Required parameter '{name}' is missing."}
+
+# Missing-parameter responses are static, so they are built once at import and
+# serialized by the dispatcher like every other response dict. Actions return a
+# copy (dict(_ERR_...)), so a caller mutating a response can't alter later ones.
+_ERR_MISSING_EXPRESSION_CLASS_NAME = _mk_missing("expression_class_name")
+_ERR_MISSING_FROM_EXPRESSION_IDENTIFIER = _mk_missing("from_expression_identifier")
+_ERR_MISSING_FROM_OUTPUT_NAME = _mk_missing("from_output_name")
+_ERR_MISSING_INSTANCE_PATH = _mk_missing("instance_path")
+_ERR_MISSING_MATERIAL_PATH = _mk_missing("material_path")
+_ERR_MISSING_PARAMETER_NAME = _mk_missing("parameter_name")
+_ERR_MISSING_TO_EXPRESSION_IDENTIFIER = _mk_missing("to_expression_identifier")
+_ERR_MISSING_TO_INPUT_NAME = _mk_missing("to_input_name")
+_ERR_MISSING_VALUE = _mk_missing("value")
+
+# Loaded Material/MaterialInstanceConstant assets keyed by the requested path, in
+# least-recently-used order. Looked up from globals() so the cache survives the
+# dispatcher's importlib.reload() of this module; entries are re-validated on every
+# hit. UObject proxies cannot be weakly referenced, so the strong references are
+# bounded instead: past _ASSET_CACHE_SIZE the oldest entry is evicted.
+_ASSET_CACHE_SIZE = 64
+_asset_cache = globals().get("_asset_cache")
+if not isinstance(_asset_cache, OrderedDict):
+    _asset_cache = OrderedDict(_asset_cache or {})
+
+# Parameter name sets keyed by (instance_path, kind), kept across reloads the
+# same way. Setting a value never changes the names, so entries are dropped when
+# a parent graph may have gained parameters through these tools (new expression,
+# recompile) or when the asset cache is cleared. Parameters added, or parents
+# changed, in the editor are picked up by _param_names_with re-querying on a miss.
+_param_name_cache = globals().get("_param_name_cache", {})
+
+# Paths of edited assets whose save was deferred (save_immediate=False) until
+# ue_flush_saves(), so a batch of edits writes each .uasset once.
+_pending_saves = globals().get("_pending_saves", set())
+
+# (graph signature, .uasset mtime_ns) of each material at its last recompile through
+# these tools, keyed by material path; lets ue_recompile skip materials that have not
+# changed. Edits made through these tools drop the entry; the file stamp is recorded
+# by the save that follows the recompile (None until then, which never skips).
+_compiled_signatures = globals().get("_compiled_signatures", {})
+
+# unreal.Name objects for parameter names seen so far; names are immutable,
+# so entries never go stale.
+_NAME_CACHE = globals().get("_NAME_CACHE", {})
+
+# Per-material expression lookup indexes keyed by material path; see
+# _build_expression_index. Reload-safe like the caches above.
+_expr_index = globals().get("_expr_index", {})
+
+# MaterialExpression classes keyed by the name a caller asked for (with or without
+# the prefix). Classes on the 'unreal' module never change, so this is reload-safe
+# like the caches above and is never cleared; failed lookups are not stored.
+_expression_classes = globals().get("_expression_classes", {})
+
+_PARAM_NAME_GETTERS = {
+    "scalar": "get_scalar_parameter_names",
+    "vector": "get_vector_parameter_names",
+    "texture": "get_texture_parameter_names",
+    "static_switch": "get_static_switch_parameter_names",
+}
+
+# MaterialInstance properties listing the parameters overridden on the instance itself.
+# Static switch overrides are not readable from Python, so they are never treated as
+# overridden and only_if_changed always writes them.
+_PARAM_OVERRIDE_PROPERTIES = {
+    "scalar": "scalar_parameter_values",
+    "vector": "vector_parameter_values",
+    "texture": "texture_parameter_values",
+}
+
 # --- Helper Functions for Material Editing ---
 
+def _uname(name: str):
+    """Returns a cached unreal.Name for name, so repeated parameter names skip the FName table lookup."""
+    uname = _NAME_CACHE.get(name)
+    if uname is None:
+        uname = unreal.Name(name)
+        _NAME_CACHE[name] = uname
+    return uname
+
+def _asset_data_class_name(asset_data) -> Optional[str]:
+    """Class name recorded in the asset registry (asset_class_path on UE 5.1+, asset_class before)."""
+    class_path = getattr(asset_data, 'asset_class_path', None)
+    if class_path is not None:
+        return str(class_path.asset_name)
+    asset_class = getattr(asset_data, 'asset_class', None)
+    return str(asset_class) if asset_class else None
+
+def _load_cached_asset(asset_path: str, expected_class, kind: str):
+    """
+    Returns the asset at asset_path, loading it only on a cache miss.
+    Stale entries (deleted/garbage-collected objects, or a different asset now
+    living at the path) are dropped and reloaded.
+    """
+    cached = _asset_cache.get(asset_path)
+    if cached is not None:
+        if _is_valid(cached) and isinstance(cached, expected_class):
+            _asset_cache.move_to_end(asset_path)
+            return cached
+        del _asset_cache[asset_path]
+
+    # Reject missing or wrong-type paths from the asset registry before paying for a package load.
+    asset_data = _EAL.find_asset_data(asset_path)
+    if not asset_data or not asset_data.is_valid():
+        raise FileNotFoundError(f"{kind} asset not found at path: {asset_path}")
+    # Subclasses (e.g. LandscapeMaterialInstanceConstant) are accepted; a class name that
+    # does not resolve on the unreal module is left to the isinstance check after loading.
+    class_name = _asset_data_class_name(asset_data)
+    registry_class = getattr(unreal, class_name, None) if class_name else None
+    if isinstance(registry_class, type) and not issubclass(registry_class, expected_class):
+        raise TypeError(f"Asset at {asset_path} is not a {expected_class.__name__}, but {class_name}")
+
+    asset = _EAL.load_asset(asset_path)
+    if not asset:
+        raise FileNotFoundError(f"{kind} asset not found at path: {asset_path}")
+    if not isinstance(asset, expected_class):
+        raise TypeError(f"Asset at {asset_path} is not a {expected_class.__name__}, but {type(asset).__name__}")
+    _asset_cache[asset_path] = asset
+    if len(_asset_cache) > _ASSET_CACHE_SIZE:
+        _asset_cache.popitem(last=False)
+    return asset
+
 def _get_material_asset(material_path: str):
     """Helper to load a material asset."""
     if not material_path:
         raise ValueError("Material path cannot be empty.")
-    material = unreal.EditorAssetLibrary.load_asset(material_path)
-    if not material:
-        raise FileNotFoundError(f"Material asset not found at path: {material_path}")
-    if not isinstance(material, unreal.Material):
-        raise TypeError(f"Asset at {material_path} is not a Material, but {type(material).__name__}")
-    return material
+    return _load_cached_asset(material_path, unreal.Material, "Material")
 
 def _get_material_instance_asset(instance_path: str):
     """Helper to load a material instance constant asset."""
     if not instance_path:
         raise ValueError("Material instance path cannot be empty.")
-    instance = unreal.EditorAssetLibrary.load_asset(instance_path)
-    if not instance:
-        raise FileNotFoundError(f"Material instance asset not found at path: {instance_path}")
-    if not isinstance(instance, unreal.MaterialInstanceConstant):
-        raise TypeError(f"Asset at {instance_path} is not a MaterialInstanceConstant, but {type(instance).__name__}")
-    return instance
-
-def _get_expression_class(class_name: str):
-    """Helper to get an Unreal MaterialExpression class by name."""
+    return _load_cached_asset(instance_path, unreal.MaterialInstanceConstant, "Material instance")
+
+def _save_asset(asset, save_immediate: bool = True):
+    """Saves the asset now, or queues it for ue_flush_saves() when save_immediate is False."""
+    path = asset.get_path_name()
+    if save_immediate:
+        _EAL.save_loaded_asset(asset)
+        _pending_saves.discard(path)
+        compiled = _compiled_signatures.get(path)
+        if compiled is not None:
+            _compiled_signatures[path] = (compiled[0], _package_file_stamp(asset))
+    else:
+        _pending_saves.add(path)
+
+def _to_linear_color(value):
+    """Converts any length-4 sequence [R, G, B, A] to a LinearColor; the constructor coerces the components."""
     try:
-        # Common prefix for many material expressions if not found directly
-        if not hasattr(unreal, class_name) and not class_name.startswith("MaterialExpression"):
-            full_class_name = f"MaterialExpression{class_name}"
-        else:
-            full_class_name = class_name
-        
-        expression_class = getattr(unreal, full_class_name)
-        if not issubclass(expression_class, unreal.MaterialExpression):
-            raise TypeError(f"{full_class_name} is not a MaterialExpression class.")
-        return expression_class
-    except AttributeError:
+        r, g, b, a = value
+    except (ValueError, TypeError):
+        raise ValueError("Vector value must be a sequence of 4 floats [R, G, B, A].")
+    return unreal.LinearColor(r, g, b, a)
+
+def _unchanged_response(instance_path: str, parameter_name: str, value) -> dict:
+    """Response for an only_if_changed set whose value already matched; nothing was touched."""
+    return {
+        "success": True,
+        "message": f"Parameter '{parameter_name}' on '{instance_path}' already has this value; nothing changed.",
+        "instance_path": instance_path,
+        "parameter_name": parameter_name,
+        "new_value": value,
+        "changed": False
+    }
+
+def _is_overridden(instance, kind: str, parameter_name: str) -> bool:
+    """
+    True if the instance overrides the parameter itself rather than inheriting it from its
+    parent; False when that can't be determined.
+    """
+    prop = _PARAM_OVERRIDE_PROPERTIES.get(kind)
+    if prop is None:
+        return False
+    try:
+        overrides = instance.get_editor_property(prop)
+    except Exception:
+        return False
+    return any(str(entry.parameter_info.name) == parameter_name for entry in overrides)
+
+def _get_param_names(instance_path: str, kind: str, refresh: bool = False) -> dict:
+    """
+    Returns the instance's parameter names of the given kind as an insertion-ordered
+    {name: None} dict (O(1) membership, list() keeps editor order), querying the
+    editor only on a cache miss or when refresh is set.
+    """
+    key = (instance_path, kind)
+    names = None if refresh else _param_name_cache.get(key)
+    if names is None:
+        instance = _get_material_instance_asset(instance_path)
+        getter = getattr(_MEL, _PARAM_NAME_GETTERS[kind])
+        names = dict.fromkeys(str(name) for name in getter(instance))
+        _param_name_cache[key] = names
+    return names
+
+def _param_names_with(instance_path: str, kind: str, parameter_name: str) -> dict:
+    """
+    Like _get_param_names, but a cached set that lacks parameter_name is re-read once
+    from the editor, since it may predate an edit made outside these tools.
+    """
+    names = _get_param_names(instance_path, kind)
+    if parameter_name not in names:
+        names = _get_param_names(instance_path, kind, refresh=True)
+    return names
+
+def _resolve_expression_class(class_name: str):
+    """Looks up a MaterialExpression class on the 'unreal' module, trying the name as given first."""
+    full_class_name = class_name
+    expression_class = getattr(unreal, class_name, None)
+    # Common prefix for many material expressions if not found directly
+    if expression_class is None and not class_name.startswith("MaterialExpression"):
+        full_class_name = f"MaterialExpression{class_name}"
+        expression_class = getattr(unreal, full_class_name, None)
+    if expression_class is None:
         raise ValueError(f"MaterialExpression class like '{class_name}' or '{full_class_name}' not found in 'unreal' module.")
+    if not isinstance(expression_class, type) or not issubclass(expression_class, _MATERIAL_EXPRESSION_BASE):
+        raise TypeError(f"{full_class_name} is not a MaterialExpression class.")
+    return expression_class
+
+def _get_expression_class(class_name: str):
+    """Helper to get an Unreal MaterialExpression class by name; a hit is one dict probe."""
+    expression_class = _expression_classes.get(class_name)
+    if expression_class is None:
+        expression_class = _expression_classes[class_name] = _resolve_expression_class(class_name)
+    return expression_class
+
+def _get_material_expressions(material: unreal.Material):
+    """Returns the expressions owned by a material, without walking every UObject in the editor."""
+    get_expressions = getattr(_MEL, 'get_material_expressions', None)
+    if get_expressions is not None:
+        return get_expressions(material)
+    # Older engine versions only expose the array as an editor property.
+    return material.get_editor_property('expressions') or []
+
+def _index_expression(index: dict, expression):
+    """Adds one expression to a material's lookup index (see _build_expression_index)."""
+    desc = getattr(expression, 'desc', None)
+    if desc:
+        index["desc"].setdefault(desc, []).append(expression)
+    index["name"].setdefault(expression.get_name(), expression)
+    index["class"].setdefault(type(expression).__name__, []).append(expression)
+    for cls, bucket in index["subclass"].items():
+        if isinstance(expression, cls):
+            bucket.append(expression)
+    index["all"].append(expression)
+
+def _build_expression_index(material: unreal.Material) -> dict:
+    """
+    Scans the material once and caches {desc: [exprs], name: expr, class name: [exprs]} for it.
+    "subclass" buckets ({class: [exprs]}) are filled lazily by class lookups that have no
+    exact-type match.
+    """
+    index = {"desc": {}, "name": {}, "class": {}, "subclass": {}, "all": []}
+    for x in _get_material_expressions(material):
+        _index_expression(index, x)
+    _expr_index[material.get_path_name()] = index
+    return index
+
+def _lookup_indexed_expression(index: dict, expression_identifier: str, target_class, match_by_class: bool):
+    """Applies the desc -> class -> name priority to an expression index. Returns None on a miss."""
+    for x in index["desc"].get(expression_identifier, ()):
+        if target_class is None or isinstance(x, target_class):
+            return x
+    if match_by_class:
+        candidates = index["class"].get(target_class.__name__)
+        if not candidates:
+            # Only subclasses of target_class can match; scan for them once per index.
+            candidates = index["subclass"].get(target_class)
+            if candidates is None:
+                candidates = [x for x in index["all"] if isinstance(x, target_class)]
+                index["subclass"][target_class] = candidates
+        if candidates:
+            return candidates[0]
+    x = index["name"].get(expression_identifier)
+    if x is not None and (target_class is None or isinstance(x, target_class)):
+        return x
+    return None
 
 def _find_material_expression_by_name_or_type(material: unreal.Material, expression_identifier: str, expression_class_name: str = None):
     """
     Finds a material expression within a material by its description (name) or by its class type.
+    Matches on description first, then on class (when the identifier names the class), then on object name.
+    Lookups go through a per-material index; a miss or a stale hit rescans the material once.
     """
     
     if not material or not isinstance(material, unreal.Material):
@@ -63,71 +325,155 @@ def _find_material_expression_by_name_or_type(material: unreal.Material, express
         except (ValueError, TypeError):
             pass 
 
-    it = unreal.ObjectIterator()
-    for x in it:
-        if isinstance(x, unreal.MaterialExpression) and x.get_path_name().startswith(material.get_path_name()):
-            if hasattr(x, 'desc') and x.desc == expression_identifier:
-                if target_class and not isinstance(x, target_class):
-                    continue 
-                return x
-            
-            if target_class and isinstance(x, target_class):
-                if expression_identifier == expression_class_name or expression_identifier == target_class.__name__:
-                    return x
+    match_by_class = target_class is not None and expression_identifier in (expression_class_name, target_class.__name__)
 
-            if expression_identifier == x.get_name():
-                if target_class and not isinstance(x, target_class):
-                    continue 
-                return x
+    index = _expr_index.get(material.get_path_name())
+    if index is not None:
+        found = _lookup_indexed_expression(index, expression_identifier, target_class, match_by_class)
+        # Reject hits on nodes deleted or renamed since they were indexed.
+        if found is not None and _is_valid(found) and (
+                match_by_class or expression_identifier in (getattr(found, 'desc', None), found.get_name())):
+            return found
+
+    # Not indexed yet, or the graph changed outside these tools: rescan once.
+    index = _build_expression_index(material)
+    found = _lookup_indexed_expression(index, expression_identifier, target_class, match_by_class)
+    if found is not None:
+        return found
 
     raise ValueError(f"MaterialExpression identified by '{expression_identifier}' (intended class: {expression_class_name or 'any'}) not found in material '{material.get_path_name()}'.")
     
+def _graph_signature(material: unreal.Material) -> tuple:
+    """Cheap fingerprint of a material graph: its expression count and expression names."""
+    expressions = _get_material_expressions(material)
+    return (len(expressions), tuple(sorted(x.get_name() for x in expressions)))
+
+def _package_file_stamp(asset):
+    """mtime_ns of the asset's package file, or None if it has no file on disk."""
+    try:
+        return os.stat(unreal.SystemLibrary.get_system_path(asset)).st_mtime_ns
+    except OSError:
+        return None
+
+def _is_package_dirty(asset) -> bool:
+    """True if the asset's package has unsaved changes (e.g. an edit applied in the material editor)."""
+    package_name = asset.get_outermost().get_path_name()
+    return any(package.get_path_name() == package_name
+               for package in unreal.EditorLoadingAndSavingUtils.get_dirty_content_packages())
+
+def _is_unchanged_since_compile(material) -> bool:
+    """
+    True only if this module recompiled the material, has not edited it since, and
+    nothing else has either: same graph signature, package not dirty, and its file
+    not rewritten since the save that followed the recompile.
+    """
+    compiled = _compiled_signatures.get(material.get_path_name())
+    if compiled is None or compiled[1] is None:
+        return False
+    signature, stamp = compiled
+    return (not _is_package_dirty(material)
+            and stamp == _package_file_stamp(material)
+            and signature == _graph_signature(material))
+
+def _recompile_material(material):
+    """Recompiles a material and records its graph signature for ue_recompile."""
+    _MEL.recompile_material(material)
+    _param_name_cache.clear()
+    if isinstance(material, unreal.Material):
+        _compiled_signatures[material.get_path_name()] = (_graph_signature(material), None)
+
+def _create_expression(material: unreal.Material, expression_class_name: str, node_pos_x: int = 0, node_pos_y: int = 0, desc: str = None):
+    """
+    Creates an expression node in the material without recompiling or saving.
+    Raises RuntimeError if the engine refuses to create the node.
+    """
+    expression_class = _get_expression_class(expression_class_name)
+    new_expression = _MEL.create_material_expression(
+        material, expression_class, node_pos_x, node_pos_y
+    )
+    if not new_expression:
+        raise RuntimeError(f"Failed to create MaterialExpression '{expression_class_name}' in '{material.get_path_name()}'.")
+    # A new parameter node changes the name lists of every instance of this material.
+    _param_name_cache.clear()
+    _compiled_signatures.pop(material.get_path_name(), None)
+
+    if hasattr(new_expression, 'desc') and (desc or not new_expression.desc):
+        new_expression.desc = desc or expression_class_name
+
+    # Keep an existing lookup index current instead of forcing a rescan.
+    index = _expr_index.get(material.get_path_name())
+    if index is not None:
+        _index_expression(index, new_expression)
+    return new_expression
+
+def _connect_expressions(
+    material: unreal.Material,
+    from_expression_identifier: str,
+    from_output_name: str,
+    to_expression_identifier: str,
+    to_input_name: str,
+    from_expression_class_name: str = None,
+    to_expression_class_name: str = None
+):
+    """
+    Connects two expressions in the material without recompiling or saving.
+    Raises ValueError if either endpoint is missing or the pins are incompatible.
+    """
+    from_expression = _find_material_expression_by_name_or_type(material, from_expression_identifier, from_expression_class_name)
+    to_expression = _find_material_expression_by_name_or_type(material, to_expression_identifier, to_expression_class_name)
+
+    _compiled_signatures.pop(material.get_path_name(), None)
+    if not _MEL.connect_material_expressions(
+        from_expression, from_output_name, to_expression, to_input_name
+    ):
+        raise ValueError(f"Failed to connect '{from_expression_identifier}(Output: {from_output_name})' to '{to_expression_identifier}(Input: {to_input_name})' in '{material.get_path_name()}'. Check pin names and compatibility.")
+
+def _expression_info(expression) -> dict:
+    """Summarizes a material expression for JSON responses."""
+    return {
+        "expression_name": expression.get_name(),
+        "expression_desc": expression.desc if hasattr(expression, 'desc') else "N/A",
+        "expression_class": expression.__class__.__name__
+    }
+
 # --- Material Editing Actions ---
 
-def ue_create_expression(material_path: str = None, expression_class_name: str = None, node_pos_x: int = 0, node_pos_y: int = 0) -> str:
+def ue_create_expression(material_path: str = None, expression_class_name: str = None, node_pos_x: int = 0, node_pos_y: int = 0, defer_compile: bool = False) -> dict:
     """
     Creates a new material expression node within the supplied material.
-    Returns JSON string.
+    With defer_compile, the recompile and save are skipped so several edits can be
+    chained and finished with a single ue_recompile call. For building several nodes
+    at once, ue_create_graph is the fast path.
+    Returns a response dict.
     """
     if material_path is None:
-        return json.dumps({"success": False, "message": "Required parameter 'material_path' is missing."})
+        return dict(_ERR_MISSING_MATERIAL_PATH)
     if expression_class_name is None:
-        return json.dumps({"success": False, "message": "Required parameter 'expression_class_name' is missing."})
+        return dict(_ERR_MISSING_EXPRESSION_CLASS_NAME)
 
     transaction_description = "MCP: Create Material Expression"
     try:
         material = _get_material_asset(material_path)
-        expression_class = _get_expression_class(expression_class_name)
 
-        with unreal.ScopedEditorTransaction(transaction_description) as trans:
-            new_expression = unreal.MaterialEditingLibrary.create_material_expression(
-                material, expression_class, node_pos_x, node_pos_y
-            )
-            if not new_expression:
-                return json.dumps({
-                    "success": False,
-                    "message": f"Failed to create MaterialExpression '{expression_class_name}' in '{material_path}'."
-                })
-            
-            if hasattr(new_expression, 'desc') and not new_expression.desc:
-                new_expression.desc = expression_class_name 
+        with _Transaction(transaction_description) as trans:
+            new_expression = _create_expression(material, expression_class_name, node_pos_x, node_pos_y)
 
-            unreal.MaterialEditingLibrary.recompile_material(material)
-            unreal.EditorAssetLibrary.save_loaded_asset(material)
+            if not defer_compile:
+                _recompile_material(material)
+                _save_asset(material)
             
-            return json.dumps({
+            return {
                 "success": True,
                 "message": f"Successfully created MaterialExpression '{expression_class_name}' in '{material_path}'.",
-                "expression_name": new_expression.get_name(), 
-                "expression_desc": new_expression.desc if hasattr(new_expression, 'desc') else "N/A",
-                "expression_class": new_expression.__class__.__name__
-            })
+                "compiled": not defer_compile,
+                **_expression_info(new_expression)
+            }
     except Exception as e:
-        return json.dumps({
+        return {
             "success": False,
             "message": f"Error creating material expression: {str(e)}",
-            "traceback": traceback.format_exc()
-        })
+            "traceback": _tb()
+        }
 
 def ue_connect_expressions(
     material_path: str = None, 
@@ -136,396 +482,523 @@ def ue_connect_expressions(
     to_expression_identifier: str = None, 
     to_input_name: str = None,
     from_expression_class_name: str = None,
-    to_expression_class_name: str = None
-) -> str:
+    to_expression_class_name: str = None,
+    defer_compile: bool = False
+) -> dict:
     """
     Creates a connection between two material expressions.
-    Returns JSON string.
+    With defer_compile, the recompile and save are skipped (see ue_create_expression).
+    Returns a response dict.
     """
     if material_path is None:
-        return json.dumps({"success": False, "message": "Required parameter 'material_path' is missing."})
+        return dict(_ERR_MISSING_MATERIAL_PATH)
     if from_expression_identifier is None:
-        return json.dumps({"success": False, "message": "Required parameter 'from_expression_identifier' is missing."})
+        return dict(_ERR_MISSING_FROM_EXPRESSION_IDENTIFIER)
     if from_output_name is None:
-        return json.dumps({"success": False, "message": "Required parameter 'from_output_name' is missing."})
+        return dict(_ERR_MISSING_FROM_OUTPUT_NAME)
     if to_expression_identifier is None:
-        return json.dumps({"success": False, "message": "Required parameter 'to_expression_identifier' is missing."})
+        return dict(_ERR_MISSING_TO_EXPRESSION_IDENTIFIER)
     if to_input_name is None:
-        return json.dumps({"success": False, "message": "Required parameter 'to_input_name' is missing."})
+        return dict(_ERR_MISSING_TO_INPUT_NAME)
 
     transaction_description = "MCP: Connect Material Expressions"
     try:
         material = _get_material_asset(material_path)
-        
-        from_expression = _find_material_expression_by_name_or_type(material, from_expression_identifier, from_expression_class_name)
-        to_expression = _find_material_expression_by_name_or_type(material, to_expression_identifier, to_expression_class_name)
 
-        with unreal.ScopedEditorTransaction(transaction_description) as trans:
-            success = unreal.MaterialEditingLibrary.connect_material_expressions(
-                from_expression, from_output_name, to_expression, to_input_name
+        with _Transaction(transaction_description) as trans:
+            _connect_expressions(
+                material, from_expression_identifier, from_output_name,
+                to_expression_identifier, to_input_name,
+                from_expression_class_name, to_expression_class_name
             )
-            if not success:
-                return json.dumps({
-                    "success": False,
-                    "message": f"Failed to connect '{from_expression_identifier}(Output: {from_output_name})' to '{to_expression_identifier}(Input: {to_input_name})' in '{material_path}'. Check pin names and compatibility."
-                })
 
-            unreal.MaterialEditingLibrary.recompile_material(material)
-            unreal.EditorAssetLibrary.save_loaded_asset(material)
+            if not defer_compile:
+                _recompile_material(material)
+                _save_asset(material)
 
-            return json.dumps({
+            return {
                 "success": True,
-                "message": f"Successfully connected '{from_expression_identifier}(Output: {from_output_name})' to '{to_expression_identifier}(Input: {to_input_name})' in '{material_path}'."
-            })
+                "message": f"Successfully connected '{from_expression_identifier}(Output: {from_output_name})' to '{to_expression_identifier}(Input: {to_input_name})' in '{material_path}'.",
+                "compiled": not defer_compile
+            }
     except Exception as e:
-        return json.dumps({
+        return {
             "success": False,
             "message": f"Error connecting material expressions: {str(e)}",
-            "traceback": traceback.format_exc()
-        })
+            "traceback": _tb()
+        }
+
+def ue_create_graph(material_path: str = None, nodes: list = None, connections: list = None, save_immediate: bool = True) -> dict:
+    """
+    Creates several expression nodes and connections in one transaction, then
+    recompiles and saves the material once instead of once per edit.
+
+    :param nodes: List of {"expression_class_name", "node_pos_x"?, "node_pos_y"?, "desc"?}.
+                  Give each node a unique desc so connections can refer to it.
+    :param connections: List of {"from_expression_identifier", "from_output_name",
+                        "to_expression_identifier", "to_input_name",
+                        "from_expression_class_name"?, "to_expression_class_name"?}.
+    :param save_immediate: If False, the save is queued for ue_flush_saves.
+    Returns a response dict.
+    """
+    if material_path is None:
+        return dict(_ERR_MISSING_MATERIAL_PATH)
+    nodes = nodes or []
+    connections = connections or []
+    if not nodes and not connections:
+        # Nothing to edit, so there is nothing to recompile or save either.
+        return {"success": True, "message": "No nodes or connections given; material was not modified.", "created_expressions": [], "connections_made": 0}
+
+    created = []
+    connected = 0
+    try:
+        material = _get_material_asset(material_path)
 
-def ue_recompile(material_path: str = None) -> str:
+        with _Transaction(f"MCP: Create Material Graph ({len(nodes)} nodes, {len(connections)} connections)") as trans:
+            for node in nodes:
+                new_expression = _create_expression(
+                    material,
+                    node["expression_class_name"],
+                    int(node.get("node_pos_x", 0)),
+                    int(node.get("node_pos_y", 0)),
+                    node.get("desc")
+                )
+                created.append(_expression_info(new_expression))
+
+            for connection in connections:
+                _connect_expressions(
+                    material,
+                    connection["from_expression_identifier"],
+                    connection.get("from_output_name", ""),
+                    connection["to_expression_identifier"],
+                    connection.get("to_input_name", ""),
+                    connection.get("from_expression_class_name"),
+                    connection.get("to_expression_class_name")
+                )
+                connected += 1
+
+            _recompile_material(material)
+            _save_asset(material, save_immediate)
+
+        return {
+            "success": True,
+            "message": f"Created {len(created)} expressions and {connected} connections in '{material_path}'.",
+            "created_expressions": created,
+            "connections_made": connected,
+            "pending_save": not save_immediate
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "message": f"Error building material graph in '{material_path}': {str(e)}",
+            "created_expressions": created,
+            "connections_made": connected,
+            "traceback": _tb()
+        }
+
+def _recompile_plan_material(material, material_path: str, recompile_parent: bool):
+    return material, f"material '{material_path}'", None
+
+def _recompile_plan_instance(instance, material_path: str, recompile_parent: bool):
+    parent_material = instance.parent
+    if not parent_material:
+        _save_asset(instance)
+        return None, "", {
+            "success": True,
+            "message": f"Material instance '{material_path}' has no parent to recompile. Instance saved."
+        }
+    return parent_material, f"parent of material instance '{material_path}'", None
+
+def _recompile_plan_instance_constant(instance, material_path: str, recompile_parent: bool):
+    # Applies parameter edits made with defer_update, whether or not the parent is recompiled.
+    _MEL.update_material_instance(instance)
+    if recompile_parent:
+        return _recompile_plan_instance(instance, material_path, recompile_parent)
+    _save_asset(instance)
+    return None, "", {
+        "success": True,
+        "message": f"Successfully updated material instance '{material_path}' and saved it. Parent material was not recompiled."
+    }
+
+# Asset class -> handler returning (material to recompile, message detail, finished response).
+# Looked up along the asset's MRO, so the most specific class wins.
+_RECOMPILE_PLANS = {
+    unreal.Material: _recompile_plan_material,
+    unreal.MaterialInstanceConstant: _recompile_plan_instance_constant,
+    unreal.MaterialInstance: _recompile_plan_instance,
+}
+
+def ue_recompile(material_path: str = None, recompile_parent: bool = True, force: bool = False) -> dict:
     """
-    Triggers a recompile of a material or material instance's parent. Saves the asset.
-    Returns JSON string.
+    Triggers a recompile of a material, or of a material instance's parent. Saves the asset.
+    For a MaterialInstanceConstant, recompile_parent=False only runs update_material_instance
+    (enough after instance parameter edits) instead of recompiling the parent's shaders.
+    A material already recompiled by these tools is not recompiled again unless force is
+    set, as long as its graph signature matches, its package is not dirty and its file
+    has not been rewritten since; the asset is still saved. Manual edits need force.
+    Returns a response dict.
     """
     if material_path is None:
-        return json.dumps({"success": False, "message": "Required parameter 'material_path' is missing."})
+        return dict(_ERR_MISSING_MATERIAL_PATH)
+    message_detail = ""
     try:
-        asset_to_process = unreal.EditorAssetLibrary.load_asset(material_path)
-        if not asset_to_process:
+        if not _EAL.does_asset_exist(material_path):
+            raise FileNotFoundError(f"Asset not found at path: {material_path}")
+        asset_to_save = _EAL.load_asset(material_path)
+        if not asset_to_save:
             raise FileNotFoundError(f"Asset not found at path: {material_path}")
 
-        target_material_to_recompile = None
-        asset_to_save = asset_to_process
-        message_detail = ""
-
-        if isinstance(asset_to_process, unreal.Material):
-            target_material_to_recompile = asset_to_process
-            message_detail = f"material '{material_path}'"
-        elif isinstance(asset_to_process, unreal.MaterialInstance):
-            parent_material = asset_to_process.parent 
-            if parent_material: 
-                target_material_to_recompile = parent_material
-                message_detail = f"parent of material instance '{material_path}'"
-            else: 
-                 unreal.EditorAssetLibrary.save_loaded_asset(asset_to_process)
-                 return json.dumps({
-                    "success": True,
-                    "message": f"Material instance '{material_path}' has no parent to recompile. Instance saved."
-                 })
-        else:
-            raise TypeError(f"Asset at {material_path} is not a Material or MaterialInstance, but {type(asset_to_process).__name__}")
+        plan = next((_RECOMPILE_PLANS[cls] for cls in type(asset_to_save).__mro__ if cls in _RECOMPILE_PLANS), None)
+        if plan is None:
+            raise TypeError(f"Asset at {material_path} is not a Material or MaterialInstance, but {type(asset_to_save).__name__}")
+        target_material_to_recompile, message_detail, response = plan(asset_to_save, material_path, recompile_parent)
+        if response is not None:
+            return response
 
         if target_material_to_recompile:
-            unreal.MaterialEditingLibrary.recompile_material(target_material_to_recompile)
-            unreal.EditorAssetLibrary.save_loaded_asset(asset_to_save) 
+            if (not force and isinstance(target_material_to_recompile, unreal.Material)
+                    and _is_unchanged_since_compile(target_material_to_recompile)):
+                # Still save, so edits queued with save_immediate=False are not left behind.
+                _save_asset(asset_to_save)
+                return {
+                    "success": True,
+                    "message": f"{message_detail[:1].upper() + message_detail[1:]} is unchanged since its last recompile; recompile skipped, '{material_path}' saved. Pass force=True if it was edited by hand.",
+                    "no_recompile_needed": True
+                }
+            _recompile_material(target_material_to_recompile)
+            _save_asset(asset_to_save)
         
-        return json.dumps({
+        return {
             "success": True,
             "message": f"Successfully recompiled {message_detail} and saved '{material_path}'."
-        })
+        }
     except Exception as e:
-        return json.dumps({
+        return {
             "success": False,
             "message": f"Error processing {message_detail} '{material_path}' for recompile: {str(e)}",
-            "traceback": traceback.format_exc()
-        })
-
-def ue_get_mi_scalar_param(instance_path: str = None, parameter_name: str = None) -> str:
-    """
-    Gets the current scalar (float) parameter value from a Material Instance Constant.
-    Returns JSON string.
-    """
+            "traceback": _tb()
+        }
+
+# --- Material Instance Parameter Actions ---
+
+def _load_texture(texture_path: Optional[str]):
+    """Resolves a texture path for a texture parameter; empty clears the parameter."""
+    if not texture_path:
+        return None
+    # A registry probe turns a bad path into an immediate error instead of a failed package load.
+    if not _EAL.does_asset_exist(texture_path):
+        raise FileNotFoundError(f"Texture asset not found at path: {texture_path}")
+    texture_asset = _EAL.load_asset(texture_path)
+    if not texture_asset:
+        raise FileNotFoundError(f"Texture asset not found at path: {texture_path}")
+    if not isinstance(texture_asset, unreal.Texture):
+        raise TypeError(f"Asset at {texture_path} is not a Texture, but {type(texture_asset).__name__}")
+    return texture_asset
+
+def _same_color(a, b) -> bool:
+    return all(abs(x - y) < 1e-7 for x, y in ((a.r, b.r), (a.g, b.g), (a.b, b.b), (a.a, b.a)))
+
+# Everything that differs between the parameter kinds, bound once at import:
+# kind -> (label, getter, setter, convert input, to JSON, equality for only_if_changed).
+_PARAM_KINDS = {
+    "scalar": (
+        "Scalar",
+        lambda instance, name: instance.get_scalar_parameter_value(name),
+        _MEL.set_material_instance_scalar_parameter_value,
+        float,
+        lambda v: v,
+        lambda a, b: abs(a - b) < 1e-7,
+    ),
+    "vector": (
+        "Vector",
+        _MEL.get_material_instance_vector_parameter_value,
+        _MEL.set_material_instance_vector_parameter_value,
+        _to_linear_color,
+        lambda c: [c.r, c.g, c.b, c.a] if c is not None else None,
+        _same_color,
+    ),
+    "texture": (
+        "Texture",
+        _MEL.get_material_instance_texture_parameter_value,
+        _MEL.set_material_instance_texture_parameter_value,
+        _load_texture,
+        lambda t: t.get_path_name() if t else None,
+        lambda a, b: a == b,
+    ),
+    # Switch names are checked against the cached _get_param_names dict, so no
+    # static_switch_parameters array is walked from Python on get or set.
+    "static_switch": (
+        "Static switch",
+        _MEL.get_material_instance_static_switch_parameter_value,
+        _MEL.set_material_instance_static_switch_parameter_value,
+        bool,
+        bool,
+        lambda a, b: bool(a) == bool(b),
+    ),
+}
+
+def _get_param(kind: str, instance_path: str, parameter_name: str) -> dict:
+    """Shared body of the ue_get_mi_*_param actions."""
     if instance_path is None:
-        return json.dumps({"success": False, "message": "Required parameter 'instance_path' is missing."})
+        return dict(_ERR_MISSING_INSTANCE_PATH)
     if parameter_name is None:
-        return json.dumps({"success": False, "message": "Required parameter 'parameter_name' is missing."})
-    try:
-        instance = _get_material_instance_asset(instance_path)
-        ue_parameter_name = unreal.Name(parameter_name)
-        
-        param_value = instance.get_scalar_parameter_value(ue_parameter_name)
+        return dict(_ERR_MISSING_PARAMETER_NAME)
+    label, getter, _, _, to_json, _ = _PARAM_KINDS[kind]
 
-        if param_value is None:
-             return json.dumps({
-                "success": False, 
-                "message": f"Scalar parameter '{parameter_name}' not found in instance '{instance_path}'.",
+    try:
+        # Loads (and type-checks) the instance, so a bad path is reported as such below.
+        available_params = _param_names_with(instance_path, kind, parameter_name)
+        if parameter_name not in available_params:
+            return {
+                "success": False,
+                "message": f"{label} parameter '{parameter_name}' not found in instance '{instance_path}'.",
                 "parameter_name": parameter_name,
                 "instance_path": instance_path,
-                "value": None 
-            })
-        
-        return json.dumps({
+                "value": None,
+                "available_parameters": list(available_params)
+            }
+
+        instance = _get_material_instance_asset(instance_path)
+        param_value = getter(instance, _uname(parameter_name))
+        return {
             "success": True,
             "parameter_name": parameter_name,
-            "value": param_value,
+            "value": to_json(param_value),
             "instance_path": instance_path
-        })
+        }
     except Exception as e:
-        return json.dumps({
+        return {
             "success": False,
-            "message": f"Error getting scalar parameter '{parameter_name}' from '{instance_path}': {str(e)}",
-            "traceback": traceback.format_exc()
-        })
+            "message": f"Error getting {label.lower()} parameter '{parameter_name}' from '{instance_path}': {str(e)}",
+            "traceback": _tb()
+        }
 
-def ue_set_mi_scalar_param(instance_path: str = None, parameter_name: str = None, value: float = None) -> str:
+def _set_param(kind: str, instance_path: str, parameter_name: str, value, save_immediate: bool, only_if_changed: bool, defer_update: bool = False) -> dict:
     """
-    Sets the scalar (float) parameter value for a Material Instance Constant.
-    Returns JSON string.
+    Shared body of the ue_set_mi_*_param actions: validate, compare, set, update and save.
+    With defer_update, only the value is written; ue_recompile(recompile_parent=False) on the instance finishes the batch.
     """
     if instance_path is None:
-        return json.dumps({"success": False, "message": "Required parameter 'instance_path' is missing."})
+        return dict(_ERR_MISSING_INSTANCE_PATH)
     if parameter_name is None:
-        return json.dumps({"success": False, "message": "Required parameter 'parameter_name' is missing."})
-    if value is None:
-        return json.dumps({"success": False, "message": "Required parameter 'value' is missing."})
+        return dict(_ERR_MISSING_PARAMETER_NAME)
+    # A texture parameter is cleared by passing no texture.
+    if value is None and kind != "texture":
+        return dict(_ERR_MISSING_VALUE)
+    label, getter, setter, convert, to_json, same = _PARAM_KINDS[kind]
 
-    transaction_description = "MCP: Set Material Instance Scalar Parameter"
     try:
+        # Loads (and type-checks) the instance, so a bad path is reported as such below.
+        available_params = _param_names_with(instance_path, kind, parameter_name)
+        if parameter_name not in available_params:
+            return {
+                "success": False,
+                "message": f"{label} parameter '{parameter_name}' not found in instance '{instance_path}'.",
+                "available_parameters": list(available_params)
+            }
+
+        converted = convert(value)
         instance = _get_material_instance_asset(instance_path)
-        ue_parameter_name = unreal.Name(parameter_name)
-
-        with unreal.ScopedEditorTransaction(transaction_description) as trans:
-            unreal.MaterialEditingLibrary.set_material_instance_scalar_parameter_value(instance, ue_parameter_name, float(value))
-            unreal.MaterialEditingLibrary.update_material_instance(instance) 
-            unreal.EditorAssetLibrary.save_loaded_asset(instance)
-
-            return json.dumps({
-                "success": True,
-                "message": f"Successfully set scalar parameter '{parameter_name}' to {value} for instance '{instance_path}'.",
-                "instance_path": instance_path,
-                "parameter_name": parameter_name,
-                "new_value": value
-            })
+        ue_parameter_name = _uname(parameter_name)
+
+        if only_if_changed:
+            current = getter(instance, ue_parameter_name)
+            # The getter returns the effective value, which may be inherited from the parent;
+            # only an override on this instance already pins the value.
+            if ((current is not None or converted is None) and same(current, converted)
+                    and _is_overridden(instance, kind, parameter_name)):
+                return _unchanged_response(instance_path, parameter_name, to_json(converted))
+
+        with _Transaction(f"MCP: Set Material Instance {label} Parameter") as trans:
+            setter(instance, ue_parameter_name, converted)
+            if not defer_update:
+                _MEL.update_material_instance(instance)
+                _save_asset(instance, save_immediate)
+
+        return {
+            "success": True,
+            "message": f"{label} parameter '{parameter_name}' set for instance '{instance_path}'.",
+            "instance_path": instance_path,
+            "parameter_name": parameter_name,
+            "new_value": to_json(converted),
+            "pending_update": defer_update,
+            "pending_save": defer_update or not save_immediate
+        }
     except Exception as e:
-        return json.dumps({
+        return {
             "success": False,
-            "message": f"Error setting scalar parameter '{parameter_name}' for '{instance_path}': {str(e)}",
-            "traceback": traceback.format_exc()
-        })
-
-def ue_get_mi_vector_param(instance_path: str = None, parameter_name: str = None) -> str:
-    """Gets a vector parameter from a Material Instance. Returns JSON string."""
-    if instance_path is None:
-        return json.dumps({"success": False, "message": "Required parameter 'instance_path' is missing."})
-    if parameter_name is None:
-        return json.dumps({"success": False, "message": "Required parameter 'parameter_name' is missing."})
-    try:
-        instance = _get_material_instance_asset(instance_path)
-        ue_parameter_name = unreal.Name(parameter_name)
-        
-        param_value = unreal.MaterialEditingLibrary.get_material_instance_vector_parameter_value(instance, ue_parameter_name)
-        
-        value_list = [param_value.r, param_value.g, param_value.b, param_value.a]
-        return json.dumps({"success": True, "parameter_name": parameter_name, "value": value_list, "instance_path": instance_path})
-    except Exception as e:
-        return json.dumps({"success": False, "message": str(e), "traceback": traceback.format_exc()})
+            "message": f"Error setting {label.lower()} parameter '{parameter_name}' for '{instance_path}': {str(e)}",
+            "traceback": _tb()
+        }
 
-def ue_set_mi_vector_param(instance_path: str = None, parameter_name: str = None, value: list = None) -> str:
-    """Sets a vector parameter on a Material Instance. Expects value as [R,G,B,A]. Returns JSON string."""
-    if instance_path is None:
-        return json.dumps({"success": False, "message": "Required parameter 'instance_path' is missing."})
-    if parameter_name is None:
-        return json.dumps({"success": False, "message": "Required parameter 'parameter_name' is missing."})
-    if value is None:
-        return json.dumps({"success": False, "message": "Required parameter 'value' is missing."})
+def ue_get_mi_scalar_param(instance_path: str = None, parameter_name: str = None) -> dict:
+    """Gets a scalar (float) parameter from a Material Instance Constant. Returns a response dict."""
+    return _get_param("scalar", instance_path, parameter_name)
 
-    transaction_description = "MCP: Set Material Instance Vector Parameter"
-    try:
-        instance = _get_material_instance_asset(instance_path)
-        ue_parameter_name = unreal.Name(parameter_name)
-        if not isinstance(value, list) or len(value) != 4:
-            raise ValueError("Vector value must be a list of 4 floats [R, G, B, A].")
-        
-        with unreal.ScopedEditorTransaction(transaction_description) as trans:
-            linear_color_value = unreal.LinearColor(float(value[0]), float(value[1]), float(value[2]), float(value[3]))
-            unreal.MaterialEditingLibrary.set_material_instance_vector_parameter_value(instance, ue_parameter_name, linear_color_value)
-            unreal.MaterialEditingLibrary.update_material_instance(instance)
-            unreal.EditorAssetLibrary.save_loaded_asset(instance)
-            return json.dumps({"success": True, "message": f"Vector parameter '{parameter_name}' set.", "new_value": value})
-    except Exception as e:
-        return json.dumps({"success": False, "message": str(e), "traceback": traceback.format_exc()})
+def ue_set_mi_scalar_param(instance_path: str = None, parameter_name: str = None, value: float = None, save_immediate: bool = True, only_if_changed: bool = True, defer_update: bool = False) -> dict:
+    """
+    Sets a scalar (float) parameter on a Material Instance Constant.
+    With only_if_changed (the default), the transaction, update and save are skipped when
+    the instance already overrides the parameter with this value, so a repeated set is just
+    a read. A matching value inherited from the parent is still written, to pin it.
+    With defer_update, update_material_instance and the save are skipped so several parameter
+    edits can be finished with one ue_recompile call (ue_set_mi_params does this in one call).
+    Returns a response dict.
+    """
+    return _set_param("scalar", instance_path, parameter_name, value, save_immediate, only_if_changed, defer_update)
 
-def ue_get_mi_texture_param(instance_path: str = None, parameter_name: str = None) -> str:
-    """Gets a texture parameter from a Material Instance. Returns JSON string with texture path."""
-    if instance_path is None:
-        return json.dumps({"success": False, "message": "Required parameter 'instance_path' is missing."})
-    if parameter_name is None:
-        return json.dumps({"success": False, "message": "Required parameter 'parameter_name' is missing."})
-    try:
-        instance = _get_material_instance_asset(instance_path)
-        ue_parameter_name = unreal.Name(parameter_name)
-        
-        param_value = unreal.MaterialEditingLibrary.get_material_instance_texture_parameter_value(instance, ue_parameter_name)
-        
-        texture_path = param_value.get_path_name() if param_value else None
-        return json.dumps({"success": True, "parameter_name": parameter_name, "value": texture_path, "instance_path": instance_path})
-    except Exception as e:
-        return json.dumps({"success": False, "message": str(e), "traceback": traceback.format_exc()})
+def ue_get_mi_vector_param(instance_path: str = None, parameter_name: str = None) -> dict:
+    """Gets a vector parameter from a Material Instance as [R,G,B,A]. Returns a response dict."""
+    return _get_param("vector", instance_path, parameter_name)
 
-def _get_mi_texture_param_names(instance_path):
+def ue_set_mi_vector_param(instance_path: str = None, parameter_name: str = None, value: list = None, save_immediate: bool = True, only_if_changed: bool = True, defer_update: bool = False) -> dict:
     """
-    Gets all texture parameter names for a given material instance
+    Sets a vector parameter on a Material Instance. Expects value as [R,G,B,A].
+    With only_if_changed, nothing is written when the instance already overrides the parameter
+    with a value whose every component matches.
+    Returns a response dict.
     """
-    try:
-        instance = unreal.load_asset(instance_path)
-        texture_param_names = unreal.MaterialEditingLibrary.get_texture_parameter_names(instance)
-        return list(texture_param_names)
-    except Exception as e:
-        return []
-    
-def ue_set_mi_texture_param(instance_path: str = None, parameter_name: str = None, texture_path: Optional[str] = None) -> str:
-    """Sets a texture parameter on a Material Instance. Provide texture asset path. Returns JSON string."""
-    if instance_path is None:
-        return json.dumps({"success": False, "message": "Required parameter 'instance_path' is missing."})
-    
-    try:
-        instance = unreal.load_asset(instance_path)
-        available_params = unreal.MaterialEditingLibrary.get_texture_parameter_names(instance)
-        available_params = [str(name) for name in available_params]
-    except Exception as e:
-        available_params = []
-    
-    if parameter_name is None:
-        return json.dumps({
-            "success": False, 
-            "message": "Required parameter 'parameter_name' is missing.", 
-            "available_parameters": available_params
-        })
-    
-    if parameter_name not in available_params:
-        return json.dumps({
-            "success": False, 
-            "message": f"Texture parameter '{parameter_name}' does not exist.", 
-            "available_parameters": available_params
-        })
-    
-    try:
-        instance = _get_material_instance_asset(instance_path)
-        ue_parameter_name = unreal.Name(parameter_name)
-        
-        texture_asset = None
-        if texture_path: 
-            texture_asset = unreal.EditorAssetLibrary.load_asset(texture_path)
-            if not texture_asset:
-                return json.dumps({
-                    "success": False, 
-                    "message": f"Texture asset not found at path: {texture_path}",
-                    "available_parameters": available_params
-                })
-            if not isinstance(texture_asset, unreal.Texture):
-                return json.dumps({
-                    "success": False, 
-                    "message": f"Asset at {texture_path} is not a Texture, but {type(texture_asset).__name__}",
-                    "available_parameters": available_params
-                })
-
-        with unreal.ScopedEditorTransaction("MCP: Set Material Instance Texture Parameter") as trans:
-            unreal.MaterialEditingLibrary.set_material_instance_texture_parameter_value(instance, ue_parameter_name, texture_asset)
-            unreal.MaterialEditingLibrary.update_material_instance(instance)
-            unreal.EditorAssetLibrary.save_loaded_asset(instance)
-            return json.dumps({
-                "success": True, 
-                "message": f"Texture parameter '{parameter_name}' set.", 
-                "new_value": texture_path,
-                "available_parameters": available_params
-            })
-    except Exception as e:
-        return json.dumps({
-            "success": False, 
-            "message": str(e), 
-            "traceback": traceback.format_exc(),
-            "available_parameters": available_params
-        })
+    return _set_param("vector", instance_path, parameter_name, value, save_immediate, only_if_changed, defer_update)
 
-def _get_mi_static_switch_params(instance_path):
+def ue_get_mi_texture_param(instance_path: str = None, parameter_name: str = None) -> dict:
+    """Gets a texture parameter from a Material Instance. Returns a response dict with the texture path."""
+    return _get_param("texture", instance_path, parameter_name)
+
+def ue_set_mi_texture_param(instance_path: str = None, parameter_name: str = None, texture_path: Optional[str] = None, save_immediate: bool = True, only_if_changed: bool = True, defer_update: bool = False) -> dict:
     """
-    Gets all available static switch parameter names for a material instance
+    Sets a texture parameter on a Material Instance. Provide texture asset path, or none to clear.
+    With only_if_changed, nothing is written when the instance already overrides the parameter
+    with that texture.
+    Returns a response dict.
     """
-    try:
-        instance = _get_material_instance_asset(instance_path)
-        param_names = unreal.MaterialEditingLibrary.get_static_switch_parameter_names(instance)
-        return [str(name) for name in param_names]
-    except Exception as e:
-        print(f"Error getting static switch parameters: {e}")
-        return []
+    return _set_param("texture", instance_path, parameter_name, texture_path, save_immediate, only_if_changed, defer_update)
 
-def ue_get_mi_static_switch(instance_path: str = None, parameter_name: str = None) -> str:
-    """Gets a static switch parameter from a Material Instance. Returns JSON string."""
+def ue_get_mi_static_switch(instance_path: str = None, parameter_name: str = None) -> dict:
+    """Gets a static switch parameter from a Material Instance. Returns a response dict."""
+    return _get_param("static_switch", instance_path, parameter_name)
+
+def ue_set_mi_static_switch(instance_path: str = None, parameter_name: str = None, value: bool = None, save_immediate: bool = True, only_if_changed: bool = True, defer_update: bool = False) -> dict:
+    """
+    Sets a static switch parameter on a Material Instance.
+    The switch is always written: whether the instance overrides it can't be read from
+    Python, so only_if_changed never skips it.
+    Returns a response dict.
+    """
+    return _set_param("static_switch", instance_path, parameter_name, value, save_immediate, only_if_changed, defer_update)
+
+def ue_set_mi_params(
+    instance_path: str = None,
+    scalars: dict = None,
+    vectors: dict = None,
+    textures: dict = None,
+    switches: dict = None,
+    save_immediate: bool = True
+) -> dict:
+    """
+    Sets many parameters on one Material Instance in a single transaction, followed by
+    a single update_material_instance and a single save.
+    :param scalars: {parameter_name: float}
+    :param vectors: {parameter_name: [R, G, B, A]}
+    :param textures: {parameter_name: texture_path or None to clear}
+    :param switches: {parameter_name: bool}
+    Parameters that fail are reported in "errors"; the rest are still applied.
+    Returns a response dict.
+    """
     if instance_path is None:
-        return json.dumps({"success": False, "message": "Required parameter 'instance_path' is missing."})
-    if parameter_name is None:
-        return json.dumps({"success": False, "message": "Required parameter 'parameter_name' is missing."})
-    
-    available_params = _get_mi_static_switch_params(instance_path)
-    
-    if parameter_name not in available_params:
-        return json.dumps({
-            "success": False, 
-            "message": f"Static switch parameter '{parameter_name}' not found.", 
-            "available_parameters": available_params
-        })
-    
+        return dict(_ERR_MISSING_INSTANCE_PATH)
+
+    batches = (
+        ("scalar", scalars or {}),
+        ("vector", vectors or {}),
+        ("texture", textures or {}),
+        ("static_switch", switches or {}),
+    )
+    total = sum(len(values) for _, values in batches)
+    applied = []
+    errors = {}
     try:
         instance = _get_material_instance_asset(instance_path)
-        ue_parameter_name = unreal.Name(parameter_name)
-        
-        param_value = unreal.MaterialEditingLibrary.get_material_instance_static_switch_parameter_value(instance, ue_parameter_name)
-        
-        return json.dumps({
-            "success": True, 
-            "parameter_name": parameter_name, 
-            "value": param_value, 
+
+        with _Transaction(f"MCP: Set {total} Material Instance Parameters") as trans:
+            for kind, values in batches:
+                if not values:
+                    continue
+                label, _, setter, convert, _, _ = _PARAM_KINDS[kind]
+                known_names = _get_param_names(instance_path, kind)
+                refreshed = False
+                for name, value in values.items():
+                    try:
+                        if name not in known_names and not refreshed:
+                            # The cached names may predate an edit made in the editor; re-read once per kind.
+                            known_names = _get_param_names(instance_path, kind, refresh=True)
+                            refreshed = True
+                        if name not in known_names:
+                            raise ValueError(f"{label} parameter '{name}' not found.")
+                        setter(instance, _uname(name), convert(value))
+                        applied.append(name)
+                    except Exception as e:
+                        errors[name] = str(e)
+
+            if applied:
+                _MEL.update_material_instance(instance)
+                _save_asset(instance, save_immediate)
+
+        return {
+            "success": not errors,
+            "message": f"Set {len(applied)} parameters on '{instance_path}'" + (f"; {len(errors)} failed." if errors else "."),
             "instance_path": instance_path,
-            "available_parameters": available_params
-        })
+            "applied_parameters": applied,
+            "errors": errors,
+            "pending_save": bool(applied) and not save_immediate
+        }
     except Exception as e:
-        return json.dumps({
-            "success": False, 
-            "message": f"Error getting static switch parameter '{parameter_name}': {str(e)}", 
-            "traceback": traceback.format_exc(),
-            "available_parameters": available_params
-        })
-
-def ue_set_mi_static_switch(instance_path: str = None, parameter_name: str = None, value: bool = None) -> str:
-    """Sets a static switch parameter on a Material Instance. Returns JSON string."""
-    if instance_path is None:
-        return json.dumps({"success": False, "message": "Required parameter 'instance_path' is missing."})
-    if parameter_name is None:
-        return json.dumps({"success": False, "message": "Required parameter 'parameter_name' is missing."})
-    if value is None:
-        return json.dumps({"success": False, "message": "Required parameter 'value' is missing."})
+        return {
+            "success": False,
+            "message": f"Error setting parameters on '{instance_path}': {str(e)}",
+            "applied_parameters": applied,
+            "errors": errors,
+            "traceback": _tb()
+        }
 
-    available_params = _get_mi_static_switch_params(instance_path)
-    
-    if parameter_name not in available_params:
-        return json.dumps({
-            "success": False, 
-            "message": f"Static switch parameter '{parameter_name}' not found.", 
-            "available_parameters": available_params
-        })
-
-    transaction_description = "MCP: Set Material Instance Static Switch Parameter"
-    try:
-        instance = _get_material_instance_asset(instance_path)
-        ue_parameter_name = unreal.Name(parameter_name)
-        
-        with unreal.ScopedEditorTransaction(transaction_description) as trans:
-            unreal.MaterialEditingLibrary.set_material_instance_static_switch_parameter_value(instance, ue_parameter_name, bool(value))
-            unreal.MaterialEditingLibrary.update_material_instance(instance)
-            unreal.EditorAssetLibrary.save_loaded_asset(instance)
-            return json.dumps({
-                "success": True, 
-                "message": f"Static switch parameter '{parameter_name}' set to {value}", 
-                "new_value": value,
-                "available_parameters": available_params
-            })
-            
-    except Exception as e:
-        return json.dumps({
-            "success": False, 
-            "message": f"Error setting static switch parameter '{parameter_name}': {str(e)}", 
-            "traceback": traceback.format_exc(),
-            "available_parameters": available_params
-        })
\ No newline at end of file
+def ue_clear_asset_cache() -> dict:
+    """
+    Drops every cached Material/MaterialInstance reference so the next call reloads
+    from disk. Use after assets were renamed, deleted or replaced outside these tools.
+    Returns a response dict.
+    """
+    cleared = len(_asset_cache)
+    _asset_cache.clear()
+    _param_name_cache.clear()
+    _expr_index.clear()
+    _compiled_signatures.clear()
+    return {
+        "success": True,
+        "message": f"Cleared {cleared} cached material assets.",
+        "cleared_count": cleared
+    }
+
+def ue_flush_saves() -> dict:
+    """
+    Saves every material asset queued by calls made with save_immediate=False,
+    once per unique path. Returns a response dict.
+    """
+    saved, failed = [], []
+    for path in sorted(_pending_saves):
+        if _EAL.save_asset(path, only_if_is_dirty=False):
+            saved.append(path)
+        else:
+            failed.append(path)
+    _pending_saves.clear()
+
+    if failed:
+        return {
+            "success": False,
+            "message": f"Failed to save {len(failed)} of {len(saved) + len(failed)} queued material assets.",
+            "saved_assets": saved,
+            "failed_assets": failed
+        }
+    return {
+        "success": True,
+        "message": f"Saved {len(saved)} queued material assets.",
+        "saved_assets": saved
+    }
@@ -2,110 +2,253 @@
 
 """
 Core dispatcher for executing dynamic Python commands received from the MCP server.
-All specific action functions have been moved to their respective modules:
+All specific action functions live in their respective modules:
 - util_actions.py
 - asset_actions.py
 - actor_actions.py
+- editor_actions.py
 - material_actions.py
+- behavior_tree_actions.py
+- game_actions.py
 """
 import unreal # type: ignore # Suppress linter warning, 'unreal' module is available in UE Python environment
 import json
 import importlib
-import traceback
+import os
+import re
+import sys
+
+# Tracebacks are only included in error responses when UE_MCP_DEBUG=1.
+_DEBUG = os.environ.get("UE_MCP_DEBUG") == "1"
+
+def _tb():
+    """Traceback for an error response, or None unless UE_MCP_DEBUG=1; traceback is imported only then."""
+    if not _DEBUG:
+        return None
+    import traceback
+    return traceback.format_exc()
+
+# Compact encoder shared by every response in this module; non-ASCII is sent as UTF-8.
+_std_json_encode = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False).encode
+
+# orjson is used when installed in the editor's Python, since every dict/list an action
+# returns is serialized here. Values it rejects (e.g. integers beyond 64 bits) fall
+# back to the standard encoder instead of failing the call.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    def _json_encode(obj) -> str:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            return _std_json_encode(obj)
+else:
+    _json_encode = _std_json_encode
+
+# Dotted Python identifiers only; anything else (paths, '..', separators) is rejected.
+_is_valid_module_name = re.compile(r'\A[A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)*\Z').match
+
+# This plugin's action modules. Any other name inside the plugin package is rejected
+# without a trip through the import machinery, and these modules only expose their
+# ue_* functions. Modules outside the package are imported as before.
+_ACTION_PACKAGE_PREFIX = "UnrealMCPython."
+_ACTION_MODULES = frozenset(_ACTION_PACKAGE_PREFIX + name for name in (
+    "actor_actions",
+    "asset_actions",
+    "behavior_tree_actions",
+    "editor_actions",
+    "game_actions",
+    "material_actions",
+    "util_actions",
+))
+
+# Set UE_MCP_NO_RELOAD=1 to never reload action modules (skips the per-call stat as well).
+_NO_RELOAD = os.environ.get("UE_MCP_NO_RELOAD") == "1"
+
+# Action modules seen by execute_action: module name -> (source mtime in ns, module).
+_module_cache = globals().get("_module_cache", {})
+
+def _source_mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns if path else None
+    except OSError:
+        return None
+
+def _get_action_module(module_name: str):
+    """
+    Returns the action module, reloading it only when its source file changed on disk
+    since it was last loaded, so edits are still picked up without restarting Unreal.
+    """
+    cached = _module_cache.get(module_name)
+    if cached is not None:
+        mtime, module = cached
+        if _NO_RELOAD:
+            return module
+        current = _source_mtime(getattr(module, "__file__", None))
+        if current == mtime:
+            return module
+        module = importlib.reload(module)
+    else:
+        module = sys.modules.get(module_name)
+        if module is None:
+            module = importlib.import_module(module_name)
+        elif not _NO_RELOAD:
+            # A module imported before the first dispatch may predate the latest edits.
+            module = importlib.reload(module)
+        current = _source_mtime(getattr(module, "__file__", None))
+    _module_cache[module_name] = (current, module)
+    return module
+
+# Registry of resolved action functions: (module name, function name) ->
+# (source path, module mtime, function). A hit is one dict probe plus a stat of the
+# stored path (none with UE_MCP_NO_RELOAD=1), memoizing the whole resolve step;
+# the module and getattr are only visited again after the file changed.
+_function_cache = globals().get("_function_cache", {})
+
+def _get_action_function(module_name: str, function_name: str):
+    """
+    Returns module_name.function_name, resolving it again only after the module changed.
+    Registry hits skip the name checks below, which every entry passed when it was added;
+    rejected names raise the same ValueError/ImportError/AttributeError that
+    execute_action reports for a failed import or getattr.
+    """
+    key = (module_name, function_name)
+    cached = _function_cache.get(key)
+    if cached is not None:
+        path, loaded_mtime, function = cached
+        if _NO_RELOAD or _source_mtime(path) == loaded_mtime:
+            return function
+
+    if not _is_valid_module_name(module_name):
+        raise ValueError(f"Invalid module name: {module_name}. Contains restricted characters.")
+    if module_name in _ACTION_MODULES:
+        if not function_name.startswith("ue_"):
+            raise AttributeError(function_name)
+    elif module_name.startswith(_ACTION_PACKAGE_PREFIX):
+        raise ImportError(module_name)
+
+    module = _get_action_module(module_name)
+    loaded_mtime = _module_cache[module_name][0]
+    function = getattr(module, function_name)
+    _function_cache[key] = (getattr(module, "__file__", None), loaded_mtime, function)
+    return function
+
+# First and last characters of an encoded JSON object or array.
+_JSON_ENDS = (("{", "}"), ("[", "]"))
+
+# Skeletons of every dispatcher error response; only the message and traceback need
+# escaping, so no dict is built and encoded per error. The type is an exception class
+# name or a fixed tag. Bad return values are not exceptions, so they carry no traceback.
+_ERROR_TEMPLATE = '{{"success":false,"message":{message},"traceback":{traceback},"type":"{type}"}}'
+_RETURN_ERROR_TEMPLATE = '{{"success":false,"message":{message},"type":"{type}"}}'
+
+def _error_json(message: str, error_type: str) -> str:
+    return _ERROR_TEMPLATE.format(message=_json_encode(message), traceback=_json_encode(_tb()), type=error_type)
+
+def _return_error_json(message: str, error_type: str) -> str:
+    return _RETURN_ERROR_TEMPLATE.format(message=_json_encode(message), type=error_type)
+
+# A handler returning a non-JSON string is a developer error, so outside UE_MCP_DEBUG=1
+# the response is this constant and the details are not formatted at all.
+_ERR_INVALID_RETURN_FORMAT = _return_error_json(
+    "Action did not return a JSON object or array. Set UE_MCP_DEBUG=1 for details.",
+    "InvalidReturnFormat"
+)
 
 # Core dispatcher for executing dynamic Python commands received from the MCP server
-def execute_action(module_name: str, function_name: str, params: dict) -> str: # Changed args_list: list to params: dict
+def execute_action(module_name: str, function_name: str, params: dict) -> str:
     """
     Dynamically imports and executes the specified function from the given module.
-    It reloads the module on each call to ensure the latest version is used.
+    The module is reloaded whenever its source file has changed since it was last loaded.
 
     Args:
         module_name (str): Name of the module containing the function (e.g., "util_actions", "actor_actions").
         function_name (str): Name of the function to call (e.g., "ue_print_message").
         params (dict): Dictionary of parameters to pass to the target function.
 
+    Action functions return a plain dict/list, serialized once here, or an
+    already-encoded JSON string, which is passed through unparsed.
+
     Returns:
         str: JSON-formatted string representing the function's result or an error.
+             The TCP server print()s this value into the captured output, so it must stay
+             a str; bytes would be printed as their b'...' repr.
     """
     try:
-        # Ensure the module name is valid and does not try to escape the intended directory
-        # This is a basic check; more robust sandboxing might be needed depending on security requirements.
-        if ".." in module_name or "/" in module_name or "\\" in module_name:
-            raise ValueError(f"Invalid module name: {module_name}. Contains restricted characters.")
-
+        # The module name is checked not to escape the intended directory before it first
+        # enters the registry. This is a basic check; more robust sandboxing might be
+        # needed depending on security requirements.
         # Dynamically import the module.
         # Assuming these modules are in the Python path accessible by Unreal.
         # For plugins, this usually means Content/Python or subdirectories.
-        target_module = importlib.import_module(module_name)
-        
-        # Reload the module to pick up any changes without restarting Unreal.
-        # This is crucial for development and live updates.
-        importlib.reload(target_module)
-
-        target_function = getattr(target_module, function_name)
+        # It is reloaded only when its file changed, to pick up edits without restarting Unreal.
+        target_function = _get_action_function(module_name, function_name)
         
         # Execute the function
         # params is now expected to be a dictionary directly.
         # Unpack the dictionary as keyword arguments to the target function.
         result_json_str = target_function(**params)
-        
-        # Validate if the result is indeed a JSON string (basic check)
-        try:
-            json.loads(result_json_str) # Try to parse it to ensure it's valid JSON
-        except json.JSONDecodeError as je:
-            # If the function didn't return a valid JSON string, wrap this error.
-            error_detail = f"Function '{module_name}.{function_name}' did not return a valid JSON string. Error: {je}. Returned: {result_json_str[:200]}"
-            return json.dumps({
-                "success": False, 
-                "message": error_detail,
-                "traceback": traceback.format_exc(),
-                "type": "InvalidReturnFormat"
-            })
-        except TypeError as te:
-             # If result_json_str is not a string-like object (e.g. None)
-            error_detail = f"Function '{module_name}.{function_name}' returned a non-string type. Error: {te}. Returned type: {type(result_json_str).__name__}"
-            return json.dumps({
-                "success": False, 
-                "message": error_detail,
-                "traceback": traceback.format_exc(),
-                "type": "InvalidReturnType"
-            })
-
-
-        return result_json_str # Return the JSON string as is
+
+        # Actions may return a plain dict/list; serialize it exactly once here
+        # instead of having every action dump (and callers re-parse) its own JSON.
+        if isinstance(result_json_str, (dict, list)):
+            return _json_encode(result_json_str)
+
+        # A string is already-encoded JSON from a module that builds its own responses;
+        # it is returned as is rather than parsed again just to validate it. Only its
+        # outer brackets are checked, which catches an action returning a plain message.
+        if isinstance(result_json_str, str):
+            ends = (result_json_str[:1], result_json_str[-1:])
+            if ends not in _JSON_ENDS:
+                stripped = result_json_str.strip()
+                ends = (stripped[:1], stripped[-1:])
+            if ends in _JSON_ENDS:
+                return result_json_str
+            if not _DEBUG:
+                return _ERR_INVALID_RETURN_FORMAT
+            return _return_error_json(
+                f"Function '{module_name}.{function_name}' did not return a JSON object or array (returned a {len(result_json_str)}-character string).",
+                "InvalidReturnFormat"
+            )
+
+        return _return_error_json(
+            f"Function '{module_name}.{function_name}' returned a non-JSON type: {type(result_json_str).__name__}.",
+            "InvalidReturnType"
+        )
 
     except ImportError:
-        return json.dumps({
-            "success": False, 
-            "message": f"Could not import module '{module_name}'. Ensure it exists and is in Python path.",
-            "traceback": traceback.format_exc(),
-            "type": "ImportError"
-        })
+        return _error_json(f"Could not import module '{module_name}'. Ensure it exists and is in Python path.", "ImportError")
     except AttributeError:
-        return json.dumps({
-            "success": False, 
-            "message": f"Function '{function_name}' not found in module '{module_name}'.",
-            "traceback": traceback.format_exc(),
-            "type": "AttributeError"
-        })
+        return _error_json(f"Function '{function_name}' not found in module '{module_name}'.", "AttributeError")
     except ValueError as ve: # Catch specific ValueError from module name check
-        return json.dumps({
-            "success": False,
-            "message": str(ve),
-            "traceback": traceback.format_exc(),
-            "type": "ValueError"
-        })
+        return _error_json(str(ve), "ValueError")
     except Exception as e:
         # Catch all other exceptions during function execution
-        return json.dumps({
-            "success": False, 
-            "message": f"Exception during execution of '{module_name}.{function_name}': {str(e)}",
-            "traceback": traceback.format_exc(), # Include traceback for debugging
-            "type": type(e).__name__
-        })
-
-# All specific ue_... action functions have been moved to their respective files:
-# - util_actions.py
-# - asset_actions.py
-# - actor_actions.py
-# - material_actions.py
+        return _error_json(f"Exception during execution of '{module_name}.{function_name}': {str(e)}", type(e).__name__)
+
+def execute_action_batch(calls: list) -> str:
+    """
+    Runs several actions in one Python call, for clients that send many small commands.
+
+    Args:
+        calls (list): (module_name, function_name, params) entries, executed in order.
+            params may be omitted. A failing entry does not stop the ones after it.
+
+    Returns:
+        str: A JSON array holding each call's response in order. Every response is
+        produced exactly as execute_action would produce it, so entries are joined
+        as already-encoded JSON instead of being parsed and encoded again.
+    """
+    results = []
+    for call in calls:
+        try:
+            module_name, function_name, *rest = call
+            params = rest[0] if rest else {}
+        except (TypeError, ValueError):
+            results.append(_error_json(f"Invalid batch entry: {call!r:.200}. Expected (module_name, function_name, params).", "ValueError"))
+            continue
+        results.append(execute_action(module_name, function_name, params))
+    return "[" + ",".join(results) + "]"
@@ -1,50 +1,100 @@
 # Copyright (c) 2025 GenOrca. All Rights Reserved.
 
 import unreal
-import json
 import os
-import glob
-import traceback
 
-def ue_print_message(message: str = None) -> str:
+# Tracebacks are only included in error responses when UE_MCP_DEBUG=1.
+_DEBUG = os.environ.get("UE_MCP_DEBUG") == "1"
+
+def ue_print_message(message: str = None) -> dict:
     """
-    Logs a message to the Unreal log and returns a JSON success response.
+    Logs a message to the Unreal log and returns a success response dict.
     """
     if message is None:
-        return json.dumps({"success": False, "message": "Required parameter 'message' is missing."})
+        return {"success": False, "message": "Required parameter 'message' is missing."}
 
     unreal.log(f"MCP Message: {message}")
-    return json.dumps({
+    return {
         "received_message": message,
         "success": True,
         "source": "ue_print_message"
-    })
+    }
+
+# Block size used when scanning the log backwards in ue_get_output_log.
+_LOG_TAIL_BYTES = 64 * 1024
+
+
+def _read_log_tail(path: str, line_count: int, keyword: str = None):
+    """
+    Returns (lines, scanned_lines, reached_start) for the last line_count lines of path,
+    optionally filtered by keyword. Scans backwards in fixed-size blocks and stops as soon
+    as enough lines are collected, so memory stays O(block + line_count) however sparse
+    the matches are. scanned_lines counts the lines read from the end of the file; when
+    reached_start is True it is the file's total line count.
+    """
+    needle = keyword.lower() if keyword else None
+    matches = []
+    scanned = 0
+    stopped_early = False
 
-def ue_get_output_log(line_count: int = 50, keyword: str = None) -> str:
+    with open(path, 'rb') as f:
+        pos = f.seek(0, os.SEEK_END)
+        tail = b''
+        at_eof = True
+        while pos > 0 and len(matches) < line_count:
+            step = min(_LOG_TAIL_BYTES, pos)
+            pos -= step
+            f.seek(pos)
+            block = f.read(step) + tail
+            if at_eof:
+                if block.endswith(b'\n'):
+                    block = block[:-1]
+                at_eof = False
+            parts = block.split(b'\n')
+            # Until the start of the file is reached, the first piece may be a partial line.
+            tail = parts.pop(0) if pos > 0 else b''
+            for i, raw in enumerate(reversed(parts)):
+                scanned += 1
+                line = raw.decode('utf-8', errors='replace').rstrip('\r')
+                if needle is None or needle in line.lower():
+                    matches.append(line + '\n')
+                    if len(matches) >= line_count:
+                        stopped_early = i < len(parts) - 1
+                        break
+
+    matches.reverse()
+    return matches, scanned, pos == 0 and not stopped_early
+
+
+def ue_get_output_log(line_count: int = 50, keyword: str = None) -> dict:
     """Returns recent lines from the Unreal Engine output log file."""
+    # Only this action needs them; importing here keeps ue_print_message's cold import small.
+    import glob
+    import traceback
+
+    if line_count < 1:
+        return {"success": False, "message": f"line_count must be at least 1, got {line_count}."}
+
     try:
         log_dir = unreal.Paths.project_log_dir()
         log_files = glob.glob(os.path.join(log_dir, "*.log"))
         if not log_files:
-            return json.dumps({"success": False, "message": "No log files found"})
+            return {"success": False, "message": "No log files found"}
 
         latest_log = max(log_files, key=os.path.getmtime)
 
-        with open(latest_log, 'r', encoding='utf-8', errors='replace') as f:
-            all_lines = f.readlines()
-
-        if keyword:
-            lines = [l for l in all_lines if keyword.lower() in l.lower()]
-            lines = lines[-line_count:]
-        else:
-            lines = all_lines[-line_count:]
+        lines, scanned_lines, reached_start = _read_log_tail(latest_log, line_count, keyword)
 
-        return json.dumps({
+        response = {
             "success": True,
             "log_file": os.path.basename(latest_log),
-            "total_lines": len(all_lines),
+            "scanned_lines": scanned_lines,
             "returned_lines": len(lines),
-            "log": "".join(l.rstrip('\r') for l in lines)
-        })
+            "log": "".join(lines)
+        }
+        # The file's line count is only known when the scan read all of it.
+        if reached_start:
+            response["total_lines"] = scanned_lines
+        return response
     except Exception as e:
-        return json.dumps({"success": False, "message": str(e), "traceback": traceback.format_exc()})
+        return {"success": False, "message": str(e), "traceback": traceback.format_exc() if _DEBUG else None}
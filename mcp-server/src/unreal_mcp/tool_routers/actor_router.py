@@ -2,7 +2,7 @@
 
 # MCP Router for Actor Tools
 
-from typing import Annotated, Optional, List
+from typing import Annotated, Optional, List, Dict, Any
 from pydantic import Field
 from fastmcp import FastMCP
 
@@ -67,6 +67,20 @@ async def delete_by_label(
     params = {"actor_label": actor_label}
     return await send_unreal_action(ACTOR_ACTIONS_MODULE, params)
 
+@actor_mcp.tool(
+    name="delete_by_labels",
+    description="Deletes every actor whose label is in the given list, in a single undo transaction.",
+    tags={"unreal", "actor", "delete", "batch", "level-editing"}
+)
+async def delete_by_labels(
+    actor_labels: Annotated[List[str], Field(description="Labels of the actors to delete (as seen in the World Outliner).")]
+) -> dict:
+    """Deletes many actors by label in one call."""
+    if not actor_labels:
+        raise ToolInputError("actor_labels must contain at least one label.")
+    params = {"actor_labels": actor_labels}
+    return await send_unreal_action(ACTOR_ACTIONS_MODULE, params)
+
 @actor_mcp.tool(
     name="list_all_with_locations",
     description="Lists all actors in the current Unreal Engine level along with their world locations.",
@@ -90,6 +104,20 @@ async def spawn_from_class(
     params = {"class_path": class_path, "location": location, "rotation": rotation}
     return await send_unreal_action(ACTOR_ACTIONS_MODULE, params)
 
+@actor_mcp.tool(
+    name="spawn_many_from_class",
+    description="Spawns many actors from class paths in a single undo transaction. Each distinct class is loaded once.",
+    tags={"unreal", "actor", "spawn", "class", "batch", "level-editing"}
+)
+async def spawn_many_from_class(
+    items: Annotated[List[Dict[str, Any]], Field(description="List of {'class_path': str, 'location': [X, Y, Z], 'rotation': optional [Pitch, Yaw, Roll]}.")]
+) -> dict:
+    """Spawns many actors from class paths in one call."""
+    if not items:
+        raise ToolInputError("items must contain at least one entry.")
+    params = {"items": items}
+    return await send_unreal_action(ACTOR_ACTIONS_MODULE, params)
+
 @actor_mcp.tool(
     name="get_all_details",
     description="Retrieves detailed information for all actors in the current Unreal Engine level, including label, class, transform, and bounds.",
@@ -117,6 +145,20 @@ async def set_transform(
     params = {"actor_label": actor_label, "location": location, "rotation": rotation, "scale": scale}
     return await send_unreal_action(ACTOR_ACTIONS_MODULE, params)
 
+@actor_mcp.tool(
+    name="set_transforms",
+    description="Sets the transforms of many actors in a single undo transaction. Each item may set any of location, rotation and scale.",
+    tags={"unreal", "actor", "transform", "batch", "level-editing"}
+)
+async def set_transforms(
+    items: Annotated[List[Dict[str, Any]], Field(description="List of {'actor_label': str, 'location': optional [X, Y, Z], 'rotation': optional [Pitch, Yaw, Roll], 'scale': optional [X, Y, Z]}.")]
+) -> dict:
+    """Sets the transforms of many actors in one call."""
+    if not items:
+        raise ToolInputError("items must contain at least one entry.")
+    params = {"items": items}
+    return await send_unreal_action(ACTOR_ACTIONS_MODULE, params)
+
 @actor_mcp.tool(
     name="set_location",
     description="Sets the location of a specified actor in the Unreal Engine scene.",
@@ -192,6 +234,7 @@ async def spawn_on_surface_raycast(
     location_offset: Annotated[List[float], Field(description="Optional list of 3 floats for location offset [X, Y, Z] from the hit point. Defaults to [0,0,0].")] = None,
     trace_channel: Annotated[str, Field(description="Trace channel for raycast (e.g., 'Visibility', 'Camera'). Defaults to 'Visibility'.")] = 'Visibility',
     actors_to_ignore_labels: Annotated[Optional[List[str]], Field(description="Optional list of actor labels to ignore during the raycast.")] = None,
+    draw_debug: Annotated[bool, Field(description="Draw the trace as a debug line in the viewport. Defaults to False.")] = False,
 ) -> dict:
     """Spawns an actor on a surface via raycast."""
     actual_desired_rotation = desired_rotation if desired_rotation is not None else [0.0, 0.0, 0.0]
@@ -205,7 +248,8 @@ async def spawn_on_surface_raycast(
         "desired_rotation": actual_desired_rotation,
         "location_offset": actual_location_offset,
         "trace_channel": trace_channel,
-        "actors_to_ignore_labels": actors_to_ignore_labels
+        "actors_to_ignore_labels": actors_to_ignore_labels,
+        "draw_debug": draw_debug
     }
     return await send_unreal_action(ACTOR_ACTIONS_MODULE, params)
 
@@ -233,7 +277,7 @@ async def get_property(
 
 @actor_mcp.tool(
     name="set_property",
-    description="Sets an Unreal Engine property value on an actor by its label. Uses set_editor_property() internally with Undo support. Automatically converts JSON types to UE types: str for FName/FString/FText, int/float for numeric, bool for boolean, list of 3 floats for FVector/FRotator, list of 4 floats for FLinearColor.",
+    description="Sets an Unreal Engine property value on an actor by its label. Uses set_editor_property() internally with Undo support. Automatically converts JSON types to UE types: str for FName/FString/FText, int/float for numeric, bool for boolean, list of 3 floats for FVector [x,y,z] or FRotator [pitch,yaw,roll], list of 4 floats for FLinearColor.",
     tags={"unreal", "actor", "property", "level-editing"}
 )
 async def set_property(
@@ -42,7 +42,8 @@ async def set_game_mode(
     description=(
         "Creates a new Enhanced Input Action asset. "
         "The value_type determines what kind of input data the action produces: "
-        "'Bool' (button press), 'Axis1D' (single float), 'Axis2D' (2D vector, e.g. mouse), 'Axis3D' (3D vector)."
+        "'Bool' (button press), 'Axis1D' (single float), 'Axis2D' (2D vector, e.g. mouse), 'Axis3D' (3D vector). "
+        "The asset is queued for saving; call flush_saves once after a batch of input edits."
     ),
     tags={"unreal", "game", "input", "action", "enhanced-input", "create", "asset"}
 )
@@ -68,7 +69,8 @@ async def add_input_action(
         "Creates an InputMappingContext asset and/or adds a key-to-action mapping to it. "
         "If the IMC asset does not exist, it will be created. "
         "Then maps a physical key to an InputAction within that context. "
-        "The key_name should be a UE key name (e.g., 'SpaceBar', 'W', 'Gamepad_FaceButton_Bottom', 'LeftMouseButton')."
+        "The key_name should be a UE key name (e.g., 'SpaceBar', 'W', 'Gamepad_FaceButton_Bottom', 'LeftMouseButton'). "
+        "The asset is queued for saving; call flush_saves once after a batch of input edits."
     ),
     tags={"unreal", "game", "input", "mapping", "enhanced-input", "create", "asset"}
 )
@@ -92,3 +94,16 @@ async def add_input_mapping(
         "key_name": key_name
     }
     return await send_unreal_action(GAME_ACTIONS_MODULE, params)
+
+
+@game_mcp.tool(
+    name="flush_saves",
+    description=(
+        "Saves all InputAction and InputMappingContext assets queued by add_input_action "
+        "and add_input_mapping. Call once at the end of a batch of input edits."
+    ),
+    tags={"unreal", "game", "input", "save", "asset"}
+)
+async def flush_saves() -> dict:
+    """Saves all queued input assets."""
+    return await send_unreal_action(GAME_ACTIONS_MODULE, {})
@@ -17,26 +17,28 @@ material_mcp = FastMCP(name="MaterialMCP", description="Tools for managing and e
 
 @material_mcp.tool(
     name="create_expression",
-    description="Creates a new expression node within a specified material asset.",
+    description="Creates a new expression node within a specified material asset. To add several nodes and connections, use create_graph, which recompiles and saves once.",
     tags={"unreal", "material", "shader", "graph", "editor"}
 )
 async def create_expression(
     material_path: Annotated[str, Field(description="Path to the parent material asset (e.g., /Game/Materials/MyBaseMaterial.MyBaseMaterial)")],
     expression_class_name: Annotated[str, Field(description="Class name of the expression to create (e.g., MaterialExpressionTextureSample, MaterialExpressionScalarParameter)")],
     node_pos_x: Annotated[int, Field(description="X position for the new node in the material editor graph.")] = 0,
-    node_pos_y: Annotated[int, Field(description="Y position for the new node in the material editor graph.")] = 0
+    node_pos_y: Annotated[int, Field(description="Y position for the new node in the material editor graph.")] = 0,
+    defer_compile: Annotated[bool, Field(description="If true, skip recompiling and saving the material. Call recompile once after the last edit.")] = False
 ) -> dict:
     params = {
         "material_path": material_path,
         "expression_class_name": expression_class_name,
         "node_pos_x": node_pos_x,
-        "node_pos_y": node_pos_y
+        "node_pos_y": node_pos_y,
+        "defer_compile": defer_compile
     }
     return await send_unreal_action(MATERIAL_ACTIONS_MODULE, params)
 
 @material_mcp.tool(
     name="connect_expressions",
-    description="Connects two expression nodes within a material asset.",
+    description="Connects two expression nodes within a material asset. To make several connections, use create_graph, which recompiles and saves once.",
     tags={"unreal", "material", "shader", "graph", "editor"}
 )
 async def connect_expressions(
@@ -46,7 +48,8 @@ async def connect_expressions(
     to_expression_identifier: Annotated[str, Field(description="Name (desc) or class of the destination expression node.")],
     to_input_name: Annotated[str, Field(description="Name of the input pin on the destination expression (e.g., \"BaseColor\", \"UVs\", or empty for default).")],
     from_expression_class_name: Annotated[Optional[str], Field(description="Optional: Specific class name of the source expression if identifier is ambiguous.")] = None,
-    to_expression_class_name: Annotated[Optional[str], Field(description="Optional: Specific class name of the destination expression if identifier is ambiguous.")] = None
+    to_expression_class_name: Annotated[Optional[str], Field(description="Optional: Specific class name of the destination expression if identifier is ambiguous.")] = None,
+    defer_compile: Annotated[bool, Field(description="If true, skip recompiling and saving the material. Call recompile once after the last edit.")] = False
 ) -> dict:
     params = {
         "material_path": material_path,
@@ -55,19 +58,47 @@ async def connect_expressions(
         "to_expression_identifier": to_expression_identifier,
         "to_input_name": to_input_name,
         "from_expression_class_name": from_expression_class_name,
-        "to_expression_class_name": to_expression_class_name
+        "to_expression_class_name": to_expression_class_name,
+        "defer_compile": defer_compile
+    }
+    return await send_unreal_action(MATERIAL_ACTIONS_MODULE, params)
+
+@material_mcp.tool(
+    name="create_graph",
+    description="Creates multiple expression nodes and connections in a material in one transaction, recompiling and saving only once at the end. Prefer this over repeated create_expression/connect_expressions calls.",
+    tags={"unreal", "material", "shader", "graph", "editor", "batch"}
+)
+async def create_graph(
+    material_path: Annotated[str, Field(description="Path to the material asset.")],
+    nodes: Annotated[List[Dict[str, Any]], Field(description="Nodes to create: [{\"expression_class_name\": \"MaterialExpressionConstant3Vector\", \"node_pos_x\": -300, \"node_pos_y\": 0, \"desc\": \"Tint\"}]. Give each node a unique desc so connections can refer to it.")],
+    connections: Annotated[Optional[List[Dict[str, Any]]], Field(description="Connections to make after the nodes exist, using the same keys as connect_expressions (from_expression_identifier, from_output_name, to_expression_identifier, to_input_name, and optional class names).")] = None,
+    save_immediate: Annotated[bool, Field(description="If false, the asset is not saved now; call flush_saves after the last edit to save each edited asset once.")] = True
+) -> dict:
+    params = {
+        "material_path": material_path,
+        "nodes": nodes,
+        "connections": connections or [],
+        "save_immediate": save_immediate
     }
     return await send_unreal_action(MATERIAL_ACTIONS_MODULE, params)
 
 @material_mcp.tool(
     name="recompile",
-    description="Recompiles a material or material instance asset.",
+    description=(
+        "Recompiles a material, or the parent material of a material instance. For a material instance, "
+        "recompile_parent=false only updates the instance (enough after instance parameter edits). "
+        "A material that these tools already recompiled, and that has not changed since, is not recompiled again; "
+        "the response then has no_recompile_needed=true. Change detection only sees the node list, unsaved "
+        "changes and file saves, so pass force=true after ANY manual edit to the material."
+    ),
     tags={"unreal", "material", "shader", "compile"}
 )
 async def recompile(
-    material_path: Annotated[str, Field(description="Path to the material or material instance asset to recompile (e.g., /Game/Materials/MyMaterial.MyMaterial).")]
+    material_path: Annotated[str, Field(description="Path to the material or material instance asset to recompile (e.g., /Game/Materials/MyMaterial.MyMaterial).")],
+    recompile_parent: Annotated[bool, Field(description="For a material instance, recompile its parent material (the default). Set to false to only update the instance, e.g. to finish parameter edits made with defer_update.")] = True,
+    force: Annotated[bool, Field(description="Always recompile. Required after any manual edit to the material (in the material editor or by other tools), since such edits may not be detected.")] = False
 ) -> dict:
-    params = {"material_path": material_path}
+    params = {"material_path": material_path, "recompile_parent": recompile_parent, "force": force}
     return await send_unreal_action(MATERIAL_ACTIONS_MODULE, params)
 
 @material_mcp.tool(
@@ -93,12 +124,18 @@ async def get_mi_scalar_param(
 async def set_mi_scalar_param(
     instance_path: Annotated[str, Field(description="Path to the Material Instance Constant asset.")],
     parameter_name: Annotated[str, Field(description="Name of the parameter.")],
-    value: Annotated[float, Field(description="The float value to set for the scalar parameter.")]
+    value: Annotated[float, Field(description="The float value to set for the scalar parameter.")],
+    save_immediate: Annotated[bool, Field(description="If false, the asset is not saved now; call flush_saves after the last edit to save each edited asset once.")] = True,
+    only_if_changed: Annotated[bool, Field(description="If true (the default), skip the transaction, update and save when this instance already overrides the parameter with the same value. A matching value inherited from the parent is still written, so the override is created. Set false to always write.")] = True,
+    defer_update: Annotated[bool, Field(description="If true, skip update_material_instance and the save. Call recompile on the instance (recompile_parent=false) once after the last edit, or use set_mi_params.")] = False
 ) -> dict:
     params = {
         "instance_path": instance_path,
         "parameter_name": parameter_name,
-        "value": value
+        "only_if_changed": only_if_changed,
+        "defer_update": defer_update,
+        "value": value,
+        "save_immediate": save_immediate
     }
     return await send_unreal_action(MATERIAL_ACTIONS_MODULE, params)
 
@@ -125,12 +162,18 @@ async def get_mi_vector_param(
 async def set_mi_vector_param(
     instance_path: Annotated[str, Field(description="Path to the Material Instance Constant asset.")],
     parameter_name: Annotated[str, Field(description="Name of the parameter.")],
-    value: Annotated[List[float], Field(description="The vector value [R, G, B, A] to set.", min_length=4, max_length=4)]
+    value: Annotated[List[float], Field(description="The vector value [R, G, B, A] to set.", min_length=4, max_length=4)],
+    save_immediate: Annotated[bool, Field(description="If false, the asset is not saved now; call flush_saves after the last edit to save each edited asset once.")] = True,
+    only_if_changed: Annotated[bool, Field(description="If true (the default), skip the transaction, update and save when this instance already overrides the parameter with the same value. A matching value inherited from the parent is still written, so the override is created. Set false to always write.")] = True,
+    defer_update: Annotated[bool, Field(description="If true, skip update_material_instance and the save. Call recompile on the instance (recompile_parent=false) once after the last edit, or use set_mi_params.")] = False
 ) -> dict:
     params = {
         "instance_path": instance_path,
         "parameter_name": parameter_name,
-        "value": value
+        "only_if_changed": only_if_changed,
+        "defer_update": defer_update,
+        "value": value,
+        "save_immediate": save_immediate
     }
     return await send_unreal_action(MATERIAL_ACTIONS_MODULE, params)
 
@@ -157,12 +200,18 @@ async def get_mi_texture_param(
 async def set_mi_texture_param(
     instance_path: Annotated[str, Field(description="Path to the Material Instance Constant asset.")],
     parameter_name: Annotated[str, Field(description="Name of the parameter.")],
-    texture_path: Annotated[Optional[str], Field(description="Path to the texture asset to set. Set to null or empty string to clear.")] = None
+    texture_path: Annotated[Optional[str], Field(description="Path to the texture asset to set. Set to null or empty string to clear.")] = None,
+    save_immediate: Annotated[bool, Field(description="If false, the asset is not saved now; call flush_saves after the last edit to save each edited asset once.")] = True,
+    only_if_changed: Annotated[bool, Field(description="If true (the default), skip the transaction, update and save when this instance already overrides the parameter with the same value. A matching value inherited from the parent is still written, so the override is created. Set false to always write.")] = True,
+    defer_update: Annotated[bool, Field(description="If true, skip update_material_instance and the save. Call recompile on the instance (recompile_parent=false) once after the last edit, or use set_mi_params.")] = False
 ) -> dict:
     params = {
         "instance_path": instance_path,
         "parameter_name": parameter_name,
-        "texture_path": texture_path
+        "only_if_changed": only_if_changed,
+        "defer_update": defer_update,
+        "texture_path": texture_path,
+        "save_immediate": save_immediate
     }
     return await send_unreal_action(MATERIAL_ACTIONS_MODULE, params)
 
@@ -189,11 +238,56 @@ async def get_mi_static_switch(
 async def set_mi_static_switch(
     instance_path: Annotated[str, Field(description="Path to the Material Instance Constant asset.")],
     parameter_name: Annotated[str, Field(description="Name of the parameter.")],
-    value: Annotated[bool, Field(description="The boolean value to set for the static switch parameter.")]
+    value: Annotated[bool, Field(description="The boolean value to set for the static switch parameter.")],
+    save_immediate: Annotated[bool, Field(description="If false, the asset is not saved now; call flush_saves after the last edit to save each edited asset once.")] = True,
+    only_if_changed: Annotated[bool, Field(description="Accepted for consistency; static switches are always written, since whether the instance overrides one cannot be checked.")] = True,
+    defer_update: Annotated[bool, Field(description="If true, skip update_material_instance and the save. Call recompile on the instance (recompile_parent=false) once after the last edit, or use set_mi_params.")] = False
 ) -> dict:
     params = {
         "instance_path": instance_path,
         "parameter_name": parameter_name,
-        "value": value
+        "only_if_changed": only_if_changed,
+        "defer_update": defer_update,
+        "value": value,
+        "save_immediate": save_immediate
+    }
+    return await send_unreal_action(MATERIAL_ACTIONS_MODULE, params)
+
+@material_mcp.tool(
+    name="set_mi_params",
+    description="Sets many parameters on one material instance in a single transaction, with one update and one save. Prefer this over repeated set_mi_*_param calls.",
+    tags={"unreal", "material", "instance", "parameter", "modify", "batch"}
+)
+async def set_mi_params(
+    instance_path: Annotated[str, Field(description="Path to the Material Instance Constant asset.")],
+    scalars: Annotated[Optional[Dict[str, float]], Field(description="Scalar parameters: {\"Roughness\": 0.4}.")] = None,
+    vectors: Annotated[Optional[Dict[str, List[float]]], Field(description="Vector parameters: {\"BaseColor\": [1, 0, 0, 1]}.")] = None,
+    textures: Annotated[Optional[Dict[str, Optional[str]]], Field(description="Texture parameters: {\"Albedo\": \"/Game/Textures/T_Albedo\"}. Use null to clear.")] = None,
+    switches: Annotated[Optional[Dict[str, bool]], Field(description="Static switch parameters: {\"UseDetail\": true}.")] = None,
+    save_immediate: Annotated[bool, Field(description="If false, the asset is not saved now; call flush_saves after the last edit to save each edited asset once.")] = True
+) -> dict:
+    params = {
+        "instance_path": instance_path,
+        "scalars": scalars or {},
+        "vectors": vectors or {},
+        "textures": textures or {},
+        "switches": switches or {},
+        "save_immediate": save_immediate
     }
     return await send_unreal_action(MATERIAL_ACTIONS_MODULE, params)
+
+@material_mcp.tool(
+    name="clear_asset_cache",
+    description="Clears the cache of loaded material and material instance assets so the next call reloads them. Use after assets were renamed, deleted or replaced outside these tools.",
+    tags={"unreal", "material", "instance", "cache"}
+)
+async def clear_asset_cache() -> dict:
+    return await send_unreal_action(MATERIAL_ACTIONS_MODULE, {})
+
+@material_mcp.tool(
+    name="flush_saves",
+    description="Saves every material and material instance edited with save_immediate=false, writing each asset once.",
+    tags={"unreal", "material", "instance", "save"}
+)
+async def flush_saves() -> dict:
+    return await send_unreal_action(MATERIAL_ACTIONS_MODULE, {})
@@ -13,7 +13,11 @@ UTIL_ACTIONS_MODULE = "UnrealMCPython.util_actions"
 
 @util_mcp.tool(
     name="get_output_log",
-    description="Retrieves recent lines from the Unreal Engine output log. Supports filtering by keyword to find specific errors or warnings.",
+    description=(
+        "Retrieves recent lines from the Unreal Engine output log. Supports filtering by keyword to find specific errors or warnings. "
+        "The log is read backwards from its end; 'scanned_lines' in the result is how many lines were read before enough were found "
+        "and 'returned_lines' how many are in 'log'. 'total_lines' (the file's line count) is included only when the search read the whole file."
+    ),
     tags={"unreal", "log", "debug", "diagnostics"}
 )
 async def get_output_log(